@@ -13,6 +13,10 @@
 #   2. Copies that data file to each missing date's /tmp slot
 #   3. Runs orchestrate-daily-update.js for each date oldest-first
 #      (deduplication naturally spreads content across dates)
+#
+# The live collectors only see the current page of each feed. To recover items
+# that have already scrolled off, crawl feed history first:
+#   python3 -m tooling backfill companies --since YYYY-MM-DD --format markdown
 
 set -e
 
@@ -10,7 +10,7 @@
 
 const path = require('path');
 const fs = require('fs');
-const { validatePositiveInteger, validateOneOf, validateFilePath } = require('../src/utils/validation');
+const { validatePositiveInteger, validateOneOf, validateFilePath, validateDateString } = require('../src/utils/validation');
 
 // Add tooling/node_modules to module path so Puppeteer can be found
 // This allows the modular scripts to use Puppeteer installed in tooling/
@@ -38,16 +38,20 @@ async function main() {
   const companiesFile = args.includes('--companies-file')
     ? args[args.indexOf('--companies-file') + 1]
     : path.join(__dirname, '..', 'context', 'companies.md');
+  const until = args.includes('--until')
+    ? args[args.indexOf('--until') + 1]
+    : null;
   
   // Validate inputs
   try {
     validatePositiveInteger(daysBack, 'daysBack', 1);
     validateOneOf(format, ['json', 'markdown'], 'format');
     validateFilePath(companiesFile, '.md', false); // File may not exist yet
+    validateDateString(until, 'until');
   } catch (error) {
     console.error(`\n✗ Invalid argument: ${error.message}`);
     console.error('\nUsage:');
-    console.error('  node check-company-updates.js [--days N] [--format json|markdown] [--companies-file PATH]');
+    console.error('  node check-company-updates.js [--days N] [--format json|markdown] [--companies-file PATH] [--until YYYY-MM-DD]');
     process.exit(1);
   }
   
@@ -56,6 +60,7 @@ async function main() {
       daysBack,
       format,
       companiesFile,
+      until,
     });
     
     console.log(result.output);
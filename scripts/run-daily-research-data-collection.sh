@@ -20,8 +20,30 @@ fi
 export CHROME_CRASHPAD_HANDLER_PATH=""
 export GOOGLE_CHROME_CRASHPAD_HANDLER_PATH=""
 
-# Get today's date
-TODAY=$(date +%Y-%m-%d)
+# Get today's date (TARGET_DATE backfills an earlier day; see `python3 -m tooling dispatch`)
+TODAY=${TARGET_DATE:-$(date +%Y-%m-%d)}
+
+# Look back far enough to reach the target date. Company updates are cut off
+# at the target date with --until; people search is a free-text web search, so
+# its window stays open up to today and relies on the orchestrator's URL dedup.
+PEOPLE_DAYS=3
+COMPANY_DAYS=2
+UNTIL_ARGS=""
+if [ -n "$TARGET_DATE" ]; then
+    if ! [[ "$TARGET_DATE" =~ ^[0-9]{4}-[0-9]{2}-[0-9]{2}$ ]] || \
+       [ "$(date -d "$TARGET_DATE" +%Y-%m-%d 2>/dev/null)" != "$TARGET_DATE" ]; then
+        echo "ERROR: TARGET_DATE must be a real YYYY-MM-DD date, got '$TARGET_DATE'"
+        exit 1
+    fi
+    if [[ "$TARGET_DATE" > "$(date +%Y-%m-%d)" ]]; then
+        echo "ERROR: TARGET_DATE $TARGET_DATE is in the future"
+        exit 1
+    fi
+    AGE_DAYS=$(( ($(date +%s) - $(date -d "$TARGET_DATE" +%s)) / 86400 ))
+    PEOPLE_DAYS=$(( AGE_DAYS + 3 ))
+    COMPANY_DAYS=$(( AGE_DAYS + 2 ))
+    UNTIL_ARGS="--until ${TARGET_DATE}"
+fi
 OUTPUT_FILE="/tmp/daily-research-${TODAY}.txt"
 
 echo "=========================================="
@@ -47,7 +69,7 @@ EOF
 echo "Collecting people activity via web search..."
 echo "" >> "$OUTPUT_FILE"
 
-node scripts/check-people-search.js --days 3 >> "$OUTPUT_FILE" 2>&1 || {
+node scripts/check-people-search.js --days ${PEOPLE_DAYS} >> "$OUTPUT_FILE" 2>&1 || {
     echo "ERROR: Failed to collect people activity data" >> "$OUTPUT_FILE"
     echo "Continuing with other data sources..."
 }
@@ -58,11 +80,11 @@ echo "" >> "$OUTPUT_FILE"
 # Section 2: Company Updates
 echo "Collecting company updates..."
 echo "" >> "$OUTPUT_FILE"
-echo "## Company Updates (Last 2 Days)" >> "$OUTPUT_FILE"
+echo "## Company Updates (Last ${COMPANY_DAYS} Days)" >> "$OUTPUT_FILE"
 echo "==========================================" >> "$OUTPUT_FILE"
 echo "" >> "$OUTPUT_FILE"
 
-node scripts/check-company-updates.js --days 2 --format markdown >> "$OUTPUT_FILE" 2>&1 || {
+node scripts/check-company-updates.js --days ${COMPANY_DAYS} ${UNTIL_ARGS} --format markdown >> "$OUTPUT_FILE" 2>&1 || {
     echo "ERROR: Failed to collect company updates" >> "$OUTPUT_FILE"
     echo "Continuing..."
 }
@@ -72,8 +94,8 @@ echo "" >> "$OUTPUT_FILE"
 
 # Section 3: Research Prompt Reference
 echo "Adding research prompt reference..."
-CURRENT_YEAR=$(date +%Y)
-CURRENT_DATE=$(date +%Y-%m-%d)
+CURRENT_YEAR=${TODAY:0:4}
+CURRENT_DATE=${TODAY}
 CURRENT_DATETIME=$(date)
 
 cat >> "$OUTPUT_FILE" << EOF
@@ -132,7 +154,7 @@ if [ -z "$ANTHROPIC_API_KEY" ]; then
     echo ""
 else
     # Run orchestrator (synthesizer + QA + patch agents)
-    node "${SCRIPT_DIR}/orchestrate-daily-update.js"
+    node "${SCRIPT_DIR}/orchestrate-daily-update.js" --date "$TODAY"
     SYNTHESIS_EXIT_CODE=$?
 fi
 
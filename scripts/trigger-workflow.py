@@ -2,6 +2,13 @@
 """
 Trigger GitHub Actions workflow via API
 Simpler alternative to the bash script
+
+Usage:
+    python3 scripts/trigger-workflow.py              # today's update
+    python3 scripts/trigger-workflow.py 2026-03-04   # regenerate one date
+
+To backfill every missing date with a concurrency cap and resumable state:
+    python3 -m tooling dispatch --since 2026-01-01
 """
 
 import os
@@ -41,6 +48,9 @@ def trigger_workflow():
 
     # Payload
     data = {"ref": "main"}
+    target_date = sys.argv[1] if len(sys.argv) > 1 else None
+    if target_date:
+        data["inputs"] = {"date": target_date}
 
     print("=" * 50)
     print("Triggering GitHub Actions Workflow")
@@ -49,6 +59,8 @@ def trigger_workflow():
     print("Workflow: Daily Research Update")
     print("Repository: madsford22-coder/ai-pm-research")
     print("Branch: main")
+    if target_date:
+        print(f"Date: {target_date}")
     print()
 
     # Make request
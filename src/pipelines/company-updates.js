@@ -13,7 +13,7 @@ const { fetchRSSFeed, findRSSFeedFromBlog } = require('../adapters/rss');
 const { scrapeChangelog } = require('../adapters/scraper');
 const { filterUpdatesByDate, dedupeUpdates } = require('../transforms/filter');
 const { sortUpdatesByDate } = require('../transforms/sort');
-const { validatePositiveInteger, validateOneOf, validateFilePath } = require('../utils/validation');
+const { validatePositiveInteger, validateOneOf, validateFilePath, validateDateString } = require('../utils/validation');
 
 const DEFAULT_DAYS_BACK = 14;
 
@@ -121,6 +121,7 @@ async function checkCompanyUpdates(browser, company, options = {}) {
  * @param {number} options.daysBack - Number of days to look back
  * @param {string} options.companiesFile - Path to companies.md file
  * @param {string} options.format - Output format ('json' | 'markdown')
+ * @param {string} [options.until] - Drop updates published after this day (YYYY-MM-DD)
  * @returns {Promise<{updates: import('../domain/types').UpdateItem[], output: string}>}
  */
 async function checkCompanyUpdatesPipeline(options = {}) {
@@ -128,12 +129,14 @@ async function checkCompanyUpdatesPipeline(options = {}) {
     daysBack = DEFAULT_DAYS_BACK,
     companiesFile = path.join(__dirname, '../../context/companies.md'),
     format = 'markdown',
+    until = null,
   } = options;
   
   // Validate inputs
   validatePositiveInteger(daysBack, 'daysBack', 1);
   validateFilePath(companiesFile, '.md', false); // File may not exist yet
   validateOneOf(format, ['json', 'markdown'], 'format');
+  validateDateString(until, 'until');
   
   console.log(`Checking company updates from last ${daysBack} days...\n`);
   
@@ -239,7 +242,7 @@ async function checkCompanyUpdatesPipeline(options = {}) {
   }
   
   // Transform data
-  let processedUpdates = filterUpdatesByDate(allUpdates, { daysBack });
+  let processedUpdates = filterUpdatesByDate(allUpdates, { daysBack, until });
   processedUpdates = dedupeUpdates(processedUpdates);
   processedUpdates = sortUpdatesByDate(processedUpdates);
   
@@ -82,6 +82,30 @@ describe('filter transforms', () => {
       expect(filtered).toHaveLength(1);
       expect(filtered[0].title).toBe('Recent update');
     });
+
+    it('should drop updates published after the until date', () => {
+      const updates = [
+        {
+          title: 'On the day',
+          link: 'https://example.com/1',
+          published: '2026-01-31T23:00:00Z',
+          source: 'blog',
+          sourceUrl: 'https://example.com/blog',
+        },
+        {
+          title: 'Next day',
+          link: 'https://example.com/2',
+          published: '2026-02-01T01:00:00Z',
+          source: 'blog',
+          sourceUrl: 'https://example.com/blog',
+        },
+      ];
+
+      const filtered = filterUpdatesByDate(updates, { daysBack: 3650, until: '2026-01-31' });
+
+      expect(filtered).toHaveLength(1);
+      expect(filtered[0].title).toBe('On the day');
+    });
   });
 
   describe('dedupePosts', () => {
@@ -28,17 +28,25 @@ function filterByDate(posts, options = {}) {
  * @param {import('../domain/types').UpdateItem[]} updates - Array of updates
  * @param {Object} options - Options object
  * @param {number} options.daysBack - Number of days to look back
+ * @param {string} [options.until] - Last day to keep (YYYY-MM-DD); later updates are dropped
  * @returns {import('../domain/types').UpdateItem[]}
  */
 function filterUpdatesByDate(updates, options = {}) {
-  const { daysBack = 14 } = options;
+  const { daysBack = 14, until = null } = options;
   
   const cutoffDate = new Date();
   cutoffDate.setDate(cutoffDate.getDate() - daysBack);
   
+  let endDate = null;
+  if (until) {
+    endDate = new Date(until);
+    endDate.setUTCDate(endDate.getUTCDate() + 1);
+  }
+  
   return updates.filter(update => {
     if (!update.published) return true; // Include updates without dates
-    return new Date(update.published) >= cutoffDate;
+    const published = new Date(update.published);
+    return published >= cutoffDate && (!endDate || published < endDate);
   });
 }
 
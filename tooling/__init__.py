@@ -0,0 +1,21 @@
+"""
+Python tooling for the AI PM Research Assistant.
+
+Run as ``python3 -m tooling <command>`` from the project root. See
+``tooling/cli.py`` for the available subcommands.
+
+Heavy third-party dependencies (feedparser, requests, BeautifulSoup) are
+imported lazily inside the functions that need them, so importing this
+package or running parse-only commands stays fast.
+"""
+
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CONTEXT_DIR = PROJECT_ROOT / 'context'
+CACHE_DIR = PROJECT_ROOT / '.cache' / 'tooling'
+ITEM_STORE_PATH = CACHE_DIR / 'items.sqlite3'
+LINK_STORE_PATH = CACHE_DIR / 'links.sqlite3'
+ARTICLE_STORE_PATH = CACHE_DIR / 'articles.sqlite3'
+DISPATCH_STATE_PATH = CACHE_DIR / 'dispatch-state.json'
+SCRAPE_CACHE_PATH = CACHE_DIR / 'scrape.sqlite3'
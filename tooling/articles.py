@@ -0,0 +1,271 @@
+"""
+Full-article fetch and readable-text extraction for collected items.
+
+An optional stage after date filtering (``--articles``):
+
+1. Every new item's link is looked up in a persistent cache keyed by
+   canonical URL; cached articles are never downloaded again
+2. Missing articles are fetched concurrently (bounded workers, per-host cap)
+3. The main text is extracted readability-style: boilerplate elements are
+   dropped and the element whose paragraphs score highest is kept, along with
+   title, byline, date, site name and description from the page's metadata
+4. Results are stored with the response's ETag/Last-Modified, so ``--refresh-articles``
+   revalidates with a conditional request instead of re-downloading
+"""
+
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from tooling import ARTICLE_STORE_PATH
+from tooling.deps import require
+from tooling.feeds import request_timeout
+from tooling.limits import HostLimiter
+from tooling.resources import open_sqlite, thread_session
+from tooling.stages import stage
+from tooling.urls import canonicalize_url
+
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST = 2
+DEFAULT_TIMEOUT = 15
+# Failed fetches are retried on the next run after a day
+RETRY_ERRORS_AFTER = 24 * 3600
+EXCERPT_CHARS = 1500
+
+BOILERPLATE_TAGS = ['script', 'style', 'noscript', 'svg', 'form', 'nav', 'header', 'footer',
+                    'aside', 'iframe', 'button']
+BOILERPLATE_HINTS = re.compile(
+    r'comment|footer|header|menu|nav|related|share|sidebar|social|subscribe|newsletter|'
+    r'promo|advert|cookie|banner|popup', re.I)
+# ...unless they also look like the content itself
+CONTENT_HINTS = re.compile(r'article|body|content|entry|main|post|story|text', re.I)
+TEXT_TAGS = ['p', 'h2', 'h3', 'h4', 'li', 'blockquote', 'pre']
+MIN_PARAGRAPH_CHARS = 25
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,
+    final_url TEXT,
+    status INTEGER,
+    etag TEXT,
+    last_modified TEXT,
+    title TEXT,
+    byline TEXT,
+    published TEXT,
+    site_name TEXT,
+    description TEXT,
+    text TEXT,
+    word_count INTEGER,
+    error TEXT,
+    fetched_at REAL
+);
+"""
+
+FIELDS = ['url', 'final_url', 'status', 'etag', 'last_modified', 'title', 'byline', 'published',
+          'site_name', 'description', 'text', 'word_count', 'error', 'fetched_at']
+
+
+class ArticleStore:
+    """SQLite cache of extracted articles, keyed by canonical URL."""
+
+    def __init__(self, path=ARTICLE_STORE_PATH):
+        self.path = str(path)
+        self._conn, self._lock = open_sqlite(self.path, SCHEMA)
+
+    def get(self, url):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM articles WHERE url = ?",
+                                     (canonicalize_url(url),)).fetchone()
+        return dict(row) if row else None
+
+    def save(self, article):
+        row = {**article, 'url': canonicalize_url(article['url'])}
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO articles VALUES ({', '.join('?' * len(FIELDS))})",
+                [row.get(field) for field in FIELDS])
+
+
+def _meta(soup, *names):
+    for name in names:
+        tag = soup.find('meta', attrs={'property': name}) or soup.find('meta', attrs={'name': name})
+        if tag and tag.get('content'):
+            return tag['content'].strip()
+    return None
+
+
+def _text(element):
+    return ' '.join(element.get_text(' ', strip=True).split())
+
+
+def _is_boilerplate(element):
+    if element.name in ('html', 'body', 'article', 'main'):
+        return False
+    hints = ' '.join(element.get('class') or []) + ' ' + (element.get('id') or '')
+    return bool(BOILERPLATE_HINTS.search(hints)) and not CONTENT_HINTS.search(hints)
+
+
+def _main_content(soup):
+    """The element holding the article body: the best-scoring paragraph container."""
+    scores = {}
+    for paragraph in soup.find_all('p'):
+        text = _text(paragraph)
+        if len(text) < MIN_PARAGRAPH_CHARS:
+            continue
+        score = 1 + text.count(',') + min(len(text) // 100, 3)
+        parent = paragraph.parent
+        if parent is not None:
+            scores[parent] = scores.get(parent, 0) + score
+            if parent.parent is not None:
+                scores[parent.parent] = scores.get(parent.parent, 0) + score / 2
+    if not scores:
+        return soup.find('article') or soup.find('main') or soup.body or soup
+    return max(scores, key=scores.get)
+
+
+@stage('extract')
+def extract_article(html, url):
+    """Readable text and metadata of an HTML article page."""
+    BeautifulSoup = require('bs4').BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+
+    heading = soup.find('h1')
+    title = (_meta(soup, 'og:title', 'twitter:title') or (heading and _text(heading)) or
+             (soup.title and _text(soup.title)) or None)
+    byline_tag = soup.find(attrs={'rel': 'author'}) or soup.find(class_=re.compile(r'\bauthor\b'))
+    time_tag = soup.find('time', attrs={'datetime': True})
+    article = {
+        'title': title,
+        'byline': _meta(soup, 'author', 'article:author') or (byline_tag and _text(byline_tag)) or None,
+        'published': (_meta(soup, 'article:published_time', 'date', 'pubdate') or
+                      (time_tag and time_tag['datetime']) or None),
+        'site_name': _meta(soup, 'og:site_name'),
+        'description': _meta(soup, 'og:description', 'description', 'twitter:description'),
+    }
+
+    for tag in soup(BOILERPLATE_TAGS):
+        tag.decompose()
+    for tag in soup.find_all(_is_boilerplate):
+        tag.decompose()
+
+    content = _main_content(soup)
+    blocks = [_text(block) for block in content.find_all(TEXT_TAGS)
+              if not block.find_parent(TEXT_TAGS)]
+    text = '\n\n'.join(block for block in blocks if block) or _text(content)
+    article['text'] = text
+    article['word_count'] = len(text.split())
+    return article
+
+
+@stage('fetch')
+def fetch_article(url, cached=None, timeout=DEFAULT_TIMEOUT):
+    """Download and extract one article, revalidating ``cached`` if given."""
+    requests = require('requests')
+    headers = {}
+    if cached and not cached['error']:
+        if cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    article = {'url': url, 'final_url': None, 'status': None, 'etag': None, 'last_modified': None,
+               'error': None, 'fetched_at': time.time()}
+    try:
+        response = thread_session().get(url, timeout=timeout, headers=headers, allow_redirects=True)
+    except requests.exceptions.RequestException as e:
+        return {**article, 'error': str(e)}
+
+    if response.status_code == 304 and headers:
+        return {**cached, 'url': url, 'fetched_at': article['fetched_at']}
+    article.update(final_url=response.url, status=response.status_code,
+                   etag=response.headers.get('ETag'),
+                   last_modified=response.headers.get('Last-Modified'))
+    if response.status_code >= 400:
+        return {**article, 'error': f"HTTP {response.status_code}"}
+    content_type = response.headers.get('Content-Type', '')
+    if 'html' not in content_type.lower():
+        return {**article, 'error': f"Not an HTML page ({content_type or 'no content type'})"}
+    try:
+        return {**article, **extract_article(response.content, response.url)}
+    except Exception as e:
+        return {**article, 'error': f"Error extracting article: {str(e)}"}
+
+
+def fetch_articles(urls, store, workers=DEFAULT_WORKERS, per_host=DEFAULT_PER_HOST,
+                   timeout=DEFAULT_TIMEOUT, refresh=False, deadline=None, log=sys.stderr):
+    """Fetch every article not yet in the store. Returns url -> article (None if not fetched).
+
+    Articles are fetched at most once per canonical URL, however many items
+    link to them. With ``refresh``, cached articles are revalidated with a
+    conditional request. Failed fetches are retried after a day. With a
+    ``tooling.budget.Deadline``, request timeouts are clamped to it and
+    articles still queued when it expires are not fetched.
+    """
+    now = time.time()
+    unique = {}
+    for url in urls:
+        unique.setdefault(canonicalize_url(url), url)
+    cached = {url: store.get(url) for url in unique.values()}
+    to_fetch = [url for url, article in cached.items()
+                if article is None or refresh or
+                (article['error'] and now - article['fetched_at'] > RETRY_ERRORS_AFTER)]
+    print(f"Fetching {len(to_fetch)} of {len(unique)} articles "
+          f"({len(unique) - len(to_fetch)} cached)...", file=log)
+
+    limiter = HostLimiter(per_host)
+
+    def run(url):
+        with limiter.slot(url):
+            if deadline and deadline.expired():
+                return None
+            return fetch_article(url, cached[url] if refresh else None,
+                                 request_timeout(timeout, deadline))
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = [executor.submit(run, url) for url in to_fetch]
+    done, _ = wait(futures, timeout=max(0, deadline.remaining()) if deadline else None)
+    # In-flight requests finish within their clamped timeouts; queued ones never start
+    executor.shutdown(wait=False, cancel_futures=True)
+    fetched = [future.result() for future in futures if future in done and not future.cancelled()]
+    for article in fetched:
+        if article:
+            store.save(article)
+    if len(fetched) < len(to_fetch):
+        print(f"Fetched {len(fetched)} of {len(to_fetch)} articles before the deadline",
+              file=log)
+
+    return {url: store.get(url) for url in urls}
+
+
+def attach_articles(results, store, workers=DEFAULT_WORKERS, per_host=DEFAULT_PER_HOST,
+                    refresh=False, deadline=None, log=sys.stderr):
+    """Fetch the article behind every item in ``companies``/``posts`` results, in place.
+
+    Each item gets an ``article`` dict (metadata, ``text`` and ``word_count``,
+    or ``error``), unless the ``deadline`` expired before it was fetched.
+    """
+    items = [item for result in results
+             for item in result.get('updates', result.get('posts', [])) if item.get('link')]
+    articles = fetch_articles([item['link'] for item in items], store, workers=workers,
+                              per_host=per_host, refresh=refresh, deadline=deadline, log=log)
+    for item in items:
+        article = articles[item['link']]
+        if article is None:
+            continue
+        item['article'] = {field: article[field] for field in
+                           ('final_url', 'title', 'byline', 'published', 'site_name',
+                            'description', 'text', 'word_count', 'error')}
+    return results
+
+
+def article_markdown(article):
+    """Markdown lines for an item's ``article``, used by the ``format_output`` functions."""
+    if article['error']:
+        return f"**Article:** unavailable ({article['error']})\n"
+    details = [f"{article['word_count']} words"]
+    if article['byline']:
+        details.append(f"by {article['byline']}")
+    text = article['text']
+    excerpt = text[:EXCERPT_CHARS].rstrip() + ('…' if len(text) > EXCERPT_CHARS else '')
+    return f"**Article:** ({', '.join(details)})\n\n{excerpt}\n"
@@ -0,0 +1,199 @@
+"""
+History backfill: crawl older pages of tracked feeds into the item store.
+
+``check_rss_feed`` only sees the first page of a feed, so items that scrolled
+off before a missed day are gone. Backfill follows pagination instead:
+
+- RFC 5005 paged/archived feeds: ``rel="next"`` / ``rel="prev-archive"`` links
+  (in the feed or the HTTP Link header)
+- WordPress: ``?paged=N`` on the feed URL
+- Substack: the JSON archive API (``/api/v1/archive?offset=N``)
+
+Feeds are crawled concurrently, with a cap on simultaneous requests per host.
+Each feed stops as soon as a page reaches past the requested start date.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from tooling.feeds import feed_posts, fetch_url, parse_feed
+from tooling.limits import DEFAULT_PER_HOST, HostLimiter
+from tooling.people import person_result
+
+DEFAULT_WORKERS = 8
+DEFAULT_MAX_PAGES = 50
+SUBSTACK_PAGE_SIZE = 50
+
+
+def with_query_param(url, name, value):
+    """Return ``url`` with query parameter ``name`` set to ``value``."""
+    parsed = urlparse(url)
+    query = [(k, v) for k, v in parse_qsl(parsed.query) if k != name]
+    query.append((name, str(value)))
+    return urlunparse(parsed._replace(query=urlencode(query)))
+
+
+def is_wordpress(feed):
+    return 'wordpress' in feed.feed.get('generator', '').lower()
+
+
+def is_substack(feed_url, feed=None):
+    if urlparse(feed_url).netloc.lower().endswith('.substack.com'):
+        return True
+    return feed is not None and 'substack' in feed.feed.get('generator', '').lower()
+
+
+def next_page_url(feed, feed_url, page_number, link_headers=None):
+    """URL of the page after ``page_number`` (1-based), or None if there isn't one."""
+    if link_headers:
+        for rel in ('next', 'prev-archive'):
+            if rel in link_headers:
+                return link_headers[rel]['url']
+    for link in feed.feed.get('links', []):
+        if link.get('rel') in ('next', 'prev-archive') and link.get('href'):
+            return link['href']
+    if is_wordpress(feed):
+        return with_query_param(feed_url, 'paged', page_number + 1)
+    return None
+
+
+def reached_start(posts, since):
+    """True once a page contains an item published before ``since``."""
+    dated = [post['published'] for post in posts if post['published']]
+    return bool(dated) and min(dated) < since.isoformat()
+
+
+def substack_archive_posts(items, summary_chars=500):
+    """Convert Substack archive API items to post dicts."""
+    posts = []
+    for item in items:
+        published = item.get('post_date')
+        if published:
+            published = datetime.fromisoformat(published.replace('Z', '+00:00'))
+            published = published.replace(tzinfo=None).isoformat()
+        posts.append({
+            'title': item.get('title') or 'Untitled',
+            'link': item.get('canonical_url') or '',
+            'published': published,
+            'summary': (item.get('subtitle') or item.get('description') or '')[:summary_chars],
+        })
+    return posts
+
+
+def crawl_substack_archive(feed_url, since, store, limiter, max_pages, first_offset=0):
+    """Page through a Substack publication's archive API. Returns (pages, added)."""
+    parsed = urlparse(feed_url)
+    archive_url = f"{parsed.scheme}://{parsed.netloc}/api/v1/archive"
+    pages = added = 0
+    offset = first_offset
+
+    while pages < max_pages:
+        url = f"{archive_url}?sort=new&offset={offset}&limit={SUBSTACK_PAGE_SIZE}"
+        with limiter.slot(url):
+            response = fetch_url(url)
+        if response.status_code != 200:
+            break
+        items = response.json()
+        if not items:
+            break
+        posts = substack_archive_posts(items)
+        added += store.add_items(feed_url, posts, origin='backfill')
+        pages += 1
+        offset += len(items)
+        if reached_start(posts, since):
+            break
+
+    return pages, added
+
+
+def crawl_feed(feed_url, since, store, limiter=None, max_pages=DEFAULT_MAX_PAGES):
+    """Follow a feed's pages back to ``since``, storing every item.
+
+    Returns a summary dict: feed_url, pages, added, error.
+    """
+    limiter = limiter or HostLimiter()
+    summary = {'feed_url': feed_url, 'pages': 0, 'added': 0, 'error': None}
+    page_url = feed_url
+    seen = set()
+
+    try:
+        while page_url and page_url not in seen and summary['pages'] < max_pages:
+            seen.add(page_url)
+            with limiter.slot(page_url):
+                response = fetch_url(page_url)
+            if response.status_code != 200:
+                # Running off the end of ?paged=N returns 404
+                if summary['pages'] == 0:
+                    summary['error'] = f"HTTP {response.status_code}"
+                break
+
+            feed, error = parse_feed(response.content)
+            if error or not feed.entries:
+                if summary['pages'] == 0:
+                    summary['error'] = error or "No entries"
+                break
+
+            posts = feed_posts(feed)
+            summary['added'] += store.add_items(feed_url, posts, origin='backfill')
+            summary['pages'] += 1
+            if reached_start(posts, since):
+                break
+
+            if summary['pages'] == 1 and is_substack(feed_url, feed):
+                pages, added = crawl_substack_archive(
+                    feed_url, since, store, limiter, max_pages - 1, first_offset=len(posts))
+                summary['pages'] += pages
+                summary['added'] += added
+                break
+
+            page_url = next_page_url(feed, feed_url, summary['pages'], response.links)
+    except Exception as e:
+        summary['error'] = str(e)
+
+    return summary
+
+
+def backfill_feeds(feed_urls, since, store, workers=DEFAULT_WORKERS, per_host=DEFAULT_PER_HOST,
+                   max_pages=DEFAULT_MAX_PAGES, log=sys.stderr):
+    """Crawl many feeds concurrently. Returns a list of per-feed summaries."""
+    limiter = HostLimiter(per_host)
+    summaries = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(crawl_feed, url, since, store, limiter, max_pages)
+                   for url in dict.fromkeys(feed_urls)]
+        for future in as_completed(futures):
+            summary = future.result()
+            summaries.append(summary)
+            status = f"⚠ {summary['error']}" if summary['error'] else \
+                f"✓ {summary['pages']} pages, {summary['added']} new items"
+            print(f"  {summary['feed_url']}: {status}", file=log)
+    return summaries
+
+
+def company_results_from_store(companies, store, since, until=None):
+    """Build the ``tooling.companies.format_output`` results structure from stored items."""
+    results = []
+    for company in companies:
+        updates = []
+        for feed_url in company.get('rss_feeds', []):
+            for post in store.items_since(feed_url, since, until=until):
+                updates.append({**post, 'source': 'rss', 'source_url': feed_url})
+        results.append({
+            'name': company['name'],
+            'category': company['category'],
+            'updates': updates,
+            'errors': [],
+        })
+    return results
+
+
+def people_results_from_store(people, store, since, until=None):
+    """Build the ``tooling.people.format_output`` results structure from stored items."""
+    results = []
+    for person in people:
+        posts = store.items_since(person['rss_feed'], since, until=until) \
+            if person.get('rss_feed') else []
+        results.append(person_result(person, posts, []))
+    return results
@@ -0,0 +1,176 @@
+"""
+Time-budgeted, priority-ordered company collection.
+
+``collect_company_updates`` checks every source in file order with no time
+limit. ``collect_with_budget`` instead:
+
+1. Plans one task per distinct source - equivalent URLs (see
+   ``tooling.fetchplan``) requested by several companies share a task - and
+   orders them: known feeds, then scraped listing pages, then discovery;
+   high-value categories first; then sources that produced the most items on
+   previous runs (from the item store's source history)
+2. Runs them on a thread pool, with every request timeout clamped to the
+   remaining budget
+3. When the budget runs out, cancels tasks that haven't started and returns
+   what finished, with coverage stats
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from tooling.companies import check_company_source, company_sources, unique_updates
+from tooling.fetchplan import RedirectMap, SharedFetches
+
+DEFAULT_WORKERS = 8
+
+# Known feeds cost one request, scraped pages one request and a parse, and
+# discovery up to two dozen probes
+SOURCE_KIND_RANK = {'rss': 0, 'scrape': 1, 'blog': 2}
+
+# Earlier categories are fetched first; unlisted categories go last
+CATEGORY_PRIORITY = [
+    'Foundation models / AI platforms',
+    'Developer & AI tooling',
+    'Consumer & productivity software',
+    'Consumer & AI platforms',
+    'Enterprise software',
+    'Developer & design tooling',
+    'Video & creative AI',
+    'Voice & audio AI',
+    'Fintech or fintech-adjacent platforms',
+    'Media / Signal aggregation',
+]
+
+
+class Deadline:
+    """A monotonic-clock deadline shared by every task in a run."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.started = time.monotonic()
+        self.expires = self.started + seconds
+
+    def remaining(self):
+        return self.expires - time.monotonic()
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+
+def category_rank(category):
+    try:
+        return CATEGORY_PRIORITY.index(category)
+    except ValueError:
+        return len(CATEGORY_PRIORITY)
+
+
+def plan_company_fetches(companies, yields=None, redirects=None):
+    """One task per distinct company source, in the order they should be fetched.
+
+    Sources with the same ``RedirectMap.key`` share a task: ``requesters``
+    lists every (company index, url) it answers, and its priority is that of
+    the most urgent one.
+    """
+    yields = yields or {}
+    redirects = redirects or RedirectMap()
+    tasks = {}
+    for index, company in enumerate(companies):
+        for kind, url in company_sources(company):
+            priority = (SOURCE_KIND_RANK[kind],
+                        category_rank(company['category']),
+                        -yields.get(url, 0),
+                        index)
+            task = tasks.setdefault((kind, redirects.key(url)), {
+                'kind': kind,
+                'url': url,
+                'requesters': [],
+                'priority': priority,
+            })
+            task['requesters'].append((index, url))
+            task['priority'] = min(task['priority'], priority)
+    return sorted(tasks.values(), key=lambda task: task['priority'])
+
+
+def collect_with_budget(companies, days_back=7, budget_seconds=300, workers=DEFAULT_WORKERS,
+                        store=None, push=None, fetches=None, deadline=None, log=sys.stderr):
+    """Collect company updates within ``budget_seconds``. Returns (results, coverage).
+
+    ``results`` has the same shape as ``collect_company_updates``; sources that
+    didn't finish in time are listed in each company's ``skipped`` key. Pass a
+    ``deadline`` to share the budget with later stages.
+    """
+    deadline = deadline or Deadline(budget_seconds)
+    fetches = fetches or SharedFetches(RedirectMap(store))
+    tasks = plan_company_fetches(companies, store.source_yields() if store else None,
+                                 fetches.redirects)
+
+    def run(task):
+        # The first requester fetches; the rest are answered from ``fetches``
+        return {(index, url): check_company_source(companies[index], task['kind'], url,
+                                                   days_back, push, deadline, fetches)
+                for index, url in task['requesters']}
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = [executor.submit(run, task) for task in tasks]
+    done, _ = wait(futures, timeout=max(0, deadline.remaining()))
+    # In-flight requests finish within their clamped timeouts; queued ones never start
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    outcomes = {}
+    checked = 0
+    for task, future in zip(tasks, futures):
+        if future in done and not future.cancelled():
+            checked += 1
+            for (index, url), outcome in future.result().items():
+                outcomes[(index, task['kind'], url)] = outcome
+                if store:
+                    store.record_source_run(url, len(outcome[0]))
+
+    results = []
+    companies_complete = 0
+    for index, company in enumerate(companies):
+        updates, errors, skipped = [], [], []
+        # Same source order as the unbudgeted run: known feeds, then blogs
+        for kind, url in company_sources(company):
+            outcome = outcomes.get((index, kind, url))
+            if outcome is None:
+                skipped.append(url)
+                continue
+            updates.extend(outcome[0])
+            errors.extend(outcome[1])
+        if not skipped:
+            companies_complete += 1
+        results.append({
+            'name': company['name'],
+            'category': company['category'],
+            'updates': unique_updates(updates),
+            'errors': errors,
+            'skipped': skipped,
+        })
+
+    coverage = {
+        'budget_seconds': budget_seconds,
+        'elapsed_seconds': round(deadline.elapsed(), 1),
+        'sources_total': len(tasks),
+        'sources_checked': checked,
+        'companies_total': len(companies),
+        'companies_complete': companies_complete,
+        'complete': checked == len(tasks),
+    }
+    print(f"Checked {coverage['sources_checked']}/{coverage['sources_total']} sources "
+          f"in {coverage['elapsed_seconds']}s (budget {budget_seconds}s)", file=log)
+    return results, coverage
+
+
+def coverage_line(coverage):
+    """One-line markdown label for (possibly partial) budgeted results."""
+    percent = 100 * coverage['sources_checked'] / max(1, coverage['sources_total'])
+    label = "Complete results" if coverage['complete'] else "Partial results"
+    return (f"*{label}: {coverage['sources_checked']} of {coverage['sources_total']} sources "
+            f"checked ({percent:.0f}%), {coverage['companies_complete']} of "
+            f"{coverage['companies_total']} companies complete, "
+            f"{coverage['elapsed_seconds']}s of {coverage['budget_seconds']}s budget*")
@@ -0,0 +1,633 @@
+"""
+Command-line entry point for the Python tooling.
+
+Usage (from the project root):
+    python3 -m tooling companies --days 7 --format markdown
+    python3 -m tooling posts --days 14 --format markdown
+    python3 -m tooling audit --days 30
+    python3 -m tooling parse companies
+    python3 -m tooling report companies results.json --format markdown
+    python3 -m tooling websub serve --port 8080
+    python3 -m tooling backfill companies --since 2026-01-01 --format markdown
+    python3 -m tooling links
+    python3 -m tooling companies --shard 2/4 > shard-2.json
+    python3 -m tooling merge companies shard-*.json --format markdown
+    python3 -m tooling topics --since 2026-01-01 --until 2026-01-31
+    python3 -m tooling companies --profile companies.prof --profile-collapsed companies.folded
+    python3 -m tooling companies --articles --format json > companies.json
+    python3 -m tooling dispatch --since 2026-01-01
+    python3 -m tooling scale report --scales 1,10,100
+    python3 -m tooling scale serve --scale 100 --out /tmp/scale-100
+
+Subcommand modules are imported inside their handlers so that ``--help``,
+``parse`` and ``report`` never load the network stack.
+"""
+
+import argparse
+import json
+import sys
+
+from tooling import (ARTICLE_STORE_PATH, CACHE_DIR, CONTEXT_DIR, DISPATCH_STATE_PATH,
+                     ITEM_STORE_PATH, LINK_STORE_PATH, PROJECT_ROOT)
+
+DEFAULT_COMPANIES_FILE = str(CONTEXT_DIR / 'companies.md')
+DEFAULT_PEOPLE_FILE = str(CONTEXT_DIR / 'people.md')
+DEFAULT_STORE_FILE = str(ITEM_STORE_PATH)
+DEFAULT_ARTICLE_STORE_FILE = str(ARTICLE_STORE_PATH)
+DEFAULT_UPDATES_DIR = str(PROJECT_ROOT / 'updates' / 'daily')
+
+
+def _push_subscriber(args):
+    """PushSubscriber for ``--websub-callback`` runs, else None (plain polling)."""
+    if not args.websub_callback:
+        return None
+    from tooling.store import ItemStore
+    from tooling.websub import PushSubscriber
+
+    return PushSubscriber(ItemStore(args.store), args.websub_callback)
+
+
+def _shared_fetches(args, push=None):
+    """SharedFetches for one run, remembering redirects in the ``--store`` item store."""
+    from tooling.fetchplan import RedirectMap, SharedFetches
+    from tooling.store import ItemStore
+
+    return SharedFetches(RedirectMap(push.store if push else ItemStore(args.store)))
+
+
+def _attach_articles(args, results, deadline=None):
+    """Add full articles to ``results`` items when ``--articles`` is set.
+
+    With a ``--budget`` deadline, articles use whatever time collection left.
+    """
+    if not args.articles:
+        return results
+    from tooling.articles import ArticleStore, attach_articles
+
+    return attach_articles(results, ArticleStore(args.article_store),
+                           workers=args.article_workers, refresh=args.refresh_articles,
+                           deadline=deadline)
+
+
+def run_companies(args):
+    """Check recent updates from tracked companies."""
+    from tooling.context import parse_companies_file
+    from tooling.companies import collect_company_updates, format_output
+
+    companies = parse_companies_file(args.companies_file)
+    if not companies:
+        print("No companies with blogs or changelogs found.", file=sys.stderr)
+        return 1
+
+    print(f"Checking company updates from last {args.days} days...\n", file=sys.stderr)
+    print(f"Found {len(companies)} companies with sources\n", file=sys.stderr)
+
+    push = _push_subscriber(args)
+    fetches = _shared_fetches(args, push)
+
+    if args.shard:
+        from tooling.shard import collect_company_shard
+
+        index, count = args.shard
+        partial = collect_company_shard(companies, index, count, days_back=args.days,
+                                        push=push, fetches=fetches)
+        print(json.dumps(partial, indent=2, ensure_ascii=False))
+        return 0
+
+    if args.budget:
+        from tooling.budget import Deadline, collect_with_budget
+
+        deadline = Deadline(args.budget)
+        results, coverage = collect_with_budget(companies, days_back=args.days,
+                                                budget_seconds=args.budget,
+                                                workers=args.workers,
+                                                store=fetches.redirects.store, push=push,
+                                                fetches=fetches, deadline=deadline)
+        print(format_output(_attach_articles(args, results, deadline), args.format, coverage))
+        return 0
+
+    results = collect_company_updates(companies, days_back=args.days, push=push,
+                                      fetches=fetches)
+
+    print(format_output(_attach_articles(args, results), args.format))
+    return 0
+
+
+def run_posts(args):
+    """Check recent posts from tracked people."""
+    from tooling.context import parse_people_file, people_with_sources
+    from tooling.people import check_recent_posts, format_output
+
+    people = people_with_sources(parse_people_file(args.people_file))
+    if not people:
+        print("No people with blogs or RSS feeds found.", file=sys.stderr)
+        return 1
+
+    push = _push_subscriber(args)
+    fetches = _shared_fetches(args, push)
+
+    if args.shard:
+        from tooling.shard import collect_people_shard
+
+        index, count = args.shard
+        partial = collect_people_shard(people, index, count, days_back=args.days,
+                                       push=push, fetches=fetches)
+        print(json.dumps(partial, indent=2, ensure_ascii=False))
+        return 0
+
+    results = check_recent_posts(people, days_back=args.days, push=push, fetches=fetches)
+
+    print(format_output(_attach_articles(args, results), args.format))
+    return 0
+
+
+def run_audit(args):
+    """Audit tracked people for recent blog activity."""
+    from tooling.context import parse_people_file
+    from tooling.people import audit_person_activity, print_audit_report
+
+    people = parse_people_file(args.people_file)
+    print(f"Auditing {len(people)} people for activity in last {args.days} days...\n")
+
+    results = [audit_person_activity(person, args.days) for person in people]
+
+    print_audit_report(results, args.days)
+    return 0
+
+
+def run_parse(args):
+    """Print the parsed contents of a context file as JSON (no network)."""
+    from tooling import context
+
+    if args.kind == 'companies':
+        parsed = context.parse_companies_file(args.file or DEFAULT_COMPANIES_FILE)
+    else:
+        parsed = context.parse_people_file(args.file or DEFAULT_PEOPLE_FILE)
+
+    print(json.dumps(parsed, indent=2, ensure_ascii=False))
+    return 0
+
+
+def run_report(args):
+    """Re-format a saved JSON results file (no network)."""
+    if args.kind == 'companies':
+        from tooling.companies import format_output
+    else:
+        from tooling.people import format_output
+
+    with open(args.results_file, 'r', encoding='utf-8') as f:
+        results = json.load(f)
+
+    # Budgeted runs save {"coverage": ..., "results": [...]}
+    if isinstance(results, dict):
+        print(format_output(results['results'], args.format, results.get('coverage')))
+        return 0
+
+    print(format_output(results, args.format))
+    return 0
+
+
+def run_merge(args):
+    """Combine shard partials into the same output an unsharded run prints."""
+    from tooling import shard
+    from tooling.context import parse_companies_file, parse_people_file, people_with_sources
+
+    partials = []
+    for path in args.partial_files:
+        with open(path, 'r', encoding='utf-8') as f:
+            partials.append(json.load(f))
+
+    try:
+        if args.kind == 'companies':
+            from tooling.companies import format_output
+
+            results = shard.merge_company_partials(parse_companies_file(args.companies_file),
+                                                   partials)
+        else:
+            from tooling.people import format_output
+
+            people = people_with_sources(parse_people_file(args.people_file))
+            results = shard.merge_people_partials(people, partials)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(format_output(_attach_articles(args, results), args.format))
+    return 0
+
+
+def run_websub(args):
+    """Run the WebSub callback receiver, or list subscriptions."""
+    from tooling.store import ItemStore
+
+    store = ItemStore(args.store)
+    if args.action == 'list':
+        for subscription in store.list_subscriptions():
+            print(f"{subscription['state']:<8} {subscription['feed_url']} (hub: {subscription['hub']})")
+        return 0
+
+    from tooling.websub import serve
+
+    serve(store, host=args.host, port=args.port)
+    return 0
+
+
+def run_backfill(args):
+    """Crawl feed history back to --since into the item store, then report that window."""
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime, timedelta
+
+    from tooling import backfill
+    from tooling.context import parse_companies_file, parse_people_file, people_with_sources
+    from tooling.store import ItemStore
+
+    since = datetime.strptime(args.since, '%Y-%m-%d')
+    until = datetime.strptime(args.until, '%Y-%m-%d') + timedelta(days=1) if args.until else None
+    store = ItemStore(args.store)
+
+    if args.kind == 'companies':
+        from tooling.companies import format_output
+
+        entities = parse_companies_file(args.companies_file)
+        if args.discover:
+            from tooling.feeds import try_find_rss_feed
+
+            blogs = [(company, blog) for company in entities for blog in company['blogs']
+                     if blog not in company['feed_urls']]
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                found = executor.map(lambda pair: try_find_rss_feed(pair[1]), blogs)
+                for (company, _), feed_url in zip(blogs, found):
+                    if feed_url and feed_url not in company['rss_feeds']:
+                        company['rss_feeds'].append(feed_url)
+        feed_urls = [url for company in entities for url in company['rss_feeds']]
+    else:
+        from tooling.people import format_output
+
+        entities = people_with_sources(parse_people_file(args.people_file))
+        feed_urls = [person['rss_feed'] for person in entities if person['rss_feed']]
+
+    print(f"Backfilling {len(feed_urls)} feeds back to {args.since}...\n", file=sys.stderr)
+    backfill.backfill_feeds(feed_urls, since, store, workers=args.workers,
+                            per_host=args.per_host, max_pages=args.max_pages)
+
+    if args.kind == 'companies':
+        results = backfill.company_results_from_store(entities, store, since, until)
+    else:
+        results = backfill.people_results_from_store(entities, store, since, until)
+
+    print(format_output(results, args.format))
+    return 0
+
+
+def run_links(args):
+    """Check every URL in the context files and update archive, report dead/redirected."""
+    from tooling import links
+
+    found = links.collect_links(
+        context_files=[args.people_file, args.companies_file],
+        updates_dir=None if args.skip_updates else args.updates_dir)
+    store = links.LinkStore(args.link_store)
+    urls = [link['url'] for link in found.values()]
+
+    results = links.check_links(urls, store, workers=args.workers, per_host=args.per_host,
+                                timeout=args.timeout, force=args.force)
+
+    print(links.format_report(found, results, args.format, only_problems=not args.all))
+    return 1 if any(links.classify(r) == 'dead' for r in results.values()) else 0
+
+
+def run_topics(args):
+    """Cluster saved results and archived update items into topics."""
+    from datetime import date, timedelta
+
+    from tooling import topics
+
+    until = date.fromisoformat(args.until) if args.until else date.today()
+    since = date.fromisoformat(args.since) if args.since else until - timedelta(days=args.days)
+
+    items = []
+    for path in args.results_files:
+        with open(path, 'r', encoding='utf-8') as f:
+            items.extend(topics.result_items(json.load(f)))
+    if not args.skip_updates:
+        items.extend(topics.archive_items(args.updates_dir, since, until))
+    if not items:
+        print("No items to cluster.", file=sys.stderr)
+        return 1
+
+    print(f"Clustering {len(items)} items...", file=sys.stderr)
+    clusters = topics.cluster_items(items, threshold=args.threshold, min_size=args.min_size,
+                                    representatives=args.representatives)
+    print(topics.format_clusters(clusters, args.format, total_items=len(items)))
+    return 0
+
+
+def run_dispatch(args):
+    """Dispatch a daily-update workflow run for every missing date and follow them."""
+    import os
+    from datetime import date, timedelta
+
+    from tooling import dispatch
+
+    since = date.fromisoformat(args.since)
+    # Today's update is the scheduled run's job
+    until = date.fromisoformat(args.until) if args.until else date.today() - timedelta(days=1)
+    dates = dispatch.missing_dates(args.updates_dir, since, until,
+                                   include_stubs=not args.missing_only)
+    print(f"{len(dates)} dates missing between {since} and {until}", file=sys.stderr)
+    if args.dry_run or not dates:
+        for day in dates:
+            print(day.isoformat())
+        return 0
+
+    token = os.environ.get('GITHUB_TOKEN')
+    if not token:
+        print("GITHUB_TOKEN not set (needs the 'repo' and 'workflow' scopes)", file=sys.stderr)
+        return 1
+
+    client = dispatch.ActionsClient(token, repo=args.repo, api_url=args.api_url)
+    outcomes = dispatch.backfill_dates(client, dates, dispatch.DispatchState(args.state),
+                                       concurrency=args.concurrency, ref=args.ref,
+                                       poll_interval=args.poll_interval)
+    print(f"{client.requests} API requests, {client.not_modified} not modified", file=sys.stderr)
+    print(dispatch.format_summary(outcomes))
+    return 0 if all(entry and entry.get('conclusion') == 'success'
+                    for entry in outcomes.values()) else 1
+
+
+def run_scale(args):
+    """Serve synthetic context files and feeds, or report the scaling curve."""
+    import time
+
+    from tooling import scale
+
+    if args.action == 'serve':
+        server = scale.FixtureServer(port=args.port).start()
+        companies_file, people_file = scale.write_fixtures(args.out, args.scale, server.base_url)
+        print(f"Serving {args.scale}x fixtures at {server.base_url}", file=sys.stderr)
+        print(f"  python3 -m tooling companies --companies-file {companies_file}", file=sys.stderr)
+        print(f"  python3 -m tooling posts --people-file {people_file}", file=sys.stderr)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.stop()
+        return 0
+
+    scales = [int(value) for value in args.scales.split(',')]
+    print(f"Measuring at {', '.join(f'{s}x' for s in scales)} of {scale.current_sizes()}...",
+          file=sys.stderr)
+    curves = scale.measure_scaling(scales, checker_max_scale=args.checker_max_scale,
+                                   log=sys.stderr)
+    print(scale.format_curve(curves, args.format))
+    return 0
+
+
+def _add_store_argument(parser):
+    parser.add_argument('--store', type=str, default=DEFAULT_STORE_FILE,
+                        help='Path to the local item store (default: .cache/tooling/items.sqlite3)')
+
+
+def _shard_spec(value):
+    from tooling.shard import parse_shard
+
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _add_shard_argument(parser):
+    parser.add_argument('--shard', type=_shard_spec, metavar='i/N',
+                        help='Only check sources assigned to shard i of N and print a partial '
+                             'result file for `merge`')
+
+
+def _add_websub_arguments(parser):
+    parser.add_argument('--websub-callback', type=str, metavar='URL',
+                        help='Public base URL of the WebSub receiver; enables push subscriptions '
+                             'and skips polling for feeds with an active subscription')
+    _add_store_argument(parser)
+
+
+def _add_article_arguments(parser):
+    parser.add_argument('--articles', action='store_true',
+                        help='Also fetch each new item\'s article and extract its text and metadata '
+                             '(cached, so each article is downloaded once)')
+    parser.add_argument('--article-workers', type=int, default=8,
+                        help='Concurrent article fetches (default: 8)')
+    parser.add_argument('--refresh-articles', action='store_true',
+                        help='Revalidate cached articles with conditional requests')
+    parser.add_argument('--article-store', type=str, default=DEFAULT_ARTICLE_STORE_FILE,
+                        help='Path to the article cache (default: .cache/tooling/articles.sqlite3)')
+
+
+def _add_profile_arguments(parser):
+    parser.add_argument('--profile', type=str, metavar='PATH',
+                        help='Profile the run: write cProfile stats to PATH and print per-stage '
+                             'time and memory to stderr')
+    parser.add_argument('--profile-top', type=int, default=15, metavar='N',
+                        help='Functions and allocation sites listed per section (default: 15)')
+    parser.add_argument('--profile-collapsed', type=str, metavar='PATH',
+                        help='With --profile, also write sampled collapsed stacks to PATH '
+                             '(for flamegraph.pl or speedscope)')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python3 -m tooling',
+                                     description='AI PM Research tooling')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    companies = subparsers.add_parser('companies', help='Check recent updates from tracked companies')
+    companies.add_argument('--days', type=int, default=7, help='Number of days back to check (default: 7)')
+    companies.add_argument('--format', choices=['json', 'markdown'], default='markdown', help='Output format')
+    companies.add_argument('--companies-file', type=str, default=DEFAULT_COMPANIES_FILE,
+                           help='Path to companies.md file')
+    companies.add_argument('--budget', type=float, metavar='SECONDS',
+                           help='Stop after SECONDS, fetching the highest-priority sources first '
+                                'and labelling partial results with coverage stats')
+    companies.add_argument('--workers', type=int, default=8,
+                           help='Concurrent fetches in --budget mode (default: 8)')
+    _add_shard_argument(companies)
+    _add_websub_arguments(companies)
+    _add_article_arguments(companies)
+    companies.set_defaults(handler=run_companies)
+
+    posts = subparsers.add_parser('posts', help='Check recent posts from tracked people')
+    posts.add_argument('--days', type=int, default=7, help='Number of days back to check (default: 7)')
+    posts.add_argument('--format', choices=['json', 'markdown'], default='json', help='Output format')
+    posts.add_argument('--people-file', type=str, default=DEFAULT_PEOPLE_FILE,
+                       help='Path to people.md file')
+    _add_shard_argument(posts)
+    _add_websub_arguments(posts)
+    _add_article_arguments(posts)
+    posts.set_defaults(handler=run_posts)
+
+    audit = subparsers.add_parser('audit', help='Audit people activity')
+    audit.add_argument('--days', type=int, default=30, help='Number of days back to check (default: 30)')
+    audit.add_argument('--people-file', type=str, default=DEFAULT_PEOPLE_FILE,
+                       help='Path to people.md file')
+    audit.set_defaults(handler=run_audit)
+
+    parse = subparsers.add_parser('parse', help='Print a parsed context file as JSON')
+    parse.add_argument('kind', choices=['companies', 'people'])
+    parse.add_argument('--file', type=str, help='Path to the context file (default: context/<kind>.md)')
+    parse.set_defaults(handler=run_parse)
+
+    report = subparsers.add_parser('report', help='Format a saved JSON results file')
+    report.add_argument('kind', choices=['companies', 'posts'])
+    report.add_argument('results_file', help='JSON output of a previous companies/posts run')
+    report.add_argument('--format', choices=['json', 'markdown'], default='markdown', help='Output format')
+    report.set_defaults(handler=run_report)
+
+    merge = subparsers.add_parser('merge', help='Combine --shard partial result files')
+    merge.add_argument('kind', choices=['companies', 'posts'])
+    merge.add_argument('partial_files', nargs='+', help='One partial file per shard')
+    merge.add_argument('--format', choices=['json', 'markdown'], default='markdown', help='Output format')
+    merge.add_argument('--companies-file', type=str, default=DEFAULT_COMPANIES_FILE,
+                       help='Path to companies.md file')
+    merge.add_argument('--people-file', type=str, default=DEFAULT_PEOPLE_FILE,
+                       help='Path to people.md file')
+    _add_article_arguments(merge)
+    merge.set_defaults(handler=run_merge)
+
+    websub = subparsers.add_parser('websub', help='WebSub push subscription receiver')
+    websub.add_argument('action', choices=['serve', 'list'])
+    websub.add_argument('--host', type=str, default='127.0.0.1', help='Interface to listen on')
+    websub.add_argument('--port', type=int, default=8080, help='Port to listen on (default: 8080)')
+    _add_store_argument(websub)
+    websub.set_defaults(handler=run_websub)
+
+    backfill = subparsers.add_parser('backfill', help='Crawl older feed pages into the item store')
+    backfill.add_argument('kind', choices=['companies', 'posts'])
+    backfill.add_argument('--since', type=str, required=True, help='Start date (YYYY-MM-DD)')
+    backfill.add_argument('--until', type=str, help='End date, inclusive (YYYY-MM-DD, default: today)')
+    backfill.add_argument('--format', choices=['json', 'markdown'], default='markdown', help='Output format')
+    backfill.add_argument('--companies-file', type=str, default=DEFAULT_COMPANIES_FILE,
+                          help='Path to companies.md file')
+    backfill.add_argument('--people-file', type=str, default=DEFAULT_PEOPLE_FILE,
+                          help='Path to people.md file')
+    backfill.add_argument('--discover', action='store_true',
+                          help='Also discover feeds for company blogs without a known feed')
+    backfill.add_argument('--workers', type=int, default=8, help='Feeds crawled at once (default: 8)')
+    backfill.add_argument('--per-host', type=int, default=2,
+                          help='Max simultaneous requests per host (default: 2)')
+    backfill.add_argument('--max-pages', type=int, default=50, help='Max pages per feed (default: 50)')
+    _add_store_argument(backfill)
+    backfill.set_defaults(handler=run_backfill)
+
+    link_check = subparsers.add_parser('links', help='Check URLs in context files and updates')
+    link_check.add_argument('--people-file', type=str, default=DEFAULT_PEOPLE_FILE,
+                            help='Path to people.md file')
+    link_check.add_argument('--companies-file', type=str, default=DEFAULT_COMPANIES_FILE,
+                            help='Path to companies.md file')
+    link_check.add_argument('--updates-dir', type=str, default=DEFAULT_UPDATES_DIR,
+                            help='Directory of daily updates to scan for **Source:** links')
+    link_check.add_argument('--skip-updates', action='store_true', help='Only check the context files')
+    link_check.add_argument('--workers', type=int, default=32, help='Concurrent checks (default: 32)')
+    link_check.add_argument('--per-host', type=int, default=4,
+                            help='Max simultaneous requests per host (default: 4)')
+    link_check.add_argument('--timeout', type=int, default=10, help='Per-request timeout in seconds')
+    link_check.add_argument('--force', action='store_true', help='Recheck links even if cached')
+    link_check.add_argument('--all', action='store_true', help='Also list healthy links')
+    link_check.add_argument('--format', choices=['json', 'markdown'], default='markdown', help='Output format')
+    link_check.add_argument('--link-store', type=str, default=str(LINK_STORE_PATH),
+                            help='Path to the link check cache (default: .cache/tooling/links.sqlite3)')
+    link_check.set_defaults(handler=run_links)
+
+    topic_parser = subparsers.add_parser('topics', help='Cluster collected and archived items by topic')
+    topic_parser.add_argument('results_files', nargs='*',
+                              help='JSON output of companies/posts runs to include')
+    topic_parser.add_argument('--days', type=int, default=30,
+                              help='Archive days to include, ending at --until (default: 30)')
+    topic_parser.add_argument('--since', type=str, help='First archive day (YYYY-MM-DD)')
+    topic_parser.add_argument('--until', type=str, help='Last archive day (YYYY-MM-DD, default: today)')
+    topic_parser.add_argument('--updates-dir', type=str, default=DEFAULT_UPDATES_DIR,
+                              help='Directory of daily updates to read archived items from')
+    topic_parser.add_argument('--skip-updates', action='store_true',
+                              help='Only cluster the given results files')
+    topic_parser.add_argument('--threshold', type=float, default=0.3,
+                              help='Cosine similarity that links two items (default: 0.3)')
+    topic_parser.add_argument('--min-size', type=int, default=2,
+                              help='Smallest topic to report (default: 2)')
+    topic_parser.add_argument('--representatives', type=int, default=3,
+                              help='Representative items shown per topic (default: 3)')
+    topic_parser.add_argument('--format', choices=['json', 'markdown'], default='markdown',
+                              help='Output format')
+    topic_parser.set_defaults(handler=run_topics)
+
+    dispatch_parser = subparsers.add_parser(
+        'dispatch', help='Backfill missing daily updates by dispatching workflow runs')
+    dispatch_parser.add_argument('--since', type=str, required=True,
+                                 help='First date to check (YYYY-MM-DD)')
+    dispatch_parser.add_argument('--until', type=str,
+                                 help='Last date to check (YYYY-MM-DD, default: yesterday)')
+    dispatch_parser.add_argument('--updates-dir', type=str, default=DEFAULT_UPDATES_DIR,
+                                 help='Directory of daily updates to scan for gaps')
+    dispatch_parser.add_argument('--missing-only', action='store_true',
+                                 help='Leave "No Meaningful PM-Relevant Updates Today" stubs alone')
+    dispatch_parser.add_argument('--concurrency', type=int, default=1,
+                                 help='Runs queued or in progress at once (default: 1; '
+                                      'concurrent runs collect overlapping windows and can '
+                                      'repeat items between dates)')
+    dispatch_parser.add_argument('--poll-interval', type=float, default=15,
+                                 help='Initial seconds between status polls; doubles while '
+                                      'nothing changes (default: 15)')
+    dispatch_parser.add_argument('--state', type=str, default=str(DISPATCH_STATE_PATH),
+                                 help='State file for resuming (default: '
+                                      '.cache/tooling/dispatch-state.json)')
+    dispatch_parser.add_argument('--dry-run', action='store_true',
+                                 help='List the missing dates without dispatching')
+    dispatch_parser.add_argument('--repo', type=str, default='madsford22-coder/ai-pm-research',
+                                 help='Repository (owner/name)')
+    dispatch_parser.add_argument('--ref', type=str, default='main', help='Branch to run on')
+    dispatch_parser.add_argument('--api-url', type=str, default='https://api.github.com',
+                                 help='GitHub API base URL')
+    dispatch_parser.set_defaults(handler=run_dispatch)
+
+    scale_parser = subparsers.add_parser(
+        'scale', help='Synthetic roster fixtures and a scaling curve for parsers and collectors')
+    scale_parser.add_argument('action', choices=['report', 'serve'],
+                              help='report: measure every entry point at each scale; '
+                                   'serve: write fixture files and serve their feeds')
+    scale_parser.add_argument('--scales', type=str, default='1,10,100,1000',
+                              help='Comma-separated multiples of today\'s roster to measure '
+                                   '(default: 1,10,100,1000)')
+    scale_parser.add_argument('--checker-max-scale', type=int, default=10,
+                              help='Largest scale to run the collectors at, which fetch every '
+                                   'source in turn (default: 10; 0 skips them)')
+    scale_parser.add_argument('--format', choices=['json', 'markdown'], default='markdown',
+                              help='Output format')
+    scale_parser.add_argument('--scale', type=int, default=10,
+                              help='Multiple of today\'s roster for `serve` (default: 10)')
+    scale_parser.add_argument('--out', type=str, default=str(CACHE_DIR / 'scale'),
+                              help='Directory for the `serve` fixture files')
+    scale_parser.add_argument('--port', type=int, default=0,
+                              help='Port for `serve` (default: any free port)')
+    scale_parser.set_defaults(handler=run_scale)
+
+    for subparser in subparsers.choices.values():
+        _add_profile_arguments(subparser)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, 'shard', None) and getattr(args, 'budget', None):
+        parser.error('--shard and --budget cannot be combined')
+    if getattr(args, 'shard', None) and getattr(args, 'articles', False):
+        parser.error('--shard and --articles cannot be combined; use merge --articles')
+    if args.profile_collapsed and not args.profile:
+        parser.error('--profile-collapsed requires --profile')
+    if args.profile:
+        from tooling.profiling import profile_call
+
+        return profile_call(args.handler, args, stats_path=args.profile,
+                            collapsed_path=args.profile_collapsed, top=args.profile_top)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Check recent product updates from tracked companies in context/companies.md.
+
+1. Parses context/companies.md to find companies and their primary sources
+2. Checks RSS feeds from company blogs (known and annotated feeds, then discovery)
+3. Scrapes the listing pages of sources annotated ``(feed_url: scrape)``
+4. Fetches each feed once per run however it is spelled (see
+   ``tooling.fetchplan``), and lists each post once per company
+5. Formats recent updates as markdown or JSON
+
+Note: Changelog scraping would require Puppeteer and is more complex.
+For now, this focuses on RSS feeds which are more reliable.
+"""
+
+import json
+import sys
+
+from tooling.context import SCRAPE
+from tooling.feeds import check_rss_feed, try_find_rss_feed
+from tooling.fetchplan import SharedFetches, feed_key
+from tooling.stages import stage
+
+
+def company_sources(company):
+    """(kind, url) for every source of a company, in check order.
+
+    Known feeds first, then listing pages marked for scraping, then feed
+    discovery on the remaining blogs. Blogs with a ``feed_url:`` annotation are
+    never probed: their feed is already in ``rss_feeds``, or they have none.
+    """
+    feed_urls = company.get('feed_urls', {})
+    return [('rss', url) for url in company.get('rss_feeds', [])] + \
+           [('scrape', url) for url, feed_url in feed_urls.items() if feed_url == SCRAPE] + \
+           [('blog', url) for url in company['blogs'] if url not in feed_urls]
+
+
+def check_company_source(company, kind, url, days_back=7, push=None, deadline=None,
+                         fetches=None):
+    """Check one company source. Returns (updates, errors).
+
+    Sources checked through the same ``tooling.fetchplan.SharedFetches`` share
+    feed fetches, listing-page scrapes and discovery with every equivalent source.
+    """
+    fetches = fetches or SharedFetches()
+
+    def fetch(feed_url):
+        return check_rss_feed(feed_url, days_back, include_undated=True, push=push,
+                              deadline=deadline, redirects=fetches.redirects)
+
+    if kind == 'rss':
+        posts, error = fetches.feed(url, fetch)
+        if error:
+            return [], [f"{url}: {error}"]
+        return [{**post, 'source': 'rss', 'source_url': url} for post in posts or []], []
+
+    if kind == 'scrape':
+        from tooling.scrape import scrape_listing
+
+        # Listing pages always show the back catalogue, so undated cards aren't news
+        posts, error = fetches.scrape(url, lambda page_url: scrape_listing(page_url, days_back,
+                                                                           deadline=deadline))
+        if error:
+            return [], [f"{url}: {error}"]
+        return [{**post, 'source': 'scrape', 'source_url': url} for post in posts or []], []
+
+    # Check blogs via RSS discovery
+    rss_feed = fetches.discover(url, lambda blog_url: try_find_rss_feed(blog_url,
+                                                                        deadline=deadline))
+    if not rss_feed:
+        # Only report as error if we don't have a known feed
+        return [], [] if company.get('rss_feeds') else [f"{url}: No RSS feed found"]
+    posts, error = fetches.feed(rss_feed, fetch)
+    if error:
+        return [], [f"{url}: {error}"]
+    return [{**post, 'source': 'blog', 'source_url': url} for post in posts or []], []
+
+
+def unique_updates(updates):
+    """Drop repeats of a post found through several of a company's sources (first wins)."""
+    seen = set()
+    unique = []
+    for update in updates:
+        key = feed_key(update['link']) if update.get('link') else None
+        if key in seen:
+            continue
+        if key:
+            seen.add(key)
+        unique.append(update)
+    return unique
+
+
+def check_company_updates(company, days_back=7, push=None, fetches=None):
+    """Check recent updates for a company."""
+    updates = []
+    errors = []
+
+    for kind, url in company_sources(company):
+        source_updates, source_errors = check_company_source(company, kind, url, days_back, push,
+                                                             fetches=fetches)
+        updates.extend(source_updates)
+        errors.extend(source_errors)
+
+    # Note: Changelog scraping would require Puppeteer
+    # For now, we skip changelogs and focus on RSS feeds
+
+    return unique_updates(updates), errors
+
+
+def collect_company_updates(companies, days_back=7, push=None, fetches=None, log=sys.stderr):
+    """Check every company and build the results list used by ``format_output``."""
+    fetches = fetches or SharedFetches()
+    results = []
+    for company in companies:
+        print(f"Checking {company['name']}...", file=log)
+        updates, errors = check_company_updates(company, days_back=days_back, push=push,
+                                                fetches=fetches)
+
+        results.append({
+            'name': company['name'],
+            'category': company['category'],
+            'updates': updates,
+            'errors': errors,
+        })
+
+        if updates:
+            print(f"  ✓ Found {len(updates)} updates", file=log)
+        if errors:
+            print(f"  ⚠ {len(errors)} errors:", file=log)
+            for error in errors[:2]:  # Show first 2 errors
+                print(f"    - {error}", file=log)
+
+    print(f"Feeds: {fetches.summary()}", file=log)
+    return results
+
+
+@stage('format')
+def format_output(results, output_format='json', coverage=None):
+    """Format results for output.
+
+    ``coverage`` (from a ``--budget`` run) labels the output: JSON becomes
+    ``{"coverage": ..., "results": [...]}`` and markdown gets a coverage line.
+    """
+    if output_format == 'json':
+        if coverage:
+            return json.dumps({'coverage': coverage, 'results': results}, indent=2,
+                              ensure_ascii=False)
+        return json.dumps(results, indent=2, ensure_ascii=False)
+    elif output_format == 'markdown':
+        output = "# Recent Company Updates\n\n"
+        if coverage:
+            from tooling.budget import coverage_line
+            output += coverage_line(coverage) + "\n\n"
+        for result in results:
+            if result['updates']:
+                output += f"## {result['name']}\n"
+                if result['category']:
+                    output += f"*Category: {result['category']}*\n\n"
+
+                for update in result['updates']:
+                    output += f"### {update['title']}\n"
+                    output += f"**Link:** {update['link']}\n"
+                    if update['published']:
+                        output += f"**Published:** {update['published']}\n"
+                    output += f"**Source:** {update['source']} ({update['source_url']})\n"
+                    if update['summary']:
+                        output += f"**Summary:** {update['summary']}\n"
+                    if update.get('article'):
+                        from tooling.articles import article_markdown
+                        output += article_markdown(update['article'])
+                    output += "\n"
+        return output
+    else:
+        return str(results)
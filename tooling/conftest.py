@@ -0,0 +1,35 @@
+"""
+Shared fixtures for the tooling tests: local HTTP stand-ins
+"""
+
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from tooling.testing import route_handler
+
+
+@pytest.fixture
+def local_server():
+    """Start servers on free localhost ports for the test; stopped and closed afterwards.
+
+    Call it with a routes dict (see ``testing.route_handler``), a request
+    handler class, or an unstarted server such as ``websub.make_server``.
+    Returns the server's base URL.
+    """
+    servers = []
+
+    def start(handler):
+        if isinstance(handler, dict):
+            handler = route_handler(handler)
+        server = handler if isinstance(handler, ThreadingHTTPServer) else \
+            ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,160 @@
+"""
+Parsers for the long-lived context files (context/companies.md, context/people.md).
+
+Pure Python only - no network and no third-party imports.
+"""
+
+import re
+
+from tooling.stages import stage
+
+URL_PATTERN = re.compile(r'https?://[^\s\)]+')
+# "- https://example.com/blog (feed_url: https://example.com/rss.xml)" or "(feed_url: scrape)"
+FEED_ANNOTATION = re.compile(r'\(feed_url:\s*([^)\s]+)\s*\)')
+SCRAPE = 'scrape'
+
+# Known RSS feeds (can be expanded)
+KNOWN_FEEDS = {
+    'LangChain / LangSmith': ['https://blog.langchain.dev/feed'],
+    'GitHub': ['https://github.blog/feed/'],
+}
+
+
+def _split_sections(file_path):
+    """Read a context file and split it into ``## Name`` sections (header skipped)."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    return re.split(r'\n## ', content)[1:]
+
+
+@stage('parse_context')
+def parse_companies_file(companies_file_path):
+    """Parse companies.md to extract company info including blogs and changelogs.
+
+    ``feed_urls`` maps each primary source annotated with ``(feed_url: ...)`` to
+    its feed URL, or to ``'scrape'`` for pages with no feed. Annotated feed URLs
+    are also listed in ``rss_feeds``.
+    """
+    companies = []
+
+    for section in _split_sections(companies_file_path):
+        lines = section.split('\n')
+        name = lines[0].strip()
+
+        company = {
+            'name': name,
+            'blogs': [],
+            'rss_feeds': [],
+            'changelogs': [],
+            'feed_urls': {},
+            'category': None,
+        }
+
+        # Check for known RSS feeds
+        if name in KNOWN_FEEDS:
+            company['rss_feeds'] = list(KNOWN_FEEDS[name])
+
+        # Extract category
+        category_match = re.search(r'\*\*Category:\*\* (.+)', section)
+        if category_match:
+            company['category'] = category_match.group(1)
+
+        # Extract primary sources
+        in_primary_sources = False
+        for line in lines:
+            if '**Primary sources:**' in line:
+                in_primary_sources = True
+                continue
+            if in_primary_sources:
+                # Stop at next section or empty line after sources
+                if line.strip() == '' and company['blogs']:
+                    break
+                if line.startswith('---'):
+                    break
+
+                # The annotation names the page's feed; the rest of the line is the page
+                annotation = FEED_ANNOTATION.search(line)
+                if annotation:
+                    line = line[:annotation.start()] + line[annotation.end():]
+                    page = URL_PATTERN.search(line)
+                    if page:
+                        feed_url = annotation.group(1)
+                        company['feed_urls'][page.group(0).rstrip(',')] = feed_url
+                        if feed_url != SCRAPE and feed_url not in company['rss_feeds']:
+                            company['rss_feeds'].append(feed_url)
+
+                # Extract URLs
+                for url in URL_PATTERN.findall(line):
+                    clean_url = url.rstrip(')').rstrip(',')
+                    lower_url = clean_url.lower()
+
+                    # Check if it's an RSS feed
+                    if any(x in lower_url for x in ['/feed', '/rss', '/atom']):
+                        company['rss_feeds'].append(clean_url)
+                    # Categorize URLs
+                    elif 'changelog' in lower_url or 'release-notes' in lower_url:
+                        company['changelogs'].append(clean_url)
+                    elif 'blog' in lower_url or 'news' in lower_url or 'updates' in lower_url:
+                        company['blogs'].append(clean_url)
+                    elif 'twitter.com' in clean_url or 'x.com' in clean_url:
+                        pass  # Skip Twitter for now
+                    elif 'docs' not in lower_url:
+                        # Default to blog if not clearly a changelog
+                        company['blogs'].append(clean_url)
+
+        if company['blogs'] or company['changelogs'] or company['rss_feeds']:
+            companies.append(company)
+
+    return companies
+
+
+@stage('parse_context')
+def parse_people_file(people_file_path):
+    """Parse people.md to extract person info (blog, RSS feed, newsletter, LinkedIn, Twitter)."""
+    people = []
+
+    for section in _split_sections(people_file_path):
+        lines = section.split('\n')
+        name = lines[0].strip()
+
+        person = {
+            'name': name,
+            'blog': None,
+            'rss_feed': None,
+            'newsletter': None,
+            'linkedin': None,
+            'twitter': None,
+        }
+
+        # Extract fields
+        for line in lines:
+            if 'Blog:' in line or 'blog:' in line:
+                match = URL_PATTERN.search(line)
+                if match:
+                    person['blog'] = match.group(0)
+            elif 'RSS Feed:' in line or 'rss feed:' in line or 'RSS:' in line:
+                match = URL_PATTERN.search(line)
+                if match:
+                    person['rss_feed'] = match.group(0).rstrip(')')
+            elif 'Newsletter:' in line or 'newsletter:' in line:
+                match = URL_PATTERN.search(line)
+                if match:
+                    person['newsletter'] = match.group(0)
+            elif 'LinkedIn:' in line or 'linkedin:' in line:
+                match = URL_PATTERN.search(line)
+                if match:
+                    person['linkedin'] = match.group(0)
+            elif 'Twitter/X:' in line or 'Twitter:' in line:
+                match = re.search(r'@[\w]+', line)
+                if match:
+                    person['twitter'] = match.group(0)
+
+        people.append(person)
+
+    return people
+
+
+def people_with_sources(people):
+    """Keep only people with a blog, RSS feed, or newsletter to check."""
+    return [p for p in people if p['blog'] or p['rss_feed'] or p['newsletter']]
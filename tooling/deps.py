@@ -0,0 +1,24 @@
+"""
+Lazy loading of optional third-party dependencies.
+"""
+
+import importlib
+
+# Module name -> pip package name, for install hints
+PIP_PACKAGES = {
+    'bs4': 'beautifulsoup4',
+    'feedparser': 'feedparser',
+    'numpy': 'numpy',
+    'requests': 'requests',
+    'scipy': 'scipy',
+}
+
+
+def require(module_name):
+    """Import a dependency on first use, exiting with an install hint if it is missing."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        top_level = module_name.split('.')[0]
+        package = PIP_PACKAGES.get(top_level, top_level)
+        raise SystemExit(f"Error: {package} not installed. Install with: pip install {package}")
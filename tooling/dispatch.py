@@ -0,0 +1,263 @@
+"""
+Batch backfill of missing daily updates through GitHub Actions.
+
+``scripts/trigger-workflow.py`` dispatches one ``daily-update.yml`` run for
+today. ``dispatch`` fills every gap in the archive instead:
+
+1. Scans updates/daily/YYYY locally for dates between ``--since`` and
+   ``--until`` that have no update file, or only a "No Meaningful PM-Relevant
+   Updates Today" stub
+2. Dispatches the workflow with a ``date`` input for each, oldest first, with
+   at most ``--concurrency`` runs queued or in progress at once (one by
+   default: see ``DEFAULT_CONCURRENCY``)
+3. Polls the workflow's run list with exponential backoff and ETag-conditional
+   requests (a ``304 Not Modified`` doesn't count against the rate limit),
+   matching runs to dates by their ``Backfill YYYY-MM-DD`` run name
+4. Writes every date's state to a JSON state file as it changes, so an
+   interrupted backfill resumes without dispatching anything twice
+
+``--api-url`` points the client at any server implementing the two endpoints
+used (the tests run against a local stand-in).
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from tooling import DISPATCH_STATE_PATH
+from tooling.deps import require
+
+API_URL = 'https://api.github.com'
+REPO = 'madsford22-coder/ai-pm-research'
+WORKFLOW = 'daily-update.yml'
+DEFAULT_REF = 'main'
+# A backfilled run collects everything from its date up to today, so runs for
+# neighbouring dates see the same items. Run one at a time, each run can see
+# the updates committed before it and skip what they already cover. Concurrent
+# runs can't, and both dates end up with the same items.
+DEFAULT_CONCURRENCY = 1
+POLL_INTERVAL = 15
+MAX_POLL_INTERVAL = 240
+# A dispatched run that hasn't shown up in the run list by then is retried
+RUN_APPEAR_TIMEOUT = 600
+MAX_ATTEMPTS = 2
+
+STUB_TITLE = 'title: "No Meaningful PM-Relevant Updates Today"'
+RUN_NAME = 'Backfill {date}'
+
+# Date states: pending -> dispatched -> queued/in_progress -> completed
+DONE = 'completed'
+
+
+def missing_dates(updates_dir, since, until, include_stubs=True):
+    """Dates in ``since``..``until`` (inclusive) with no daily update, oldest first.
+
+    With ``include_stubs``, dates whose update is the "No Meaningful
+    PM-Relevant Updates Today" stub count as missing too.
+    """
+    updates_dir = Path(updates_dir)
+    missing = []
+    day = since
+    while day <= until:
+        path = updates_dir / str(day.year) / f"{day.isoformat()}.md"
+        if not path.exists():
+            missing.append(day)
+        elif include_stubs and STUB_TITLE in path.read_text(encoding='utf-8')[:500]:
+            missing.append(day)
+        day += timedelta(days=1)
+    return missing
+
+
+class DispatchState:
+    """Per-date backfill state in a JSON file, rewritten atomically on every change."""
+
+    def __init__(self, path=DISPATCH_STATE_PATH):
+        self.path = Path(path)
+        self.dates = {}
+        if self.path.exists():
+            self.dates = json.loads(self.path.read_text(encoding='utf-8'))
+
+    def get(self, day):
+        return self.dates.get(day.isoformat() if isinstance(day, date) else day)
+
+    def update(self, day, **fields):
+        key = day.isoformat() if isinstance(day, date) else day
+        self.dates.setdefault(key, {}).update(fields)
+        self.save()
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix('.tmp')
+        temporary.write_text(json.dumps(self.dates, indent=2, sort_keys=True), encoding='utf-8')
+        os.replace(temporary, self.path)
+
+
+class ActionsClient:
+    """The two GitHub Actions REST calls a backfill needs: dispatch, and list runs."""
+
+    def __init__(self, token, repo=REPO, workflow=WORKFLOW, api_url=API_URL):
+        requests = require('requests')
+        self.base = f"{api_url.rstrip('/')}/repos/{repo}/actions/workflows/{workflow}"
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Accept': 'application/vnd.github+json',
+            'Authorization': f"token {token}",
+        })
+        self.requests = 0
+        self.not_modified = 0
+        self._cached = {}
+
+    def dispatch(self, ref, inputs):
+        """Start a workflow run. Returns an error message, or None."""
+        requests = require('requests')
+        self.requests += 1
+        try:
+            response = self.session.post(f"{self.base}/dispatches", timeout=30,
+                                         json={'ref': ref, 'inputs': inputs})
+        except requests.exceptions.RequestException as e:
+            return f"Error dispatching workflow: {str(e)}"
+        if response.status_code != 204:
+            return f"HTTP {response.status_code}: {response.text[:200]}"
+        return None
+
+    def list_runs(self, created_since):
+        """Dispatched runs created on or after ``created_since``. Returns (runs, changed, error).
+
+        The previous response's ETag is sent as If-None-Match; on a 304 the
+        cached runs are returned with ``changed`` False.
+        """
+        requests = require('requests')
+        params = {'event': 'workflow_dispatch', 'created': f">={created_since.isoformat()}",
+                  'per_page': 100}
+        key = params['created']
+        etag, runs = self._cached.get(key, (None, []))
+        headers = {'If-None-Match': etag} if etag else {}
+        self.requests += 1
+        try:
+            response = self.session.get(f"{self.base}/runs", params=params, headers=headers,
+                                        timeout=30)
+        except requests.exceptions.RequestException as e:
+            return runs, False, f"Error listing runs: {str(e)}"
+        if response.status_code == 304:
+            self.not_modified += 1
+            return runs, False, None
+        if response.status_code != 200:
+            return runs, False, f"HTTP {response.status_code}: {response.text[:200]}"
+        runs = response.json().get('workflow_runs', [])
+        self._cached[key] = (response.headers.get('ETag'), runs)
+        return runs, True, None
+
+
+def _match_runs(runs, state, in_flight):
+    """Update in-flight dates from the run list. Returns True if any date changed."""
+    changed = False
+    by_title = {}
+    for run in sorted(runs, key=lambda run: run['id']):
+        by_title[run.get('display_title') or run.get('name')] = run
+    for day in list(in_flight):
+        entry = state.get(day)
+        run = by_title.get(RUN_NAME.format(date=day))
+        if run is None or run['id'] in entry.get('failed_runs', []):
+            continue
+        fields = {'run_id': run['id'], 'status': run['status'], 'url': run.get('html_url')}
+        if run['status'] == DONE:
+            fields['conclusion'] = run.get('conclusion')
+        if any(entry.get(name) != value for name, value in fields.items()):
+            state.update(day, **fields)
+            changed = True
+    return changed
+
+
+def backfill_dates(client, dates, state, concurrency=DEFAULT_CONCURRENCY, ref=DEFAULT_REF,
+                   poll_interval=POLL_INTERVAL, max_interval=MAX_POLL_INTERVAL,
+                   sleep=time.sleep, clock=time.time, log=sys.stderr):
+    """Dispatch and follow a workflow run per date. Returns {date string: state entry}.
+
+    Dates already completed successfully in ``state`` are skipped, and dates
+    dispatched by an earlier, interrupted call are followed rather than
+    dispatched again. Failed runs are dispatched again, up to
+    ``MAX_ATTEMPTS`` times in total.
+    """
+    days = [day.isoformat() if isinstance(day, date) else day for day in dates]
+    queue, in_flight = [], []
+    for day in days:
+        entry = state.get(day) or {}
+        if entry.get('status') == DONE and entry.get('conclusion') == 'success':
+            continue
+        if entry.get('status') not in (None, 'pending', DONE):
+            in_flight.append(day)
+        elif entry.get('attempts', 0) < MAX_ATTEMPTS:
+            queue.append(day)
+    print(f"Backfilling {len(queue) + len(in_flight)} of {len(days)} dates "
+          f"({len(in_flight)} already dispatched), {concurrency} at a time", file=log)
+
+    interval = poll_interval
+    while queue or in_flight:
+        while queue and len(in_flight) < concurrency:
+            day = queue.pop(0)
+            entry = state.get(day) or {}
+            failed_runs = entry.get('failed_runs', [])
+            if entry.get('run_id') and entry.get('conclusion') != 'success':
+                failed_runs = failed_runs + [entry['run_id']]
+            error = client.dispatch(ref, {'date': day})
+            if error:
+                print(f"  ✗ {day}: {error}", file=log)
+                state.update(day, status=DONE, conclusion='dispatch_failed', error=error,
+                             attempts=entry.get('attempts', 0) + 1)
+                continue
+            print(f"  → {day}: dispatched", file=log)
+            state.update(day, status='dispatched', conclusion=None, run_id=None, error=None,
+                         dispatched_at=clock(), attempts=entry.get('attempts', 0) + 1,
+                         failed_runs=failed_runs)
+            in_flight.append(day)
+        if not in_flight:
+            break
+
+        sleep(interval)
+        earliest = min(state.get(day)['dispatched_at'] for day in in_flight)
+        # Run timestamps are UTC; a day of slack covers clock skew
+        created_since = datetime.fromtimestamp(earliest, timezone.utc).date() - timedelta(days=1)
+        runs, listed, error = client.list_runs(created_since)
+        if error:
+            print(f"  ⚠ {error}", file=log)
+        changed = listed and _match_runs(runs, state, in_flight)
+
+        for day in list(in_flight):
+            entry = state.get(day)
+            if entry['status'] == DONE:
+                in_flight.remove(day)
+                mark = '✓' if entry['conclusion'] == 'success' else '✗'
+                print(f"  {mark} {day}: {entry['conclusion']} {entry.get('url') or ''}".rstrip(),
+                      file=log)
+                if entry['conclusion'] != 'success' and entry.get('attempts', 0) < MAX_ATTEMPTS:
+                    queue.append(day)
+            elif (entry.get('run_id') is None and
+                  clock() - entry['dispatched_at'] > RUN_APPEAR_TIMEOUT):
+                in_flight.remove(day)
+                state.update(day, status=DONE, conclusion='run_not_found')
+                print(f"  ✗ {day}: no run appeared", file=log)
+                if entry.get('attempts', 0) < MAX_ATTEMPTS:
+                    queue.append(day)
+
+        # Back off while nothing moves; poll promptly again once something does
+        interval = poll_interval if changed else min(interval * 2, max_interval)
+
+    return {day: state.get(day) for day in days}
+
+
+def format_summary(outcomes):
+    """One line per date, then totals."""
+    lines = []
+    succeeded = 0
+    for day, entry in sorted(outcomes.items()):
+        if entry is None:
+            continue
+        conclusion = entry.get('conclusion') or entry.get('status')
+        succeeded += conclusion == 'success'
+        url = f" {entry['url']}" if entry.get('url') else ""
+        lines.append(f"{day}  {conclusion}{url}")
+    lines.append(f"\n{succeeded} of {len(outcomes)} dates backfilled")
+    return '\n'.join(lines)
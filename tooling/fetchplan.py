@@ -0,0 +1,133 @@
+"""
+Fetch planning: equivalent feed URLs are fetched once per run.
+
+A company can list a known feed and a blog whose discovered feed is the same
+resource spelled differently (``http``/``https``, ``/feed`` vs ``/feed/``, or
+behind a redirect), and people and companies share hosts. So:
+
+1. ``feed_key`` normalises a URL beyond ``canonicalize_url``: the scheme and a
+   trailing slash don't make a different resource
+2. ``RedirectMap`` learns permanent redirect chains from fetched responses and
+   keeps them in the item store, so on later runs a URL known to redirect is
+   keyed by its final location before any request is made
+3. ``SharedFetches`` runs one fetch per key (concurrent callers wait for the
+   first) and hands the result to every source that asked for it
+"""
+
+import threading
+from urllib.parse import urlparse, urlunparse
+
+from tooling.urls import canonicalize_url
+
+# Only these are safe to remember: 302/303/307 may point elsewhere next time
+PERMANENT_REDIRECTS = {301, 308}
+MAX_HOPS = 10
+
+
+def feed_key(url):
+    """Key under which equivalent spellings of a URL compare equal.
+
+    ``https://Example.com/feed/`` and ``http://example.com/feed`` share the key
+    ``example.com/feed``.
+    """
+    parsed = urlparse(canonicalize_url(url))
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse(('', parsed.netloc, path, '', parsed.query, '')).lstrip('/')
+
+
+class RedirectMap:
+    """Permanent redirects seen so far, by ``feed_key``; persisted in an ItemStore if given."""
+
+    def __init__(self, store=None):
+        self.store = store
+        self._lock = threading.Lock()
+        self._targets = store.redirects() if store else {}
+
+    def resolve(self, url):
+        """The final URL that ``url`` is known to redirect to (``url`` itself if none)."""
+        seen = set()
+        key = feed_key(url)
+        with self._lock:
+            while key in self._targets and key not in seen and len(seen) < MAX_HOPS:
+                seen.add(key)
+                url = self._targets[key]
+                key = feed_key(url)
+        return url
+
+    def key(self, url):
+        return feed_key(self.resolve(url))
+
+    def learn(self, response):
+        """Record the permanent hops of a ``requests`` response's redirect chain."""
+        hops = [hop.url for hop in response.history] + [response.url]
+        for hop, target, status in zip(hops, hops[1:], (hop.status_code for hop in response.history)):
+            key = feed_key(hop)
+            if status not in PERMANENT_REDIRECTS or key == feed_key(target):
+                continue
+            with self._lock:
+                if self._targets.get(key) == target:
+                    continue
+                self._targets[key] = target
+            if self.store:
+                self.store.save_redirect(key, target)
+
+
+class SharedFetches:
+    """One fetch per equivalent URL for the length of a collection run.
+
+    Use one instance per run and per kind of check: results are shared by URL
+    key only, so every caller must ask for the same thing (same ``days_back``
+    and entry limits).
+    """
+
+    def __init__(self, redirects=None):
+        self.redirects = redirects or RedirectMap()
+        self.requested = 0
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @property
+    def fetched(self):
+        return len(self._entries)
+
+    def _once(self, key, func):
+        with self._lock:
+            self.requested += 1
+            entry = self._entries.get(key)
+            owner = entry is None
+            if owner:
+                entry = self._entries[key] = {'done': threading.Event(), 'value': None}
+        if owner:
+            try:
+                entry['value'] = func()
+            finally:
+                entry['done'].set()
+        else:
+            entry['done'].wait()
+        return entry['value']
+
+    def _posts(self, kind, source_url, fetch):
+        url = self.redirects.resolve(source_url)
+        result = self._once((kind, feed_key(url)), lambda: fetch(url))
+        posts, error = result if result else (None, "Fetch failed")
+        return ([dict(post) for post in posts] if posts else posts), error
+
+    def feed(self, feed_url, fetch):
+        """``fetch(url)`` -> (posts, error), run once per equivalent feed URL.
+
+        Every caller gets its own copy of the posts, so they can be annotated
+        independently.
+        """
+        return self._posts('feed', feed_url, fetch)
+
+    def scrape(self, page_url, scrape):
+        """``scrape(url)`` -> (posts, error), run once per equivalent listing page URL."""
+        return self._posts('scrape', page_url, scrape)
+
+    def discover(self, blog_url, find):
+        """``find(url)`` -> feed URL or None, run once per equivalent blog URL."""
+        url = self.redirects.resolve(blog_url)
+        return self._once(('discover', feed_key(url)), lambda: find(url))
+
+    def summary(self):
+        return f"{self.fetched} fetches for {self.requested} requests"
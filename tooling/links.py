@@ -0,0 +1,209 @@
+"""
+Link health checks for the context files and the published update archive.
+
+1. Extracts every URL from context/people.md and context/companies.md, and
+   every ``**Source:**`` URL from updates/daily/**/*.md
+2. Dedups them by canonical form (see ``tooling.urls.canonicalize_url``)
+3. Checks stale links concurrently (HEAD, falling back to GET), following
+   redirects, with a per-host cap
+4. Caches results with a TTL so reruns only recheck stale links
+5. Reports dead and redirected links with where they appear
+"""
+
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from tooling import LINK_STORE_PATH
+from tooling.deps import require
+from tooling.limits import HostLimiter
+from tooling.resources import open_sqlite, thread_session
+from tooling.stages import stage
+from tooling.urls import canonicalize_url, extract_urls
+
+DEFAULT_WORKERS = 32
+DEFAULT_PER_HOST = 4
+DEFAULT_TIMEOUT = 10
+# Healthy links are rechecked weekly; broken ones daily, in case they recover
+TTL_OK = 7 * 24 * 3600
+TTL_BROKEN = 24 * 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS link_checks (
+    url TEXT PRIMARY KEY,
+    status INTEGER,
+    final_url TEXT,
+    redirects TEXT,
+    error TEXT,
+    checked_at REAL,
+    expires_at REAL
+);
+"""
+
+
+@stage('parse_context')
+def collect_links(context_files=(), updates_dir=None):
+    """Map canonical URL -> {'url': first spelling seen, 'locations': ['file:line', ...]}."""
+    links = {}
+
+    def add(url, location):
+        canonical = canonicalize_url(url)
+        entry = links.setdefault(canonical, {'url': url, 'locations': []})
+        entry['locations'].append(location)
+
+    for path in context_files:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                for url in extract_urls(line):
+                    add(url, f"{path}:{line_number}")
+
+    if updates_dir:
+        for path in sorted(Path(updates_dir).glob('**/*.md')):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    if '**Source:**' in line:
+                        for url in extract_urls(line):
+                            add(url, f"{path}:{line_number}")
+
+    return links
+
+
+class LinkStore:
+    """SQLite cache of link check results with per-result expiry."""
+
+    def __init__(self, path=LINK_STORE_PATH):
+        self.path = str(path)
+        self._conn, self._lock = open_sqlite(self.path, SCHEMA)
+
+    def get(self, url):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM link_checks WHERE url = ?", (url,)).fetchone()
+        if not row:
+            return None
+        result = dict(row)
+        result['redirects'] = json.loads(result['redirects'] or '[]')
+        return result
+
+    def is_fresh(self, url, now=None):
+        result = self.get(url)
+        return bool(result) and result['expires_at'] > (now or time.time())
+
+    def save(self, result):
+        ttl = TTL_BROKEN if classify(result) == 'dead' else TTL_OK
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO link_checks VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (result['url'], result['status'], result['final_url'],
+                 json.dumps(result['redirects']), result['error'], result['checked_at'],
+                 result['checked_at'] + ttl))
+
+
+@stage('fetch')
+def check_link(url, timeout=DEFAULT_TIMEOUT):
+    """Check one URL: HEAD first, then GET if HEAD fails or is refused."""
+    requests = require('requests')
+    session = thread_session()
+    result = {'url': url, 'status': None, 'final_url': None, 'redirects': [], 'error': None,
+              'checked_at': time.time()}
+
+    response = None
+    try:
+        response = session.head(url, timeout=timeout, allow_redirects=True)
+    except requests.exceptions.RequestException:
+        pass
+
+    # Many servers reject HEAD (405/403/501) or bots on HEAD only; confirm with GET
+    if response is None or response.status_code >= 400:
+        try:
+            response = session.get(url, timeout=timeout, allow_redirects=True, stream=True)
+            response.close()
+        except requests.exceptions.RequestException as e:
+            result['error'] = str(e)
+            return result
+
+    result['status'] = response.status_code
+    result['final_url'] = response.url
+    result['redirects'] = [r.url for r in response.history]
+    return result
+
+
+def classify(result):
+    """'dead', 'redirected' or 'ok'."""
+    if result['error'] or result['status'] is None or result['status'] >= 400:
+        return 'dead'
+    if result['final_url'] and canonicalize_url(result['final_url']) != canonicalize_url(result['url']):
+        return 'redirected'
+    return 'ok'
+
+
+def check_links(urls, store, workers=DEFAULT_WORKERS, per_host=DEFAULT_PER_HOST,
+                timeout=DEFAULT_TIMEOUT, force=False, log=sys.stderr):
+    """Check every URL whose cached result is missing or expired. Returns url -> result."""
+    now = time.time()
+    to_check = [url for url in urls if force or not store.is_fresh(url, now)]
+    print(f"Checking {len(to_check)} of {len(urls)} links "
+          f"({len(urls) - len(to_check)} cached)...", file=log)
+
+    limiter = HostLimiter(per_host)
+
+    def run(url):
+        with limiter.slot(url):
+            return check_link(url, timeout)
+
+    done = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run, url) for url in to_check]
+        for future in as_completed(futures):
+            store.save(future.result())
+            done += 1
+            if done % 100 == 0:
+                print(f"  {done}/{len(to_check)} checked", file=log)
+
+    return {url: store.get(url) for url in urls}
+
+
+@stage('format')
+def format_report(links, results, output_format='markdown', only_problems=True):
+    """Report dead and redirected links (or every link) with their locations."""
+    rows = []
+    for canonical, link in links.items():
+        result = results[link['url']]
+        state = classify(result)
+        if only_problems and state == 'ok':
+            continue
+        rows.append({
+            'url': link['url'],
+            'state': state,
+            'status': result['status'],
+            'final_url': result['final_url'],
+            'error': result['error'],
+            'locations': link['locations'],
+        })
+
+    if output_format == 'json':
+        return json.dumps(rows, indent=2, ensure_ascii=False)
+
+    counts = {state: sum(1 for r in results.values() if classify(r) == state)
+              for state in ('ok', 'redirected', 'dead')}
+    output = "# Link Health Report\n\n"
+    output += (f"Checked {len(links)} unique links: {counts['ok']} ok, "
+               f"{counts['redirected']} redirected, {counts['dead']} dead\n\n")
+    for state, heading in (('dead', 'Dead Links'), ('redirected', 'Redirected Links'),
+                           ('ok', 'Healthy Links')):
+        section = [r for r in rows if r['state'] == state]
+        if not section:
+            continue
+        output += f"## {heading}\n\n"
+        for row in section:
+            detail = row['error'] or f"HTTP {row['status']}"
+            if state == 'redirected':
+                detail = f"→ {row['final_url']}"
+            output += f"- {row['url']} ({detail})\n"
+            for location in row['locations'][:5]:
+                output += f"  - {location}\n"
+            if len(row['locations']) > 5:
+                output += f"  - ...and {len(row['locations']) - 5} more\n"
+        output += "\n"
+    return output
@@ -0,0 +1,206 @@
+"""
+Check recent blog posts from tracked people in context/people.md, and audit
+who has been active recently.
+"""
+
+import json
+import sys
+
+from tooling.feeds import PERSONAL_RSS_PATHS, check_rss_feed, try_find_rss_feed
+from tooling.fetchplan import SharedFetches
+from tooling.stages import stage
+
+
+def person_source(person):
+    """The URL checked for a person: their RSS feed, else their blog (for discovery)."""
+    return person.get('rss_feed') or person.get('blog')
+
+
+def find_personal_feed(blog_url):
+    """Feed for a person's blog: its advertised link, else a HEAD probe of ``PERSONAL_RSS_PATHS``."""
+    return try_find_rss_feed(blog_url, paths=PERSONAL_RSS_PATHS)
+
+
+def check_person_posts(person, days_back=7, push=None, fetches=None):
+    """Check recent posts for one person. Returns (posts, errors).
+
+    People checked through the same ``tooling.fetchplan.SharedFetches`` share
+    feed fetches and discovery when their URLs are equivalent.
+    """
+    recent_posts = []
+    errors = []
+    fetches = fetches or SharedFetches()
+
+    def fetch(feed_url):
+        return check_rss_feed(feed_url, days_back, max_entries=10, push=push,
+                              redirects=fetches.redirects)
+
+    # Try RSS feed first
+    if person['rss_feed']:
+        posts, error = fetches.feed(person['rss_feed'], fetch)
+        if error:
+            errors.append(error)
+        elif posts:
+            recent_posts.extend(posts)
+
+    # If no RSS feed but has blog, try to find RSS feed
+    elif person['blog']:
+        found_rss = fetches.discover(person['blog'], find_personal_feed)
+        if found_rss:
+            posts, error = fetches.feed(found_rss, fetch)
+            if error:
+                errors.append(error)
+            elif posts:
+                recent_posts.extend(posts)
+
+    return recent_posts, errors
+
+
+def person_result(person, posts, errors):
+    """Result entry for one person, as produced by ``check_recent_posts``."""
+    # Always include results, even if no posts found (to show what was checked)
+    return {
+        'name': person['name'],
+        'posts': posts,
+        'errors': errors,
+        'sources_checked': {
+            'rss_feed': person.get('rss_feed'),
+            'blog': person.get('blog'),
+            'newsletter': person.get('newsletter'),
+        }
+    }
+
+
+def check_recent_posts(people, days_back=7, push=None, fetches=None):
+    """Check recent posts from all people."""
+    results = []
+    fetches = fetches or SharedFetches()
+
+    for person in people:
+        posts, errors = check_person_posts(person, days_back, push, fetches)
+        results.append(person_result(person, posts, errors))
+
+    return results
+
+
+@stage('format')
+def format_output(results, output_format='json'):
+    """Format results for output."""
+    if output_format == 'json':
+        return json.dumps(results, indent=2, ensure_ascii=False)
+    elif output_format == 'markdown':
+        output = "# Recent Posts from Tracked People\n\n"
+        for result in results:
+            if result['posts']:
+                output += f"## {result['name']}\n\n"
+                for post in result['posts']:
+                    output += f"### {post['title']}\n"
+                    output += f"**Link:** {post['link']}\n"
+                    if post['published']:
+                        output += f"**Published:** {post['published']}\n"
+                    if post['summary']:
+                        output += f"**Summary:** {post['summary']}\n"
+                    if post.get('article'):
+                        from tooling.articles import article_markdown
+                        output += article_markdown(post['article'])
+                    output += "\n"
+        return output
+    else:
+        return str(results)
+
+
+def audit_person_activity(person, days_back=30):
+    """Check activity for a single person."""
+    result = {
+        'name': person['name'],
+        'blog_active': False,
+        'blog_posts': [],
+        'blog_error': None,
+        'blog': person.get('blog'),
+        'linkedin': person.get('linkedin'),
+        'has_rss': bool(person.get('rss_feed')),
+        'has_blog': bool(person.get('blog')),
+    }
+
+    # Check RSS feed
+    if person.get('rss_feed'):
+        posts, error = check_rss_feed(person['rss_feed'], days_back, max_entries=10,
+                                      summary_chars=0)
+        if error:
+            result['blog_error'] = error
+        elif posts:
+            result['blog_active'] = True
+            result['blog_posts'] = posts
+
+    # If no RSS feed but has blog, note that
+    elif person.get('blog'):
+        result['blog_error'] = "No RSS feed configured"
+
+    return result
+
+
+@stage('format')
+def print_audit_report(results, days_back, out=sys.stdout):
+    """Print the active/inactive audit report for ``audit_person_activity`` results."""
+    def emit(line=''):
+        print(line, file=out)
+
+    active = [r for r in results if r['blog_active']]
+    inactive = [r for r in results if not r['blog_active']]
+
+    emit("=" * 80)
+    emit(f"ACTIVE PEOPLE ({len(active)}):\n")
+    for result in active:
+        emit(f"✓ {result['name']}")
+        emit(f"  Blog posts: {len(result['blog_posts'])}")
+        for post in result['blog_posts'][:3]:  # Show up to 3 recent posts
+            emit(f"    - {post['title'][:60]}... ({post['published'][:10]})")
+            emit(f"      {post['link']}")
+        emit()
+
+    emit("=" * 80)
+    emit(f"INACTIVE PEOPLE ({len(inactive)}):\n")
+
+    # Group inactive by reason
+    no_rss_no_blog = [r for r in inactive if not r['has_rss'] and not r['has_blog']]
+    has_blog_no_rss = [r for r in inactive if r['has_blog'] and not r['has_rss']]
+    has_rss_no_posts = [r for r in inactive if r['has_rss'] and not r['blog_active']]
+
+    if has_rss_no_posts:
+        emit("No recent posts (have RSS feed):")
+        for result in has_rss_no_posts:
+            error_msg = f" ({result['blog_error']})" if result['blog_error'] else ""
+            emit(f"  - {result['name']}{error_msg}")
+        emit()
+
+    if has_blog_no_rss:
+        emit("Has blog but no RSS feed configured:")
+        for result in has_blog_no_rss:
+            emit(f"  - {result['name']} - {result.get('blog') or 'N/A'}")
+        emit()
+
+    if no_rss_no_blog:
+        emit("No blog or RSS feed configured:")
+        linkedin = [r for r in no_rss_no_blog if r['linkedin']]
+        no_linkedin = [r for r in no_rss_no_blog if not r['linkedin']]
+
+        if linkedin:
+            emit(f"  Has LinkedIn ({len(linkedin)}):")
+            for result in linkedin:
+                emit(f"    - {result['name']} - {result['linkedin']}")
+            emit()
+
+        if no_linkedin:
+            emit(f"  No LinkedIn either ({len(no_linkedin)}):")
+            for result in no_linkedin:
+                emit(f"    - {result['name']}")
+        emit()
+
+    emit("=" * 80)
+    emit("\nSummary:")
+    emit(f"  Total people: {len(results)}")
+    emit(f"  Active (blog posts in last {days_back} days): {len(active)}")
+    emit(f"  Inactive: {len(inactive)}")
+    emit(f"    - Has RSS, no recent posts: {len(has_rss_no_posts)}")
+    emit(f"    - Has blog, no RSS feed: {len(has_blog_no_rss)}")
+    emit(f"    - No blog/RSS configured: {len(no_rss_no_blog)}")
@@ -0,0 +1,231 @@
+"""
+Opt-in CPU and memory profiling for every subcommand (``--profile PATH``).
+
+While a ``Profiler`` is running:
+
+1. cProfile records every thread (worker threads included); the merged stats
+   are written to PATH for ``pstats``/snakeviz, and the top functions by
+   cumulative time are printed
+2. tracemalloc traces allocations, and each pipeline stage (see ``STAGES``)
+   reports its call count, wall and CPU time, net and peak memory, and the
+   allocation sites that grew the most during its first ``SITE_SAMPLES`` runs
+   (snapshot diffs are expensive, so later runs only update the counters)
+3. Optionally, a sampler thread writes collapsed stacks
+   (``frame;frame;frame count``) for flamegraph.pl or speedscope
+
+Code marks its stages with ``tooling.stages.stage``; when no profiler is
+running a stage costs one global lookup. cProfile, pstats and tracemalloc are
+only imported once a profile starts.
+
+Memory figures per stage are exact for sequential runs. With worker threads
+(``--budget``, ``backfill``, ``links``) overlapping stages share tracemalloc's
+counters, so use their CPU times and the pstats output instead.
+"""
+
+import io
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from tooling import stages
+from tooling.stages import STAGES
+
+DEFAULT_TOP = 15
+# Allocation sites are reported by their innermost frame only
+TRACE_FRAMES = 1
+SITE_SAMPLES = 2
+SAMPLE_INTERVAL = 0.005
+
+
+def _frame_label(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Profiler:
+    """Collects CPU, per-stage memory and (optionally) stack samples for one run."""
+
+    def __init__(self, top=DEFAULT_TOP, collapsed=False, sample_interval=SAMPLE_INTERVAL):
+        self.top = top
+        self.collapsed = collapsed
+        self.sample_interval = sample_interval
+        self.stages = defaultdict(lambda: {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'net': 0,
+                                           'peak': 0, 'sampled': 0, 'sites': Counter()})
+        self.stacks = Counter()
+        self.overhead = 0.0
+        self._profiles = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stop_sampling = threading.Event()
+        self._sampler = None
+        self._started = None
+
+    def start(self):
+        import tracemalloc
+
+        tracemalloc.start(TRACE_FRAMES)
+        self._started = time.perf_counter()
+        if self.collapsed:
+            self._sampler = threading.Thread(target=self._sample, daemon=True)
+            self._sampler.start()
+        threading.setprofile(self._profile_thread)
+        self._profile_thread()
+        stages._profiler = self
+
+    def stop(self):
+        import tracemalloc
+
+        stages._profiler = None
+        threading.setprofile(None)
+        self._profiles[0].disable()
+        self.elapsed = time.perf_counter() - self._started
+        self.peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        if self._sampler:
+            self._stop_sampling.set()
+            self._sampler.join()
+
+    def _profile_thread(self, *args):
+        """Give each thread its own cProfile (installed via ``threading.setprofile``)."""
+        import cProfile
+
+        sys.setprofile(None)
+        profile = cProfile.Profile()
+        self._local.profile = profile
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()
+
+    def _sample(self):
+        own = threading.get_ident()
+        while not self._stop_sampling.wait(self.sample_interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                self.stacks[';'.join(reversed(labels))] += 1
+
+    @contextmanager
+    def _paused(self):
+        """Keep the profiler's own bookkeeping out of this thread's CPU profile."""
+        profile = getattr(self._local, 'profile', None)
+        if profile:
+            profile.disable()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.overhead += time.perf_counter() - started
+            if profile:
+                profile.enable()
+
+    @contextmanager
+    def measure(self, name):
+        """Record one run of stage ``name``; stages may nest (outer totals include inner)."""
+        import tracemalloc
+
+        stack = self._local.__dict__.setdefault('stack', [])
+        frame = {'inner_peak': 0}
+        stack.append(frame)
+        with self._lock:
+            sampled = self.stages[name]['sampled'] < SITE_SAMPLES
+            self.stages[name]['sampled'] += sampled
+        before = None
+        if sampled:
+            with self._paused():
+                before = tracemalloc.take_snapshot()
+        current_before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, frame['inner_peak'])
+            growth = []
+            if before:
+                with self._paused():
+                    growth = [diff for diff in tracemalloc.take_snapshot().compare_to(before, 'lineno')
+                              if diff.size_diff > 0
+                              and diff.traceback[0].filename not in (tracemalloc.__file__, __file__)]
+            stack.pop()
+            if stack:
+                # An inner stage's reset_peak hides the outer stage's earlier peak
+                stack[-1]['inner_peak'] = max(stack[-1]['inner_peak'], peak)
+            with self._lock:
+                totals = self.stages[name]
+                totals['calls'] += 1
+                totals['wall'] += wall
+                totals['cpu'] += cpu
+                totals['net'] += current - current_before
+                totals['peak'] = max(totals['peak'], peak - current_before)
+                for diff in growth:
+                    frame_info = diff.traceback[0]
+                    totals['sites'][f"{frame_info.filename}:{frame_info.lineno}"] += diff.size_diff
+
+    def stats(self):
+        """cProfile stats merged across all profiled threads."""
+        import pstats
+
+        merged = pstats.Stats(self._profiles[0], stream=io.StringIO())
+        for profile in self._profiles[1:]:
+            profile.create_stats()
+            if profile.stats:
+                merged.add(profile)
+        return merged
+
+    def write_collapsed(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack_line, count in sorted(self.stacks.items()):
+                f.write(f"{stack_line} {count}\n")
+
+    def report(self, stats_path=None):
+        """Human-readable stage table, allocation sites and top functions."""
+        kib = 1024
+        lines = [f"Profile: {self.elapsed:.2f}s wall ({self.overhead:.2f}s of it profiler "
+                 f"overhead), peak traced memory "
+                 f"{self.peak_memory / kib / kib:.1f} MiB", "",
+                 f"{'Stage':<14}{'Calls':>7}{'Wall s':>9}{'CPU s':>9}{'Net KiB':>10}{'Peak KiB':>10}"]
+        names = [name for name in STAGES if name in self.stages] + \
+                sorted(name for name in self.stages if name not in STAGES)
+        for name in names:
+            totals = self.stages[name]
+            lines.append(f"{name:<14}{totals['calls']:>7}{totals['wall']:>9.2f}{totals['cpu']:>9.2f}"
+                         f"{totals['net'] / kib:>10.1f}{totals['peak'] / kib:>10.1f}")
+
+        lines += ["", f"Top allocation sites by stage (KiB still live at stage exit, "
+                      f"first {SITE_SAMPLES} runs of each):"]
+        for name in names:
+            sites = self.stages[name]['sites'].most_common(self.top)
+            if sites:
+                lines.append(f"  {name}")
+                lines += [f"    {size / kib:>10.1f}  {site}" for site, size in sites]
+
+        stats = self.stats()
+        stats.sort_stats('cumulative').print_stats(self.top)
+        saved = f"; full stats in {stats_path}" if stats_path else ""
+        lines += ["", f"CPU profile (top {self.top} by cumulative time{saved}):",
+                  stats.stream.getvalue().strip()]
+        return '\n'.join(lines)
+
+
+def profile_call(func, *args, stats_path=None, collapsed_path=None, top=DEFAULT_TOP):
+    """Run ``func(*args)`` under a Profiler, write its outputs and print the report to stderr."""
+    profiler = Profiler(top=top, collapsed=bool(collapsed_path))
+    profiler.start()
+    try:
+        return func(*args)
+    finally:
+        profiler.stop()
+        if stats_path:
+            profiler.stats().dump_stats(stats_path)
+        if collapsed_path:
+            profiler.write_collapsed(collapsed_path)
+        print(profiler.report(stats_path), file=sys.stderr)
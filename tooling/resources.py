@@ -0,0 +1,39 @@
+"""
+Connections shared by the stores and crawlers: thread-safe SQLite databases
+and per-thread HTTP sessions.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+from tooling.deps import require
+from tooling.feeds import USER_AGENT
+
+_local = threading.local()
+
+
+def open_sqlite(path, schema):
+    """Open a SQLite database (or ``:memory:``) usable from any thread and apply ``schema``.
+
+    Returns (connection, lock); hold the lock around every use of the
+    connection. Rows come back as ``sqlite3.Row``.
+    """
+    path = str(path)
+    if path != ':memory:':
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    lock = threading.Lock()
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.row_factory = sqlite3.Row
+    with lock, connection:
+        connection.executescript(schema)
+    return connection, lock
+
+
+def thread_session():
+    """One requests.Session per worker thread, for connection reuse."""
+    if not hasattr(_local, 'session'):
+        requests = require('requests')
+        _local.session = requests.Session()
+        _local.session.headers['User-Agent'] = USER_AGENT
+    return _local.session
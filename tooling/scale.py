@@ -0,0 +1,355 @@
+"""
+Synthetic context files and feeds at multiples of today's size, and a harness
+that reports how the real entry points scale.
+
+1. ``generate_companies``/``generate_people`` write companies.md/people.md with
+   ``scale`` times as many entries as the real files, in the same layout and
+   with the same mix of sources: annotated feeds, direct feed links, blogs whose
+   feed is discovered, blogs with no feed at all (the full probe), changelogs,
+   and people with and without a feed
+2. ``FixtureServer`` serves every blog page and feed those files point at from
+   a local HTTP server. Responses are generated from the URL, so 1000x needs no
+   fixture files and no extra memory
+3. ``measure_scaling`` runs ``parse_companies_file``, ``parse_people_file``,
+   ``collect_company_updates``, ``check_recent_posts`` and both
+   ``format_output`` functions at each scale, recording wall time and peak
+   traced memory. ``format_curve`` prints each as a curve with the growth
+   exponent between sizes (1.0 is linear), and flags superlinear steps
+
+The collectors fetch sources one after another (about a tenth of a second per
+company against the local server), so they only run up to
+``checker_max_scale``. ``format_output`` always gets generated results of the
+same shape, so its curve covers every scale. Times are taken with
+tracemalloc running, so compare them between sizes rather than with an
+unprofiled run.
+"""
+
+import io
+import json
+import math
+import re
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from tooling import CONTEXT_DIR
+from tooling.budget import CATEGORY_PRIORITY
+
+DEFAULT_SCALES = [1, 10, 100, 1000]
+DEFAULT_CHECKER_MAX_SCALE = 10
+ITEMS_PER_FEED = 10
+# Growth exponents above this (on steps slower than MIN_SECONDS) are flagged
+SUPERLINEAR_EXPONENT = 1.2
+MIN_SECONDS = 0.05
+
+ENTRY_POINTS = ['parse_companies_file', 'parse_people_file', 'collect_company_updates',
+                'check_recent_posts', 'companies.format_output', 'people.format_output']
+CHECKERS = {'collect_company_updates', 'check_recent_posts'}
+
+FILLER = ("Ships product changes that shift how teams plan, price and measure AI features, "
+          "with enough detail to compare against competitors")
+
+
+def current_sizes(context_dir=CONTEXT_DIR):
+    """Number of ``## `` entries in the real companies.md and people.md."""
+    sizes = {}
+    for kind in ('companies', 'people'):
+        content = (Path(context_dir) / f"{kind}.md").read_text(encoding='utf-8')
+        sizes[kind] = len(re.findall(r'^## ', content, flags=re.M))
+    return sizes
+
+
+def company_sources_markdown(index, base_url):
+    """Primary source lines of synthetic company ``index``, cycling through the source mix."""
+    site = f"{base_url}/c/{index}"
+    kind = index % 4
+    if kind == 0:
+        return [f"- {site}/blog (feed_url: {site}/feed.xml)", f"- {site}/changelog"]
+    if kind == 1:
+        return [f"- {site}/blog", f"- {site}/changelog"]
+    if kind == 2:
+        # A known feed plus the blog that advertises it: one fetch, shared
+        return [f"- {site}/feed.xml", f"- {site}/blog"]
+    # Every eighth company's blog has no feed, so discovery probes every common path
+    return [f"- {site}/blog"]
+
+
+def generate_companies(count, base_url):
+    """companies.md text with ``count`` synthetic companies."""
+    sections = ["# Tracked Companies\n\nSynthetic roster for scaling runs.\n"]
+    for index in range(count):
+        sections.append("\n".join([
+            f"## Company {index:05d}",
+            f"**Category:** {CATEGORY_PRIORITY[index % len(CATEGORY_PRIORITY)]}",
+            f"**Why we track them:** {FILLER}.",
+            "**What to watch for:**",
+            "- Pricing and packaging changes",
+            "- New model or agent capabilities",
+            "- Enterprise and admin features",
+            "- Developer platform launches",
+            "**Ignore unless:**",
+            "- Research without product implications",
+            "- Partnership announcements without product changes",
+            "**Primary sources:**",
+            *company_sources_markdown(index, base_url),
+            "",
+        ]))
+    return "\n---\n\n".join(sections)
+
+
+def generate_people(count, base_url):
+    """people.md text with ``count`` synthetic people (a third of them with no blog or feed)."""
+    sections = ["# Tracked People\n\nSynthetic roster for scaling runs.\n"]
+    for index in range(count):
+        site = f"{base_url}/p/{index}"
+        kind = index % 3
+        platforms = [f"- Twitter/X: @person{index}"]
+        if kind == 0:
+            platforms += [f"- Blog: {site}/", f"- RSS Feed: {site}/feed"]
+        elif kind == 1:
+            platforms += [f"- Blog: {site}/"]
+        platforms += [f"- LinkedIn: https://www.linkedin.com/in/person{index}/"]
+        sections.append("\n".join([
+            f"## Person {index:05d}",
+            "**Role:** Product leader",
+            f"**Why they matter:** {FILLER}.",
+            "**Signal types to watch for:**",
+            "- Product decision frameworks",
+            "- Launch retrospectives",
+            "- Pricing and growth experiments",
+            "**Primary platforms:**",
+            *platforms,
+            "",
+        ]))
+    return "\n---\n\n".join(sections)
+
+
+def write_fixtures(directory, scale, base_url, sizes=None):
+    """Write companies.md and people.md at ``scale`` times ``sizes``. Returns their paths."""
+    sizes = sizes or current_sizes()
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    companies_file = directory / 'companies.md'
+    people_file = directory / 'people.md'
+    companies_file.write_text(generate_companies(sizes['companies'] * scale, base_url),
+                              encoding='utf-8')
+    people_file.write_text(generate_people(sizes['people'] * scale, base_url), encoding='utf-8')
+    return companies_file, people_file
+
+
+def feed_xml(site, now=None):
+    """RSS for one synthetic site: ``ITEMS_PER_FEED`` items, one a day going back."""
+    now = now or datetime.now(timezone.utc)
+    items = "".join(
+        f"<item><title>Update {n} from {site}</title><link>{site}/posts/{n}</link>"
+        f"<pubDate>{format_datetime(now - timedelta(days=n, hours=1))}</pubDate>"
+        f"<description>{FILLER}.</description></item>"
+        for n in range(ITEMS_PER_FEED))
+    return (f'<?xml version="1.0"?><rss version="2.0"><channel><title>{site}</title>'
+            f'<link>{site}</link>{items}</channel></rss>')
+
+
+class FixtureServer:
+    """Local HTTP server for every URL in the generated files, started on a free port."""
+
+    def __init__(self, host='127.0.0.1', port=0):
+        fixtures = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, content_type, body = fixtures.respond(self.path)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_HEAD(self):
+                status, content_type, body = fixtures.respond(self.path)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.base_url = f"http://{host}:{self.server.server_port}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def respond(self, path):
+        with self._lock:
+            self.requests += 1
+        match = re.fullmatch(r'/([cp])/(\d+)(/.*)', path)
+        if not match:
+            return 404, 'text/plain', b'Not found'
+        kind, index, rest = match.group(1), int(match.group(2)), match.group(3)
+        site = f"{self.base_url}/{kind}/{index}"
+        feed_path = '/feed.xml' if kind == 'c' else '/feed'
+        if rest == feed_path:
+            return 200, 'application/rss+xml', feed_xml(site).encode('utf-8')
+        if rest in ('/blog', '/'):
+            has_feed = not (kind == 'c' and index % 8 == 7)
+            link = f'<link rel="alternate" type="application/rss+xml" href="{site}{feed_path}">'
+            page = (f"<html><head><title>{site}</title>{link if has_feed else ''}</head>"
+                    f"<body><p>{FILLER}.</p></body></html>")
+            return 200, 'text/html', page.encode('utf-8')
+        if rest == '/changelog':
+            return 200, 'text/html', f"<html><body><p>{FILLER}.</p></body></html>".encode('utf-8')
+        return 404, 'text/plain', b'Not found'
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def measure(func, *args, **kwargs):
+    """Run ``func`` once. Returns (result, seconds, peak traced bytes)."""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        seconds = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, seconds, max(peak, 0)
+
+
+def measure_scaling(scales=DEFAULT_SCALES, work_dir=None, sizes=None,
+                    checker_max_scale=DEFAULT_CHECKER_MAX_SCALE, log=None):
+    """Measure every entry point at each scale. Returns {entry point: [row per scale]}.
+
+    Rows have ``scale``, ``entries`` (companies or people measured),
+    ``seconds`` and ``peak_bytes``. The network-bound collectors only run at
+    scales up to ``checker_max_scale`` (0 skips them).
+    """
+    import tempfile
+
+    from tooling import companies as companies_module
+    from tooling import people as people_module
+    from tooling.context import parse_companies_file, parse_people_file, people_with_sources
+
+    sizes = sizes or current_sizes()
+    curves = {name: [] for name in ENTRY_POINTS
+              if name not in CHECKERS or any(scale <= checker_max_scale for scale in scales)}
+    server = FixtureServer().start()
+    try:
+        with tempfile.TemporaryDirectory(dir=work_dir) as directory:
+            for scale in scales:
+                companies_file, people_file = write_fixtures(Path(directory) / f"x{scale}",
+                                                             scale, server.base_url, sizes)
+
+                def record(name, entries, func, *args, **kwargs):
+                    result, seconds, peak = measure(func, *args, **kwargs)
+                    curves[name].append({'scale': scale, 'entries': entries,
+                                         'seconds': round(seconds, 4), 'peak_bytes': peak})
+                    if log:
+                        print(f"  {scale:>5}x {name:<26} {seconds:8.3f}s "
+                              f"{peak / 2 ** 20:8.1f} MiB", file=log)
+                    return result
+
+                companies = record('parse_companies_file', sizes['companies'] * scale,
+                                   parse_companies_file, str(companies_file))
+                people = record('parse_people_file', sizes['people'] * scale,
+                                parse_people_file, str(people_file))
+                people = people_with_sources(people)
+
+                if scale <= checker_max_scale:
+                    record('collect_company_updates', len(companies),
+                           companies_module.collect_company_updates, companies, days_back=7,
+                           log=io.StringIO())
+                    record('check_recent_posts', len(people),
+                           people_module.check_recent_posts, people, days_back=7)
+
+                company_results = synthetic_company_results(companies)
+                people_results = synthetic_people_results(people)
+                record('companies.format_output', len(company_results),
+                       companies_module.format_output, company_results, 'markdown')
+                record('people.format_output', len(people_results),
+                       people_module.format_output, people_results, 'markdown')
+    finally:
+        server.stop()
+    return curves
+
+
+def _synthetic_posts(site, days_back=7):
+    """The posts a collector would return for one fixture feed."""
+    now = datetime.now()
+    return [{'title': f"Update {n} from {site}", 'link': f"{site}/posts/{n}",
+             'published': (now - timedelta(days=n, hours=1)).isoformat(), 'summary': f"{FILLER}."}
+            for n in range(min(ITEMS_PER_FEED, days_back))]
+
+
+def synthetic_company_results(companies):
+    """``collect_company_updates``-shaped results without any fetching."""
+    return [{'name': company['name'], 'category': company['category'], 'errors': [],
+             'updates': [{**post, 'source': 'rss', 'source_url': url}
+                         for url in company['rss_feeds'][:1] for post in _synthetic_posts(url)]}
+            for company in companies]
+
+
+def synthetic_people_results(people):
+    """``check_recent_posts``-shaped results without any fetching."""
+    from tooling.people import person_result
+
+    return [person_result(person, _synthetic_posts(person['rss_feed'] or person['blog'] or ''), [])
+            for person in people]
+
+
+def exponent(previous, row, field):
+    """Growth exponent of ``field`` between two rows: log(ratio) / log(size ratio)."""
+    if not previous[field] or not row[field] or row['entries'] == previous['entries']:
+        return None
+    return math.log(row[field] / previous[field]) / math.log(row['entries'] / previous['entries'])
+
+
+def format_curve(curves, output_format='markdown'):
+    """Scaling curves as markdown tables (or JSON), superlinear steps flagged."""
+    for rows in curves.values():
+        for previous, row in zip([None] + rows, rows):
+            row['time_exponent'] = exponent(previous, row, 'seconds') if previous else None
+            row['memory_exponent'] = exponent(previous, row, 'peak_bytes') if previous else None
+            row['superlinear'] = bool(row['time_exponent'] and
+                                      row['time_exponent'] > SUPERLINEAR_EXPONENT and
+                                      row['seconds'] > MIN_SECONDS)
+    if output_format == 'json':
+        return json.dumps(curves, indent=2)
+
+    def fmt(value):
+        return "" if value is None else f"{value:.2f}"
+
+    output = "# Scaling Curve\n\n"
+    output += (f"*Growth exponent between sizes: 1.0 is linear; steps above "
+               f"{SUPERLINEAR_EXPONENT} are flagged*\n\n")
+    for name, rows in curves.items():
+        output += f"## {name}\n\n"
+        output += "| Scale | Entries | Seconds | Peak MiB | Time exp. | Memory exp. |\n"
+        output += "|---:|---:|---:|---:|---:|---:|\n"
+        for row in rows:
+            flag = " ⚠" if row['superlinear'] else ""
+            output += (f"| {row['scale']}x | {row['entries']} | {row['seconds']:.3f} | "
+                       f"{row['peak_bytes'] / 2 ** 20:.1f} | {fmt(row['time_exponent'])}{flag} | "
+                       f"{fmt(row['memory_exponent'])} |\n")
+        output += "\n"
+    flagged = [f"{name} at {row['scale']}x" for name, rows in curves.items()
+               for row in rows if row['superlinear']]
+    output += (f"**Superlinear:** {', '.join(flagged)}\n" if flagged
+               else "No superlinear steps.\n")
+    return output
@@ -0,0 +1,244 @@
+"""
+Listing-page extraction for sources marked ``(feed_url: scrape)`` in companies.md.
+
+These sites have no feed, so instead of probing for one the listing page is
+fetched once and its article cards are turned into the same post dicts that
+``tooling.feeds.check_rss_feed`` returns:
+
+1. Cards are picked out with a per-site selector config (``SITE_SELECTORS``),
+   or by default as the links that point below the listing page's own path
+2. Each card yields a title, link, date and short summary
+3. Extracted cards are cached by a hash of the page content (and the selector
+   config), so an unchanged page is never parsed twice
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from urllib.parse import urljoin, urlparse
+
+from tooling import SCRAPE_CACHE_PATH
+from tooling.deps import require
+from tooling.feeds import fetch_url, request_timeout
+from tooling.resources import open_sqlite
+from tooling.stages import stage
+
+# Per-site overrides of DEFAULT_SELECTORS, keyed by host. Only needed where the
+# default "links below the listing path" rule picks the wrong elements, e.g.
+# listings at the site root.
+SITE_SELECTORS = {
+    'blog.character.ai': {'card': 'article, .post-card'},
+    'roadmap.wisprflow.ai': {'card': 'article, li:has(a[href])'},
+    'stripe.com': {'card': 'article'},
+    'www.salesforce.com': {'card': 'article, [class*="card"]:has(a[href*="/blog/"])'},
+}
+
+DEFAULT_SELECTORS = {
+    'card': None,  # None: anchors that link below the listing page's path
+    'title': 'h1, h2, h3, h4, [class*="title"]',
+    'date': 'time, [class*="date"]',
+    'summary': 'p, [class*="excerpt"], [class*="description"]',
+}
+
+# Listing-path links that are navigation rather than articles
+SKIP_PATHS = re.compile(r'/(page|category|categories|tag|tags|author|authors|topics?)/', re.I)
+
+# Matched after dropping commas and periods ("Jan. 5, 2026" -> "Jan 5 2026")
+DATE_FORMATS = ['%Y-%m-%d', '%m/%d/%Y', '%B %d %Y', '%b %d %Y', '%d %B %Y', '%d %b %Y']
+DATE_PATTERN = re.compile(
+    r'\d{4}-\d{2}-\d{2}'
+    r'|\d{1,2}/\d{1,2}/\d{4}'
+    r'|[A-Z][a-z]{2,8}\.? \d{1,2},? \d{4}'
+    r'|\d{1,2} [A-Z][a-z]{2,8} \d{4}')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scraped_pages (
+    url TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    cards TEXT NOT NULL,
+    scraped_at REAL NOT NULL
+);
+"""
+
+
+def site_selectors(page_url):
+    """Selector config for a listing page: the site override merged over the defaults."""
+    return {**DEFAULT_SELECTORS, **SITE_SELECTORS.get(urlparse(page_url).netloc.lower(), {})}
+
+
+def parse_card_date(text):
+    """Parse the first date found in a card's text or ``datetime`` attribute, or None."""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        return datetime.fromisoformat(text.replace('Z', '+00:00')).replace(tzinfo=None)
+    except ValueError:
+        pass
+    match = DATE_PATTERN.search(text)
+    if not match:
+        return None
+    value = match.group(0).replace(',', '').replace('.', '')
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def _text(element):
+    return ' '.join(element.get_text(' ', strip=True).split()) if element else ''
+
+
+def _below_listing(link, page_url):
+    """True if ``link`` is an article URL under the listing page's path."""
+    page, target = urlparse(page_url), urlparse(link)
+    if target.netloc != page.netloc:
+        return False
+    base = page.path.rstrip('/') + '/'
+    path = target.path
+    return path.startswith(base) and path.rstrip('/') != base.rstrip('/') \
+        and not SKIP_PATHS.search(path[len(base) - 1:])
+
+
+def _card_link(card, page_url):
+    anchor = card if card.name == 'a' else card.find('a', href=True)
+    if not anchor or not anchor.get('href'):
+        return None
+    return urljoin(page_url, anchor['href']).split('#')[0]
+
+
+def _card_date(card, selectors):
+    # Dates are often a sibling of the card's link rather than inside it
+    for element in (card, card.parent):
+        if element is None:
+            continue
+        for node in element.select(selectors['date']):
+            published = parse_card_date(node.get('datetime') or _text(node))
+            if published:
+                return published
+    return parse_card_date(_text(card))
+
+
+@stage('parse_feed')
+def extract_cards(html, page_url, selectors=None):
+    """Article cards on a listing page, in page order, deduplicated by link.
+
+    Returns dicts with ``title``, ``link``, ``published`` (ISO string or None)
+    and ``summary``.
+    """
+    BeautifulSoup = require('bs4').BeautifulSoup
+    selectors = selectors or site_selectors(page_url)
+    soup = BeautifulSoup(html, 'html.parser')
+
+    if selectors['card']:
+        elements = soup.select(selectors['card'])
+    else:
+        elements = [a for a in soup.find_all('a', href=True)
+                    if _below_listing(urljoin(page_url, a['href']), page_url)]
+
+    cards = {}
+    for element in elements:
+        link = _card_link(element, page_url)
+        if not link:
+            continue
+        title = _text(element.select_one(selectors['title'])) or _text(element)
+        published = _card_date(element, selectors)
+        summary = _text(element.select_one(selectors['summary']))
+        card = cards.setdefault(link, {'title': '', 'link': link, 'published': None,
+                                       'summary': ''})
+        # The same article is often linked twice (image and headline); keep the best parts
+        card['title'] = card['title'] or title
+        card['published'] = card['published'] or (published.isoformat() if published else None)
+        card['summary'] = card['summary'] or summary[:500]
+
+    return [card for card in cards.values() if card['title']]
+
+
+class ScrapeCache:
+    """SQLite cache of extracted cards, keyed by page URL and content hash."""
+
+    def __init__(self, path=SCRAPE_CACHE_PATH):
+        self.path = str(path)
+        self._conn, self._lock = open_sqlite(self.path, SCHEMA)
+
+    def get(self, url, content_hash):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cards FROM scraped_pages WHERE url = ? AND content_hash = ?",
+                (url, content_hash)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, url, content_hash, cards):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO scraped_pages VALUES (?, ?, ?, ?)",
+                               (url, content_hash, json.dumps(cards), time.time()))
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def default_cache():
+    """The shared on-disk cache, opened on first use."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ScrapeCache()
+        return _default_cache
+
+
+def content_hash(content, selectors):
+    """Hash of the page bytes and the selectors used, so editing a config re-extracts."""
+    digest = hashlib.sha256(content)
+    digest.update(json.dumps(selectors, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def scrape_listing(page_url, days_back=7, max_entries=15, include_undated=False,
+                   summary_chars=500, cache=None, deadline=None):
+    """Fetch a listing page and return its recent cards as posts. Returns (posts, error)."""
+    if deadline and deadline.expired():
+        return None, "Time budget exhausted"
+
+    requests = require('requests')
+    try:
+        response = fetch_url(page_url, timeout=request_timeout(10, deadline))
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        return None, f"Error fetching listing page: {str(e)}"
+
+    cache = cache or default_cache()
+    selectors = site_selectors(page_url)
+    key = content_hash(response.content, selectors)
+    cards = cache.get(page_url, key)
+    if cards is None:
+        try:
+            cards = extract_cards(response.text, page_url, selectors)
+        except Exception as e:
+            return None, f"Error scraping listing page: {str(e)}"
+        cache.save(page_url, key, cards)
+
+    if not cards:
+        return None, "No article cards found on listing page"
+
+    return recent_cards(cards, days_back, max_entries, include_undated, summary_chars), None
+
+
+@stage('filter')
+def recent_cards(cards, days_back=7, max_entries=15, include_undated=False, summary_chars=500):
+    """Cards published in the last ``days_back`` days, as post dicts."""
+    cutoff_date = datetime.now() - timedelta(days=days_back)
+    posts = []
+    for card in cards[:max_entries]:
+        published = datetime.fromisoformat(card['published']) if card['published'] else None
+        if (published and published >= cutoff_date) or (not published and include_undated):
+            post = {'title': card['title'], 'link': card['link'], 'published': card['published']}
+            if summary_chars:
+                post['summary'] = card['summary'][:summary_chars]
+            posts.append(post)
+    return posts
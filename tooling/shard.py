@@ -0,0 +1,146 @@
+"""
+Deterministic sharding of the feed set across parallel workers.
+
+``--shard i/N`` (1-based) makes a collector check only the sources that a
+consistent-hash ring assigns to shard ``i``, and print a partial result file
+instead of the report. ``merge`` reassembles any complete set of partials into
+exactly the ``results`` structure (and output) an unsharded run produces.
+
+Sources are hashed by ``tooling.fetchplan.feed_key``, so a source stays on the
+same shard from day to day - and when N changes, only about 1/N of sources
+move - which keeps per-shard caches warm. Equivalent spellings of a feed land
+on the same shard, where they are fetched once.
+"""
+
+import bisect
+import hashlib
+
+from tooling.companies import check_company_source, company_sources, unique_updates
+from tooling.fetchplan import SharedFetches, feed_key
+from tooling.people import check_person_posts, person_result, person_source
+
+PARTIAL_VERSION = 1
+REPLICAS = 64
+
+
+def _hash(key):
+    return int.from_bytes(hashlib.md5(key.encode('utf-8')).digest()[:8], 'big')
+
+
+def parse_shard(spec):
+    """Parse ``"i/N"`` into (i, N), with 1 <= i <= N."""
+    try:
+        index, count = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard {spec!r}: expected i/N, e.g. 2/4")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard {spec!r}: need 1 <= i <= N")
+    return index, count
+
+
+class HashRing:
+    """Consistent-hash ring mapping keys to shards 1..count."""
+
+    def __init__(self, count, replicas=REPLICAS):
+        self.count = count
+        points = sorted((_hash(f"shard-{shard}-{replica}"), shard)
+                        for shard in range(1, count + 1)
+                        for replica in range(replicas))
+        self._hashes = [point for point, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def shard_for(self, url):
+        position = bisect.bisect(self._hashes, _hash(feed_key(url)))
+        return self._shards[position % len(self._shards)]
+
+
+def collect_company_shard(companies, index, count, days_back=7, push=None, fetches=None):
+    """Check this shard's company sources. Returns the partial result dict."""
+    ring = HashRing(count)
+    fetches = fetches or SharedFetches()
+    sources = {}
+    for company in companies:
+        for kind, url in company_sources(company):
+            if ring.shard_for(url) != index:
+                continue
+            updates, errors = check_company_source(company, kind, url, days_back, push,
+                                                   fetches=fetches)
+            sources[f"{company['name']}|{kind}|{url}"] = {'updates': updates, 'errors': errors}
+    return _partial('companies', index, count, days_back, sources)
+
+
+def collect_people_shard(people, index, count, days_back=7, push=None, fetches=None):
+    """Check this shard's people. Returns the partial result dict."""
+    ring = HashRing(count)
+    fetches = fetches or SharedFetches()
+    sources = {}
+    for person in people:
+        url = person_source(person)
+        if not url or ring.shard_for(url) != index:
+            continue
+        posts, errors = check_person_posts(person, days_back, push, fetches)
+        sources[f"{person['name']}|{url}"] = {'posts': posts, 'errors': errors}
+    return _partial('posts', index, count, days_back, sources)
+
+
+def _partial(kind, index, count, days_back, sources):
+    return {
+        'version': PARTIAL_VERSION,
+        'kind': kind,
+        'shard': index,
+        'shards': count,
+        'days': days_back,
+        'sources': sources,
+    }
+
+
+def _merged_sources(partials, kind):
+    """Validate that partials form one complete shard set and combine their sources."""
+    if not partials:
+        raise ValueError("No partial result files given")
+    count = partials[0]['shards']
+    for partial in partials:
+        if partial.get('version') != PARTIAL_VERSION or partial['kind'] != kind:
+            raise ValueError(f"Expected {kind} partials (version {PARTIAL_VERSION}), "
+                             f"got {partial.get('kind')} shard {partial.get('shard')}")
+        if partial['shards'] != count or partial['days'] != partials[0]['days']:
+            raise ValueError("Partials come from runs with different --shard N or --days")
+    seen = sorted(partial['shard'] for partial in partials)
+    if seen != list(range(1, count + 1)):
+        raise ValueError(f"Incomplete or duplicate shards: have {seen}, need 1..{count}")
+
+    sources = {}
+    for partial in partials:
+        sources.update(partial['sources'])
+    return sources
+
+
+def merge_company_partials(companies, partials):
+    """Reassemble company shard partials into ``collect_company_updates`` results."""
+    sources = _merged_sources(partials, 'companies')
+    results = []
+    for company in companies:
+        updates, errors = [], []
+        for kind, url in company_sources(company):
+            outcome = sources.get(f"{company['name']}|{kind}|{url}",
+                                  {'updates': [], 'errors': []})
+            updates.extend(outcome['updates'])
+            errors.extend(outcome['errors'])
+        results.append({
+            'name': company['name'],
+            'category': company['category'],
+            'updates': unique_updates(updates),
+            'errors': errors,
+        })
+    return results
+
+
+def merge_people_partials(people, partials):
+    """Reassemble people shard partials into ``check_recent_posts`` results."""
+    sources = _merged_sources(partials, 'posts')
+    results = []
+    for person in people:
+        outcome = sources.get(f"{person['name']}|{person_source(person)}",
+                              {'posts': [], 'errors': []})
+        results.append(person_result(person, outcome['posts'], outcome['errors']))
+    return results
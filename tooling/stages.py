@@ -0,0 +1,27 @@
+"""
+Pipeline stage markers for ``--profile``.
+
+Modules mark their stages with ``@stage('fetch')`` or ``with stage('fetch'):``.
+The markers live apart from ``tooling.profiling`` so that importing a module
+never loads cProfile, pstats or tracemalloc; the profiler installs itself here
+only while it runs.
+"""
+
+from contextlib import contextmanager
+
+STAGES = ['parse_context', 'discover', 'fetch', 'parse_feed', 'filter', 'extract', 'cluster',
+          'format']
+
+# The running tooling.profiling.Profiler, if any
+_profiler = None
+
+
+@contextmanager
+def stage(name):
+    """Attribute the enclosed work to pipeline stage ``name`` (also usable as a decorator)."""
+    profiler = _profiler
+    if profiler is None:
+        yield
+        return
+    with profiler.measure(name):
+        yield
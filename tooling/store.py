@@ -0,0 +1,170 @@
+"""
+Durable local item store for collected feed entries.
+
+Backed by a single SQLite file (stdlib ``sqlite3``) so pushed, polled and
+backfilled items survive across runs. Posts use the same dict shape as
+``tooling.feeds.entry_to_post``.
+"""
+
+import time
+
+from tooling import ITEM_STORE_PATH
+from tooling.resources import open_sqlite
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    feed_url TEXT NOT NULL,
+    link TEXT NOT NULL,
+    title TEXT,
+    published TEXT,
+    summary TEXT,
+    origin TEXT,
+    stored_at REAL,
+    PRIMARY KEY (feed_url, link)
+);
+CREATE INDEX IF NOT EXISTS items_by_date ON items (feed_url, published);
+
+CREATE TABLE IF NOT EXISTS source_runs (
+    url TEXT PRIMARY KEY,
+    runs INTEGER NOT NULL,
+    items INTEGER NOT NULL,
+    last_run REAL
+);
+
+CREATE TABLE IF NOT EXISTS subscriptions (
+    feed_url TEXT PRIMARY KEY,
+    sub_id TEXT UNIQUE NOT NULL,
+    topic TEXT NOT NULL,
+    hub TEXT NOT NULL,
+    secret TEXT,
+    state TEXT NOT NULL,
+    lease_expires REAL,
+    updated_at REAL
+);
+
+CREATE TABLE IF NOT EXISTS redirects (
+    url TEXT PRIMARY KEY,
+    target TEXT NOT NULL,
+    updated_at REAL
+);
+"""
+
+
+class ItemStore:
+    """SQLite-backed store of feed items and WebSub subscriptions.
+
+    Safe to share between threads (the WebSub receiver is threaded).
+    """
+
+    def __init__(self, path=ITEM_STORE_PATH):
+        self.path = str(path)
+        self._conn, self._lock = open_sqlite(self.path, SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _execute(self, sql, params=()):
+        with self._lock, self._conn:
+            return self._conn.execute(sql, params).fetchall()
+
+    # -- items -------------------------------------------------------------
+
+    def add_items(self, feed_url, posts, origin='poll'):
+        """Insert or refresh posts for a feed. Returns the number of new links."""
+        now = time.time()
+        added = 0
+        with self._lock, self._conn:
+            for post in posts:
+                if not post.get('link'):
+                    continue
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO items VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (feed_url, post['link'], post.get('title'), post.get('published'),
+                     post.get('summary'), origin, now))
+                if cursor.rowcount:
+                    added += 1
+                else:
+                    self._conn.execute(
+                        "UPDATE items SET title = ?, published = COALESCE(?, published), "
+                        "summary = ? WHERE feed_url = ? AND link = ?",
+                        (post.get('title'), post.get('published'), post.get('summary'),
+                         feed_url, post['link']))
+        return added
+
+    def items_since(self, feed_url, since, limit=None, include_undated=False, until=None):
+        """Posts for a feed published at or after ``since`` (and before ``until``), newest first."""
+        params = [feed_url, since.isoformat()]
+        sql = "SELECT * FROM items WHERE feed_url = ? AND ((published >= ?"
+        if until:
+            sql += " AND published < ?"
+            params.append(until.isoformat())
+        sql += ")"
+        if include_undated:
+            sql += " OR published IS NULL"
+        sql += ") ORDER BY published DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [_row_to_post(row) for row in self._execute(sql, params)]
+
+    def count_items(self, feed_url=None):
+        if feed_url is None:
+            return self._execute("SELECT COUNT(*) FROM items")[0][0]
+        return self._execute("SELECT COUNT(*) FROM items WHERE feed_url = ?", (feed_url,))[0][0]
+
+    # -- per-source history ---------------------------------------------
+
+    def record_source_run(self, url, item_count):
+        """Remember how many recent items a source produced on this run."""
+        self._execute(
+            "INSERT INTO source_runs VALUES (?, 1, ?, ?) ON CONFLICT(url) DO UPDATE SET "
+            "runs = runs + 1, items = items + excluded.items, last_run = excluded.last_run",
+            (url, item_count, time.time()))
+
+    def source_yields(self):
+        """Average items per run for every source with history."""
+        rows = self._execute("SELECT url, runs, items FROM source_runs")
+        return {row['url']: row['items'] / row['runs'] for row in rows}
+
+    # -- redirects ---------------------------------------------------------
+
+    def save_redirect(self, url, target):
+        """Remember that ``url`` (a ``tooling.fetchplan.feed_key``) permanently redirects."""
+        self._execute("INSERT OR REPLACE INTO redirects VALUES (?, ?, ?)",
+                      (url, target, time.time()))
+
+    def redirects(self):
+        return {row['url']: row['target'] for row in self._execute("SELECT * FROM redirects")}
+
+    # -- WebSub subscriptions ---------------------------------------------
+
+    def get_subscription(self, feed_url):
+        rows = self._execute("SELECT * FROM subscriptions WHERE feed_url = ?", (feed_url,))
+        return dict(rows[0]) if rows else None
+
+    def get_subscription_by_id(self, sub_id):
+        rows = self._execute("SELECT * FROM subscriptions WHERE sub_id = ?", (sub_id,))
+        return dict(rows[0]) if rows else None
+
+    def save_subscription(self, feed_url, sub_id, topic, hub, secret, state, lease_expires=None):
+        self._execute(
+            "INSERT OR REPLACE INTO subscriptions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (feed_url, sub_id, topic, hub, secret, state, lease_expires, time.time()))
+
+    def update_subscription(self, sub_id, state, lease_expires=None):
+        self._execute(
+            "UPDATE subscriptions SET state = ?, lease_expires = ?, updated_at = ? WHERE sub_id = ?",
+            (state, lease_expires, time.time(), sub_id))
+
+    def list_subscriptions(self):
+        return [dict(row) for row in self._execute("SELECT * FROM subscriptions ORDER BY feed_url")]
+
+
+def _row_to_post(row):
+    return {
+        'title': row['title'] or 'Untitled',
+        'link': row['link'],
+        'published': row['published'],
+        'summary': row['summary'] or '',
+    }
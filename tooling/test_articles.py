@@ -0,0 +1,155 @@
+"""
+Unit tests for full-article fetch, extraction and caching
+"""
+
+import io
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tooling.articles import (ArticleStore, article_markdown, attach_articles, extract_article,
+                              fetch_articles)
+from tooling.budget import Deadline
+from tooling.cli import main
+from tooling.companies import format_output
+
+ARTICLE_HTML = """<!doctype html>
+<html><head>
+<title>Split PRs | Example Blog</title>
+<meta property="og:title" content="Split PRs for parallel agents">
+<meta property="og:site_name" content="Example Blog">
+<meta name="description" content="Agents now open reviewable pull requests.">
+<meta property="article:published_time" content="2026-01-05T10:00:00Z">
+<meta name="author" content="Ada Lovelace">
+</head><body>
+<nav><a href="/">Home</a><a href="/pricing">Pricing</a></nav>
+<div class="sidebar"><p>Subscribe to our newsletter for weekly updates and product news.</p></div>
+<div class="post-content">
+<h1>Split PRs for parallel agents</h1>
+<p>Large agent diffs are now split into several small pull requests, each reviewable on its own.</p>
+<p>Reviewers see one concern per pull request, which makes approvals faster, safer and easier.</p>
+<ul><li>Works with GitHub and GitLab</li></ul>
+</div>
+<div id="comments"><p>Great post, thanks for sharing this with everyone here!</p></div>
+<footer><p>Copyright Example Inc. All rights reserved, everywhere.</p></footer>
+</body></html>
+"""
+
+
+def test_extract_article_keeps_main_text_and_metadata():
+    article = extract_article(ARTICLE_HTML, 'https://example.com/split-prs')
+
+    assert article['title'] == 'Split PRs for parallel agents'
+    assert article['byline'] == 'Ada Lovelace'
+    assert article['published'] == '2026-01-05T10:00:00Z'
+    assert article['site_name'] == 'Example Blog'
+    assert article['description'] == 'Agents now open reviewable pull requests.'
+    assert article['text'].split('\n\n') == [
+        'Large agent diffs are now split into several small pull requests, each reviewable on its own.',
+        'Reviewers see one concern per pull request, which makes approvals faster, safer and easier.',
+        'Works with GitHub and GitLab',
+    ]
+    assert article['word_count'] == len(article['text'].split())
+
+
+@pytest.fixture
+def article_server(local_server):
+    requests_seen = []
+
+    def seen(route):
+        def respond(request):
+            requests_seen.append((request.path, request.headers.get('If-None-Match')))
+            return route(request)
+        return respond
+
+    def article(request):
+        if request.path == '/slow':
+            time.sleep(2)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return 304, {}, b''
+        return 200, {'Content-Type': 'text/html; charset=utf-8', 'ETag': '"v1"'}, ARTICLE_HTML
+
+    def pdf(request):
+        return 200, {'Content-Type': 'application/pdf', 'ETag': '"v1"'}, b'%PDF-1.4'
+
+    def missing(request):
+        return 404, {'Content-Type': 'text/html'}, b'Not found'
+
+    routes = {'/post*': seen(article), '/slow': seen(article), '/paper.pdf': seen(pdf),
+              '*': seen(missing)}
+    return local_server(routes), requests_seen
+
+
+def test_fetch_articles_downloads_each_article_once(article_server):
+    base, requests_seen = article_server
+    store = ArticleStore(':memory:')
+    urls = [f"{base}/post", f"{base}/post?utm_source=rss", f"{base}/post#comments",
+            f"{base}/paper.pdf", f"{base}/missing"]
+
+    articles = fetch_articles(urls, store, log=io.StringIO())
+
+    assert sorted(path for path, _ in requests_seen) == ['/missing', '/paper.pdf', '/post']
+    assert articles[f"{base}/post#comments"]['title'] == 'Split PRs for parallel agents'
+    assert articles[f"{base}/post"]['etag'] == '"v1"'
+    assert articles[f"{base}/paper.pdf"]['error'].startswith('Not an HTML page')
+    assert articles[f"{base}/missing"]['error'] == 'HTTP 404'
+
+    requests_seen.clear()
+    assert fetch_articles(urls, store, log=io.StringIO()) == articles
+    assert requests_seen == []
+
+
+def test_refresh_revalidates_with_etag(article_server):
+    base, requests_seen = article_server
+    store = ArticleStore(':memory:')
+    first = fetch_articles([f"{base}/post"], store, log=io.StringIO())[f"{base}/post"]
+    requests_seen.clear()
+
+    refreshed = fetch_articles([f"{base}/post"], store, refresh=True, log=io.StringIO())
+
+    assert requests_seen == [('/post', '"v1"')]
+    assert refreshed[f"{base}/post"]['text'] == first['text']
+    assert refreshed[f"{base}/post"]['fetched_at'] >= first['fetched_at']
+
+
+def test_deadline_bounds_article_fetching(article_server):
+    base, requests_seen = article_server
+    store = ArticleStore(':memory:')
+    started = time.monotonic()
+
+    articles = fetch_articles([f"{base}/slow", f"{base}/post"], store, workers=1,
+                              deadline=Deadline(0.5), log=io.StringIO())
+
+    assert time.monotonic() - started < 1.5
+    # The queued article never started; nothing past the deadline is cached
+    assert [path for path, _ in requests_seen] == ['/slow']
+    assert articles == {f"{base}/slow": None, f"{base}/post": None}
+
+
+def test_articles_cannot_be_combined_with_shard(capsys):
+    with pytest.raises(SystemExit):
+        main(['companies', '--shard', '1/2', '--articles'])
+
+    assert '--shard and --articles cannot be combined' in capsys.readouterr().err
+
+
+def test_attach_articles_adds_article_to_items(article_server):
+    base, _ = article_server
+    results = [{'name': 'Example', 'category': None, 'updates': [{
+        'title': 'Split PRs', 'link': f"{base}/post", 'published': '2026-01-05', 'summary': '',
+        'source': 'rss', 'source_url': f"{base}/feed"}]}]
+
+    attach_articles(results, ArticleStore(':memory:'), log=io.StringIO())
+
+    article = results[0]['updates'][0]['article']
+    assert article['byline'] == 'Ada Lovelace' and article['error'] is None
+    output = format_output(results, 'markdown')
+    assert '**Article:** (' in output and 'by Ada Lovelace' in output
+    assert 'Reviewers see one concern per pull request' in output
+    assert article_markdown({**article, 'error': 'HTTP 404'}) == \
+        '**Article:** unavailable (HTTP 404)\n'
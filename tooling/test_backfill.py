@@ -0,0 +1,152 @@
+"""
+Unit tests for paged-feed history backfill against a local feed server
+"""
+
+import io
+import json
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tooling.backfill import backfill_feeds, crawl_feed, with_query_param
+from tooling.limits import HostLimiter
+from tooling.store import ItemStore
+from tooling.testing import rss
+
+NOW = datetime.utcnow()
+
+
+def posts(slug, days):
+    return [(f"Post {d}", f"https://example.com/{slug}/{d}", timedelta(days=d)) for d in days]
+
+
+@pytest.fixture
+def feed_server(local_server):
+    requested = []
+
+    def feed(body):
+        return 200, {'Content-Type': 'application/rss+xml'}, body
+
+    # RFC 5005 paged feed: page N links to page N+1
+    def rfc_page(request):
+        requested.append(request.path)
+        pages = {1: [2, 3], 2: [10, 12], 3: [30, 40], 4: [70, 80]}
+        n = int(request.path.rsplit('/', 1)[1])
+        base = f"http://127.0.0.1:{request.server.server_port}"
+        next_url = f"{base}/rfc/{n + 1}" if n + 1 in pages else None
+        return feed(rss(posts('rfc', pages[n]), next_url=next_url))
+
+    # WordPress ?paged=N, 404 past the last page
+    def wordpress(request):
+        requested.append(request.path)
+        page = int(parse_qs(urlparse(request.path).query).get('paged', ['1'])[0])
+        if page > 2:
+            return 404, {}, b''
+        return feed(rss(posts('wp', [page * 5, page * 5 + 1]),
+                        generator='https://wordpress.org/?v=6.4'))
+
+    # Substack: RSS first page, then the JSON archive API
+    def substack_feed(request):
+        requested.append(request.path)
+        return feed(rss(posts('ss', [1, 2]), generator='Substack'))
+
+    def substack_archive(request):
+        requested.append(request.path)
+        offset = int(parse_qs(urlparse(request.path).query)['offset'][0])
+        archive = [[{'title': 'Archived 20', 'canonical_url': 'https://example.com/ss/20',
+                     'post_date': (NOW - timedelta(days=20)).isoformat() + 'Z'},
+                    {'title': 'Archived 50', 'canonical_url': 'https://example.com/ss/50',
+                     'post_date': (NOW - timedelta(days=50)).isoformat() + 'Z'}],
+                   [{'title': 'Archived 90', 'canonical_url': 'https://example.com/ss/90',
+                     'post_date': (NOW - timedelta(days=90)).isoformat() + 'Z'}]]
+        index = 0 if offset == 2 else 1
+        return 200, {'Content-Type': 'application/json'}, json.dumps(archive[index])
+
+    routes = {'/rfc/*': rfc_page, '/wp/feed': wordpress, '/feed': substack_feed,
+              '/api/v1/archive': substack_archive}
+    return local_server(routes), requested
+
+
+def test_rfc5005_stops_at_start_date(feed_server, tmp_path):
+    base, requested = feed_server
+    store = ItemStore(tmp_path / 'items.sqlite3')
+    since = NOW - timedelta(days=35)
+
+    summary = crawl_feed(f"{base}/rfc/1", since, store)
+
+    assert summary['error'] is None
+    assert summary['pages'] == 3
+    assert '/rfc/4' not in requested
+    titles = [p['title'] for p in store.items_since(f"{base}/rfc/1", since)]
+    assert titles == ['Post 2', 'Post 3', 'Post 10', 'Post 12', 'Post 30']
+
+
+def test_wordpress_paged_until_404(feed_server, tmp_path):
+    base, requested = feed_server
+    store = ItemStore(tmp_path / 'items.sqlite3')
+
+    summary = crawl_feed(f"{base}/wp/feed", NOW - timedelta(days=365), store)
+
+    assert summary == {'feed_url': f"{base}/wp/feed", 'pages': 2, 'added': 4, 'error': None}
+    assert '/wp/feed?paged=3' in requested
+
+
+def test_substack_archive_pagination(feed_server, tmp_path):
+    base, requested = feed_server
+    store = ItemStore(tmp_path / 'items.sqlite3')
+    since = NOW - timedelta(days=30)
+
+    summary = crawl_feed(f"{base}/feed", since, store)
+
+    assert summary['pages'] == 2
+    assert summary['added'] == 4
+    # The archive page containing a post older than --since ends the crawl
+    assert not any('offset=4' in path for path in requested)
+
+
+def test_backfill_feeds_dedups_urls(feed_server, tmp_path):
+    base, requested = feed_server
+    store = ItemStore(tmp_path / 'items.sqlite3')
+
+    summaries = backfill_feeds([f"{base}/wp/feed", f"{base}/wp/feed"], NOW - timedelta(days=365),
+                               store, log=io.StringIO())
+
+    assert len(summaries) == 1
+    assert store.count_items() == 4
+
+
+def test_host_limiter_caps_concurrency():
+    limiter = HostLimiter(per_host=2)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def work():
+        with limiter.slot('https://example.com/feed'):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2
+
+
+def test_with_query_param():
+    assert with_query_param('https://a.com/feed/?paged=2', 'paged', 3) == 'https://a.com/feed/?paged=3'
+    assert with_query_param('https://a.com/feed/', 'paged', 2) == 'https://a.com/feed/?paged=2'
@@ -0,0 +1,80 @@
+"""
+Unit tests for time-budgeted, priority-ordered collection
+"""
+
+import io
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tooling.budget import Deadline, collect_with_budget, coverage_line, plan_company_fetches
+from tooling.companies import format_output
+from tooling.feeds import request_timeout
+from tooling.store import ItemStore
+from tooling.testing import company, rss
+
+
+def test_plan_orders_known_feeds_categories_and_yield():
+    companies = [
+        company('Fintech', 'Fintech or fintech-adjacent platforms', ['https://f.com/feed'],
+                ['https://f.com/blog']),
+        company('Tool A', 'Developer & AI tooling', ['https://a.com/feed']),
+        company('Tool B', 'Developer & AI tooling', ['https://b.com/feed']),
+        company('Model', 'Foundation models / AI platforms', blogs=['https://m.com/news']),
+    ]
+
+    tasks = plan_company_fetches(companies, yields={'https://b.com/feed': 3.0})
+
+    assert [task['url'] for task in tasks] == [
+        'https://b.com/feed',    # known feed, high-value category, productive
+        'https://a.com/feed',
+        'https://f.com/feed',
+        'https://m.com/news',    # discovery always after known feeds
+        'https://f.com/blog',
+    ]
+
+
+def test_request_timeout_clamped_to_deadline():
+    deadline = Deadline(2)
+    assert request_timeout(10, deadline) <= 2
+    assert request_timeout(10) == 10
+
+
+@pytest.fixture
+def feed_server(local_server):
+    def feed(request):
+        if request.path.startswith('/slow'):
+            time.sleep(3)
+        body = rss([(f"Post from {request.path}", f"https://example.com{request.path}/1")])
+        return 200, {'Content-Type': 'application/rss+xml'}, body
+
+    return local_server({'*': feed})
+
+
+def test_budget_returns_partial_results_on_time(feed_server, tmp_path):
+    companies = [
+        company('Model', 'Foundation models / AI platforms', [f"{feed_server}/fast1"]),
+        company('Slow', 'Developer & AI tooling', [f"{feed_server}/slow"]),
+        company('Tool', 'Developer & AI tooling', [f"{feed_server}/fast2"]),
+    ]
+    store = ItemStore(tmp_path / 'items.sqlite3')
+
+    started = time.monotonic()
+    results, coverage = collect_with_budget(companies, budget_seconds=1, workers=2, store=store,
+                                            log=io.StringIO())
+
+    assert time.monotonic() - started < 2
+    assert [len(r['updates']) for r in results] == [1, 0, 1]
+    assert results[1]['skipped'] == [f"{feed_server}/slow"]
+    assert coverage['sources_checked'] == 2
+    assert coverage['complete'] is False
+    assert store.source_yields() == {f"{feed_server}/fast1": 1.0, f"{feed_server}/fast2": 1.0}
+
+    output = format_output(results, 'markdown', coverage)
+    assert output.splitlines()[2] == coverage_line(coverage)
+    assert 'Partial results: 2 of 3 sources checked (67%)' in output
@@ -0,0 +1,124 @@
+"""
+Unit tests for the tooling package: context parsing, CLI, lazy imports
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tooling.cli import main
+from tooling.context import parse_companies_file, parse_people_file, people_with_sources
+
+COMPANIES_MD = """# Tracked Companies
+
+---
+
+## OpenAI
+**Category:** Foundation models / AI platforms
+**Primary sources:**
+- https://openai.com/blog (feed_url: https://openai.com/news/rss.xml)
+- https://platform.openai.com/docs/changelog
+
+---
+
+## GitHub
+**Category:** Developer tools
+**Primary sources:**
+- https://github.blog/changelog/
+"""
+
+PEOPLE_MD = """# Tracked People
+
+---
+
+## Shreyas Doshi
+**Primary platforms:**
+- Twitter/X: @shreyas
+- Blog: https://shreyas.io
+- LinkedIn: https://www.linkedin.com/in/shreyasdoshi/
+- RSS Feed: https://shreyas.io/feed
+
+---
+
+## No Sources
+**Primary platforms:**
+- LinkedIn: https://www.linkedin.com/in/nobody/
+"""
+
+
+def test_parse_companies_file(tmp_path):
+    path = tmp_path / 'companies.md'
+    path.write_text(COMPANIES_MD, encoding='utf-8')
+
+    companies = parse_companies_file(path)
+
+    assert [c['name'] for c in companies] == ['OpenAI', 'GitHub']
+    openai = companies[0]
+    assert openai['category'] == 'Foundation models / AI platforms'
+    assert openai['blogs'] == ['https://openai.com/blog']
+    assert openai['rss_feeds'] == ['https://openai.com/news/rss.xml']
+    assert openai['changelogs'] == ['https://platform.openai.com/docs/changelog']
+    # Known feeds are merged in by name
+    assert 'https://github.blog/feed/' in companies[1]['rss_feeds']
+
+
+def test_parse_people_file(tmp_path):
+    path = tmp_path / 'people.md'
+    path.write_text(PEOPLE_MD, encoding='utf-8')
+
+    people = parse_people_file(path)
+
+    assert len(people) == 2
+    shreyas = people[0]
+    assert shreyas['blog'] == 'https://shreyas.io'
+    assert shreyas['rss_feed'] == 'https://shreyas.io/feed'
+    assert shreyas['twitter'] == '@shreyas'
+    assert shreyas['linkedin'] == 'https://www.linkedin.com/in/shreyasdoshi/'
+    assert [p['name'] for p in people_with_sources(people)] == ['Shreyas Doshi']
+
+
+def test_report_formats_saved_results(tmp_path, capsys):
+    results = [{
+        'name': 'OpenAI',
+        'category': 'Foundation models / AI platforms',
+        'updates': [{
+            'title': 'New model',
+            'link': 'https://openai.com/news/new-model',
+            'published': '2026-01-05T10:00:00',
+            'summary': 'A new model.',
+            'source': 'rss',
+            'source_url': 'https://openai.com/news/rss.xml',
+        }],
+        'errors': [],
+    }]
+    results_file = tmp_path / 'results.json'
+    results_file.write_text(json.dumps(results), encoding='utf-8')
+
+    assert main(['report', 'companies', str(results_file)]) == 0
+
+    output = capsys.readouterr().out
+    assert '## OpenAI' in output
+    assert '### New model' in output
+    assert '**Source:** rss (https://openai.com/news/rss.xml)' in output
+
+
+def test_parse_only_commands_skip_network_dependencies(tmp_path):
+    path = tmp_path / 'companies.md'
+    path.write_text(COMPANIES_MD, encoding='utf-8')
+    code = (
+        "import sys\n"
+        "from tooling.cli import main\n"
+        f"main(['parse', 'companies', '--file', {str(path)!r}])\n"
+        "loaded = [m for m in ('requests', 'feedparser', 'bs4', 'cProfile', 'pstats',\n"
+        "                      'tracemalloc') if m in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+
+    result = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,158 @@
+"""
+Unit tests for the batch backfill dispatcher, against a local stand-in Actions API
+"""
+
+import hashlib
+import io
+import json
+import sys
+import threading
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tooling.cli import main
+from tooling.dispatch import ActionsClient, DispatchState, backfill_dates, missing_dates
+
+STUB = '---\ntitle: "No Meaningful PM-Relevant Updates Today"\ndate: 2026-01-03\n---\n'
+REPO = 'owner/repo'
+
+
+def test_missing_dates_finds_gaps_and_stubs(tmp_path):
+    (tmp_path / '2026').mkdir()
+    (tmp_path / '2026' / '2026-01-01.md').write_text('---\ntitle: "Real"\n---\n')
+    (tmp_path / '2026' / '2026-01-03.md').write_text(STUB)
+
+    assert missing_dates(tmp_path, date(2026, 1, 1), date(2026, 1, 4)) == \
+        [date(2026, 1, 2), date(2026, 1, 3), date(2026, 1, 4)]
+    assert missing_dates(tmp_path, date(2026, 1, 1), date(2026, 1, 4), include_stubs=False) == \
+        [date(2026, 1, 2), date(2026, 1, 4)]
+
+
+class FakeActions:
+    """Runs advance one step (queued, in_progress, completed) every second run listing."""
+
+    def __init__(self, fail_first=()):
+        self.runs = []
+        self.fail_first = set(fail_first)
+        self.dispatched = []
+        self.listings = 0
+        self.conditional = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def dispatch(self, day):
+        with self.lock:
+            self.dispatched.append(day)
+            self.runs.append({'id': len(self.runs) + 1, 'display_title': f"Backfill {day}",
+                              'status': 'queued', 'conclusion': None,
+                              'html_url': f"https://example.com/runs/{len(self.runs) + 1}"})
+            active = sum(run['status'] != 'completed' for run in self.runs)
+            self.max_active = max(self.max_active, active)
+
+    def listing(self):
+        with self.lock:
+            self.listings += 1
+            if self.listings % 2 == 0:
+                for run in self.runs:
+                    if run['status'] == 'queued':
+                        run['status'] = 'in_progress'
+                    elif run['status'] == 'in_progress':
+                        day = run['display_title'].split()[1]
+                        failed = day in self.fail_first
+                        self.fail_first.discard(day)
+                        run['status'], run['conclusion'] = 'completed', \
+                            'failure' if failed else 'success'
+            return json.dumps({'total_count': len(self.runs), 'workflow_runs': self.runs})
+
+
+@pytest.fixture
+def actions(local_server):
+    fake = FakeActions()
+    prefix = f"/repos/{REPO}/actions/workflows/daily-update.yml"
+
+    def dispatches(request):
+        assert request.command == 'POST'
+        assert request.headers['Authorization'] == 'token secret'
+        payload = json.loads(request.rfile.read(int(request.headers['Content-Length'])))
+        assert payload['ref'] == 'main'
+        fake.dispatch(payload['inputs']['date'])
+        return 204, {}, b''
+
+    def runs(request):
+        assert request.path.startswith(f"{prefix}/runs?event=workflow_dispatch&created=")
+        body = fake.listing().encode('utf-8')
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if request.headers.get('If-None-Match') == etag:
+            fake.conditional += 1
+            return 304, {}, b''
+        return 200, {'Content-Type': 'application/json', 'ETag': etag}, body
+
+    routes = {f"{prefix}/dispatches": dispatches, f"{prefix}/runs": runs}
+    fake.client = ActionsClient('secret', repo=REPO, api_url=local_server(routes))
+    return fake
+
+
+DATES = [date(2026, 1, day) for day in range(2, 7)]
+
+
+def test_backfill_respects_concurrency_and_backs_off(actions, tmp_path):
+    sleeps = []
+    state = DispatchState(tmp_path / 'state.json')
+
+    outcomes = backfill_dates(actions.client, DATES, state, concurrency=2, poll_interval=1,
+                              max_interval=4, sleep=sleeps.append, log=io.StringIO())
+
+    assert actions.dispatched == [day.isoformat() for day in DATES]
+    assert actions.max_active == 2
+    assert all(entry['conclusion'] == 'success' and entry['run_id'] for entry in outcomes.values())
+    # Unchanged listings come back 304 and double the interval, up to the cap
+    assert actions.conditional > 0 and actions.client.not_modified == actions.conditional
+    assert 2 in sleeps and max(sleeps) <= 4
+    saved = json.loads((tmp_path / 'state.json').read_text())
+    assert saved['2026-01-06']['url'] == outcomes['2026-01-06']['url']
+
+
+def test_failed_runs_are_dispatched_again(actions, tmp_path):
+    actions.fail_first = {'2026-01-03'}
+
+    outcomes = backfill_dates(actions.client, DATES[:2], DispatchState(tmp_path / 'state.json'),
+                              poll_interval=0, sleep=lambda seconds: None, log=io.StringIO())
+
+    assert actions.dispatched == ['2026-01-02', '2026-01-03', '2026-01-03']
+    # One at a time by default: each run sees the updates committed before it
+    assert actions.max_active == 1
+    assert outcomes['2026-01-03']['conclusion'] == 'success'
+    assert outcomes['2026-01-03']['attempts'] == 2
+    assert len(outcomes['2026-01-03']['failed_runs']) == 1
+
+
+def test_resume_follows_dispatched_runs_without_redispatching(actions, tmp_path):
+    state = DispatchState(tmp_path / 'state.json')
+    state.update('2026-01-02', status='completed', conclusion='success', run_id=99, attempts=1)
+    # Dispatched before the interruption; the stand-in already has its run
+    actions.dispatch('2026-01-03')
+    state.update('2026-01-03', status='dispatched', run_id=None, attempts=1, failed_runs=[],
+                 dispatched_at=1.0e9)
+
+    outcomes = backfill_dates(actions.client, DATES[:3], DispatchState(tmp_path / 'state.json'),
+                              poll_interval=0, sleep=lambda seconds: None, log=io.StringIO())
+
+    assert actions.dispatched == ['2026-01-03', '2026-01-04']
+    assert outcomes['2026-01-02']['run_id'] == 99
+    assert [outcomes[day]['conclusion'] for day in ('2026-01-03', '2026-01-04')] == \
+        ['success', 'success']
+
+
+def test_dispatch_dry_run_lists_missing_dates(tmp_path, capsys):
+    (tmp_path / '2026').mkdir()
+    (tmp_path / '2026' / '2026-01-02.md').write_text('---\ntitle: "Real"\n---\n')
+
+    assert main(['dispatch', '--since', '2026-01-01', '--until', '2026-01-03',
+                 '--updates-dir', str(tmp_path), '--dry-run']) == 0
+
+    assert capsys.readouterr().out.split() == ['2026-01-01', '2026-01-03']
@@ -0,0 +1,122 @@
+"""
+Unit tests for URL-equivalence fetch planning and the persistent redirect map
+"""
+
+import io
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tooling.budget import plan_company_fetches
+from tooling.companies import collect_company_updates
+from tooling.feeds import PERSONAL_RSS_PATHS
+from tooling.fetchplan import RedirectMap, SharedFetches, feed_key
+from tooling.people import check_person_posts
+from tooling.store import ItemStore
+from tooling.testing import company, rss
+
+
+def test_feed_key_ignores_scheme_and_trailing_slash():
+    assert feed_key('https://Example.com/feed/') == feed_key('http://example.com/feed') == \
+        'example.com/feed'
+    assert feed_key('https://example.com') == feed_key('http://example.com/') == 'example.com/'
+    assert feed_key('https://example.com/feed?format=rss&utm_source=x') == \
+        'example.com/feed?format=rss'
+    assert feed_key('https://example.com/feed') != feed_key('https://example.com/feed.xml')
+
+
+@pytest.fixture
+def feed_server(local_server):
+    hits = Counter()
+
+    def counted(route):
+        def respond(request):
+            hits[request.path] += 1
+            return route(request)
+        return respond
+
+    def moved(request):
+        return 301, {'Location': '/feed'}, b''
+
+    def blog(request):
+        body = '<html><head><link type="application/rss+xml" href="/feed/"></head></html>'
+        return 200, {'Content-Type': 'text/html'}, body
+
+    def feed(request):
+        body = rss([('Post', 'https://example.com/1')])
+        return 200, {'Content-Type': 'application/rss+xml'}, body
+
+    routes = {'/old-feed': counted(moved), '/blog': counted(blog), '*': counted(feed)}
+    return local_server(routes), hits
+
+
+def test_equivalent_feeds_are_fetched_once_and_shared(feed_server, tmp_path):
+    base, hits = feed_server
+    companies = [
+        company('Known and discovered', rss_feeds=[f"{base}/feed"], blogs=[f"{base}/blog"]),
+        company('Trailing slash', rss_feeds=[f"{base}/feed/"]),
+        company('Moved', rss_feeds=[f"{base}/old-feed"]),
+    ]
+    store = ItemStore(tmp_path / 'items.sqlite3')
+    fetches = SharedFetches(RedirectMap(store))
+
+    results = collect_company_updates(companies, days_back=7, fetches=fetches, log=io.StringIO())
+
+    # One post per company; the first company's blog discovered its known feed
+    assert [[(u['title'], u['source'], u['source_url']) for u in r['updates']] for r in results] == [
+        [('Post', 'rss', f"{base}/feed")],
+        [('Post', 'rss', f"{base}/feed/")],
+        [('Post', 'rss', f"{base}/old-feed")],
+    ]
+    # The redirect isn't known yet, so following it fetches /feed a second time
+    assert hits == {'/feed': 2, '/blog': 1, '/old-feed': 1}
+    assert store.redirects() == {feed_key(f"{base}/old-feed"): f"{base}/feed"}
+
+    # Next run: the learned redirect collapses the moved feed before any request
+    hits.clear()
+    fetches = SharedFetches(RedirectMap(ItemStore(tmp_path / 'items.sqlite3')))
+    collect_company_updates(companies, days_back=7, fetches=fetches, log=io.StringIO())
+    assert hits == {'/feed': 1, '/blog': 1}
+    assert fetches.summary() == '2 fetches for 5 requests'
+
+
+def test_budget_plan_shares_tasks_between_equivalent_sources():
+    store = ItemStore(':memory:')
+    store.save_redirect(feed_key('https://old.example.com/rss'), 'https://example.com/feed')
+    redirects = RedirectMap(store)
+    companies = [
+        company('A', rss_feeds=['https://example.com/feed']),
+        company('B', rss_feeds=['http://example.com/feed/']),
+        company('C', rss_feeds=['https://old.example.com/rss'],
+                blogs=['https://example.com/feed']),
+    ]
+
+    tasks = plan_company_fetches(companies, redirects=redirects)
+
+    assert [(task['kind'], task['requesters']) for task in tasks] == [
+        ('rss', [(0, 'https://example.com/feed'), (1, 'http://example.com/feed/'),
+                 (2, 'https://old.example.com/rss')]),
+        ('blog', [(2, 'https://example.com/feed')]),
+    ]
+
+
+def test_people_discovery_probes_a_short_root_list(local_server):
+    hits = Counter()
+
+    def page(request):
+        hits[(request.command, request.path)] += 1
+        status = 200 if request.path == '/people/p/' else 404
+        return status, {'Content-Type': 'text/html'}, '<html><body>No feed link here</body></html>'
+
+    base = local_server({'*': page})
+    person = {'name': 'P', 'blog': f"{base}/people/p/", 'rss_feed': None}
+
+    assert check_person_posts(person, days_back=7) == ([], [])
+    # The page, then one HEAD per root path: no blog-path variants, no GET sniffing
+    assert hits == {('GET', '/people/p/'): 1,
+                    **{('HEAD', path): 1 for path in PERSONAL_RSS_PATHS}}
@@ -0,0 +1,91 @@
+"""
+Unit tests for URL canonicalization and the link health checker
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tooling.links import LinkStore, check_links, classify, collect_links, format_report
+from tooling.urls import canonicalize_url, extract_urls
+
+
+def test_canonicalize_url():
+    assert canonicalize_url('HTTPS://Example.COM:443') == 'https://example.com/'
+    assert canonicalize_url('https://example.com/post?utm_source=x&b=2&a=1#top') == \
+        'https://example.com/post?a=1&b=2'
+    assert canonicalize_url('http://example.com:8080/x') == 'http://example.com:8080/x'
+    assert canonicalize_url('http://[::1]:8080/') == 'http://[::1]:8080/'
+    assert canonicalize_url('HTTPS://[2001:DB8::1]:443/x') == 'https://[2001:db8::1]/x'
+
+
+def test_canonicalize_url_leaves_malformed_urls_alone():
+    for url in ('http://example.com:abc/', 'http://example.com:99999/', 'http://[::1/'):
+        assert canonicalize_url(url) == url
+
+
+def test_extract_urls_strips_markdown_punctuation():
+    line = "**Source:** https://example.com/a. See also [b](https://example.com/b), https://example.com/c"
+    assert extract_urls(line) == ['https://example.com/a', 'https://example.com/b',
+                                  'https://example.com/c']
+
+
+def test_collect_links_dedups_and_records_locations(tmp_path):
+    people = tmp_path / 'people.md'
+    people.write_text("## A\n- Blog: https://a.com\n- RSS Feed: https://a.com/feed\n")
+    updates = tmp_path / 'daily' / '2026'
+    updates.mkdir(parents=True)
+    (updates / '2026-01-01.md').write_text(
+        "### Item\n**Source:** https://A.com/\nSee https://ignored.com\n")
+
+    links = collect_links([people], tmp_path / 'daily')
+
+    assert sorted(links) == ['https://a.com/', 'https://a.com/feed']
+    assert len(links['https://a.com/']['locations']) == 2
+
+
+@pytest.fixture
+def link_server(local_server):
+    counts = {'requests': 0}
+
+    def counted(route):
+        def respond(request):
+            counts['requests'] += 1
+            return route(request)
+        return respond
+
+    routes = {
+        '/moved': counted(lambda request: (301, {'Location': '/ok'}, b'')),
+        '/ok': counted(lambda request: (200, {}, b'ok')),
+        '/nohead': counted(lambda request: (405 if request.command == 'HEAD' else 200, {}, b'ok')),
+        '*': counted(lambda request: (404, {}, b'')),
+    }
+    return local_server(routes), counts
+
+
+def test_check_links_classifies_and_caches(link_server, tmp_path):
+    base, counts = link_server
+    urls = [f"{base}/ok", f"{base}/gone", f"{base}/moved", f"{base}/nohead"]
+    store = LinkStore(tmp_path / 'links.sqlite3')
+
+    results = check_links(urls, store, workers=4, log=io.StringIO())
+
+    assert {url.rsplit('/', 1)[1]: classify(r) for url, r in results.items()} == {
+        'ok': 'ok', 'gone': 'dead', 'moved': 'redirected', 'nohead': 'ok'}
+    assert results[f"{base}/moved"]['final_url'] == f"{base}/ok"
+
+    # Second run is served entirely from the cache
+    before = counts['requests']
+    check_links(urls, store, workers=4, log=io.StringIO())
+    assert counts['requests'] == before
+
+    links = {canonicalize_url(url): {'url': url, 'locations': ['people.md:1']} for url in urls}
+    report = format_report(links, results)
+    assert '1 dead' in report and '1 redirected' in report
+    assert f"{base}/gone (HTTP 404)" in report
+    assert f"{base}/ok (" not in report
@@ -0,0 +1,72 @@
+"""
+Unit tests for --profile stage accounting and profile outputs
+"""
+
+import pstats
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tooling import stages
+from tooling.cli import main
+from tooling.testing import rss
+
+
+@pytest.fixture
+def site_server(local_server):
+    def blog(request):
+        body = '<html><head><link type="application/rss+xml" href="/feed"></head></html>'
+        return 200, {'Content-Type': 'text/html'}, body
+
+    def feed(request):
+        body = rss([('Post', 'https://example.com/1')])
+        return 200, {'Content-Type': 'application/rss+xml'}, body
+
+    return local_server({'/blog': blog, '*': feed})
+
+
+def test_stage_is_a_no_op_without_profiler():
+    @stages.stage('fetch')
+    def double(x):
+        return 2 * x
+
+    assert stages._profiler is None
+    assert double(2) == 4
+
+
+def test_profile_reports_every_stage(site_server, tmp_path, capsys):
+    companies_file = tmp_path / 'companies.md'
+    companies_file.write_text(f"""# Companies
+
+---
+
+## Example
+**Category:** Developer & AI tooling
+**Primary sources:**
+- {site_server}/blog
+- {site_server}/rss.xml
+""", encoding='utf-8')
+    stats_path, collapsed_path = tmp_path / 'run.prof', tmp_path / 'run.folded'
+
+    assert main(['companies', '--companies-file', str(companies_file), '--format', 'markdown',
+                 '--store', str(tmp_path / 'items.sqlite3'),
+                 '--profile', str(stats_path), '--profile-collapsed', str(collapsed_path)]) == 0
+
+    captured = capsys.readouterr()
+    assert '### Post' in captured.out
+    stage_rows = {line.split()[0]: int(line.split()[1])
+                  for line in captured.err.split('\nStage', 1)[1].split('\n\n', 1)[0].splitlines()[1:]}
+    assert stage_rows == {'parse_context': 1, 'discover': 1, 'fetch': 2, 'parse_feed': 2,
+                          'filter': 2, 'format': 1}
+    assert 'CPU profile (top 15 by cumulative time' in captured.err
+    assert stages._profiler is None
+
+    stats = pstats.Stats(str(stats_path))
+    assert any(function == 'parse_companies_file' for _, _, function in stats.stats)
+    # Collapsed stacks: "frame;frame;... count" per line
+    lines = collapsed_path.read_text(encoding='utf-8').splitlines()
+    assert lines and all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
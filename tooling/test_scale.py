@@ -0,0 +1,66 @@
+"""
+Unit tests for the synthetic roster generator, fixture server and scaling report
+"""
+
+import io
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tooling.companies import collect_company_updates, company_sources
+from tooling.context import parse_companies_file, parse_people_file, people_with_sources
+from tooling.people import check_recent_posts
+from tooling.scale import FixtureServer, current_sizes, format_curve, measure_scaling, write_fixtures
+
+SIZES = {'companies': 8, 'people': 6}
+
+
+def test_current_sizes_counts_real_entries():
+    sizes = current_sizes()
+    assert sizes['companies'] > 10 and sizes['people'] > 10
+
+
+def test_generated_roster_parses_and_is_served(tmp_path):
+    server = FixtureServer().start()
+    try:
+        companies_file, people_file = write_fixtures(tmp_path, 2, server.base_url, SIZES)
+
+        companies = parse_companies_file(str(companies_file))
+        people = parse_people_file(str(people_file))
+        assert len(companies) == 16 and len(people) == 12
+        assert {kind for company in companies for kind, _ in company_sources(company)} == \
+            {'rss', 'blog'}
+        assert len(people_with_sources(people)) == 8
+
+        results = collect_company_updates(companies, days_back=7, log=io.StringIO())
+        # Every company gets a week of posts once, except the blogs without a feed
+        assert [len(result['updates']) for result in results] == \
+            [0 if index % 8 == 7 else 7 for index in range(16)]
+        assert [index for index, result in enumerate(results) if result['errors']] == [7, 15]
+        posts = check_recent_posts(people_with_sources(people), days_back=7)
+        assert all(len(result['posts']) == 7 for result in posts)
+    finally:
+        server.stop()
+
+
+def test_measure_scaling_reports_every_entry_point(tmp_path):
+    curves = measure_scaling([1, 2], work_dir=tmp_path, sizes=SIZES, checker_max_scale=1)
+
+    assert [row['scale'] for row in curves['parse_companies_file']] == [1, 2]
+    assert [row['scale'] for row in curves['collect_company_updates']] == [1]
+    assert [row['entries'] for row in curves['people.format_output']] == [4, 8]
+    assert all(row['seconds'] >= 0 and row['peak_bytes'] > 0
+               for rows in curves.values() for row in rows)
+    assert '## collect_company_updates' in format_curve(curves)
+
+
+def test_format_curve_flags_superlinear_steps():
+    rows = [{'scale': 1, 'entries': 100, 'seconds': 0.1, 'peak_bytes': 1000},
+            {'scale': 10, 'entries': 1000, 'seconds': 10.0, 'peak_bytes': 10000}]
+
+    output = format_curve({'parse_people_file': rows})
+
+    assert '| 10x | 1000 | 10.000 | 0.0 | 2.00 ⚠ | 1.00 |' in output
+    assert '**Superlinear:** parse_people_file at 10x' in output
@@ -0,0 +1,159 @@
+"""
+Unit tests for feed_url annotations and the listing-page extractor
+"""
+
+import io
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tooling import scrape
+from tooling.budget import collect_with_budget
+from tooling.companies import check_company_source, collect_company_updates, company_sources
+from tooling.context import parse_companies_file
+from tooling.scrape import ScrapeCache, extract_cards, parse_card_date, scrape_listing
+
+COMPANIES_MD = """# Tracked Companies
+
+---
+
+## Anthropic
+**Category:** Foundation models / AI platforms
+**Primary sources:**
+- https://www.anthropic.com/news (feed_url: scrape)
+- https://azure.microsoft.com/en-us/updates (feed_url: https://azure.microsoft.com/en-us/updates/?feed=rss)
+- https://example.com/blog
+"""
+
+
+def listing_html(recent, old):
+    return f"""<html><body>
+    <nav><a href="/news">News</a><a href="/news/page/2">Older</a><a href="/about">About</a></nav>
+    <div class="card">
+      <a href="/news/claude-launch"><img src="x.png"></a>
+      <a href="/news/claude-launch#top"><h3>Claude launch</h3><p>New model.</p></a>
+      <span class="date">{recent}</span>
+    </div>
+    <div class="card">
+      <a href="/news/old-post"><h3>Old post</h3></a><time datetime="{old}">Long ago</time>
+    </div>
+    <div class="card"><a href="/news/undated"><h3>Undated post</h3></a></div>
+    </body></html>"""
+
+
+def test_parse_companies_reads_feed_url_annotations(tmp_path):
+    path = tmp_path / 'companies.md'
+    path.write_text(COMPANIES_MD, encoding='utf-8')
+
+    company = parse_companies_file(path)[0]
+
+    assert company['feed_urls'] == {
+        'https://www.anthropic.com/news': 'scrape',
+        'https://azure.microsoft.com/en-us/updates':
+            'https://azure.microsoft.com/en-us/updates/?feed=rss',
+    }
+    assert company['rss_feeds'] == ['https://azure.microsoft.com/en-us/updates/?feed=rss']
+    # Annotated pages are never probed for a feed
+    assert company_sources(company) == [
+        ('rss', 'https://azure.microsoft.com/en-us/updates/?feed=rss'),
+        ('scrape', 'https://www.anthropic.com/news'),
+        ('blog', 'https://example.com/blog'),
+    ]
+
+
+def test_parse_card_date():
+    assert parse_card_date('Jan. 5, 2026') == datetime(2026, 1, 5)
+    assert parse_card_date('Published 5 January 2026 by Ann') == datetime(2026, 1, 5)
+    assert parse_card_date('2026-01-05T10:00:00Z') == datetime(2026, 1, 5, 10)
+    assert parse_card_date('Read more') is None
+
+
+def test_extract_cards_default_rule():
+    cards = extract_cards(listing_html('Jan 5, 2026', '2020-01-01'),
+                          'https://www.anthropic.com/news')
+
+    assert [card['link'] for card in cards] == [
+        'https://www.anthropic.com/news/claude-launch',
+        'https://www.anthropic.com/news/old-post',
+        'https://www.anthropic.com/news/undated',
+    ]
+    assert cards[0] == {'title': 'Claude launch', 'link': cards[0]['link'],
+                        'published': '2026-01-05T00:00:00', 'summary': 'New model.'}
+    assert cards[1]['published'] == '2020-01-01T00:00:00'
+    assert cards[2]['published'] is None
+
+
+def test_extract_cards_site_selectors():
+    html = '<ul><li class="post"><a href="/x">X</a></li><li><a href="/y">Nav</a></li></ul>'
+    selectors = {**scrape.DEFAULT_SELECTORS, 'card': 'li.post'}
+
+    assert [card['title'] for card in extract_cards(html, 'https://a.com/', selectors)] == ['X']
+
+
+@pytest.fixture
+def listing_server(local_server):
+    recent = (datetime.now() - timedelta(days=1)).strftime('%B %d, %Y')
+    state = {'body': listing_html(recent, '2020-01-01'), 'requests': 0}
+
+    def listing(request):
+        state['requests'] += 1
+        return 200, {'Content-Type': 'text/html'}, state['body']
+
+    return local_server({'/news': listing}) + "/news", state
+
+
+def test_scrape_listing_filters_and_caches_by_content(listing_server, tmp_path, monkeypatch):
+    page_url, state = listing_server
+    cache = ScrapeCache(tmp_path / 'scrape.sqlite3')
+    extractions = []
+    real_extract = scrape.extract_cards
+    monkeypatch.setattr(scrape, 'extract_cards',
+                        lambda *args: extractions.append(1) or real_extract(*args))
+
+    posts, error = scrape_listing(page_url, days_back=7, cache=cache)
+    assert error is None
+    assert [post['title'] for post in posts] == ['Claude launch']
+
+    # Same content: one fetch, no re-parse
+    scrape_listing(page_url, cache=cache)
+    assert state['requests'] == 2 and len(extractions) == 1
+
+    state['body'] = state['body'].replace('Old post', 'Renamed post')
+    scrape_listing(page_url, cache=cache)
+    assert len(extractions) == 2
+
+
+def test_scrape_source_makes_one_request(listing_server, tmp_path, monkeypatch):
+    page_url, state = listing_server
+    monkeypatch.setattr(scrape, '_default_cache', ScrapeCache(tmp_path / 'scrape.sqlite3'))
+    company = {'name': 'A', 'category': None, 'rss_feeds': [], 'blogs': [page_url],
+               'feed_urls': {page_url: 'scrape'}}
+
+    updates, errors = check_company_source(company, *company_sources(company)[0])
+
+    assert errors == [] and state['requests'] == 1
+    assert updates[0]['source'] == 'scrape' and updates[0]['source_url'] == page_url
+
+
+def test_equivalent_scrape_sources_share_one_request(listing_server, tmp_path, monkeypatch):
+    page_url, state = listing_server
+    monkeypatch.setattr(scrape, '_default_cache', ScrapeCache(tmp_path / 'scrape.sqlite3'))
+    spellings = [page_url, page_url + '/']
+    companies = [{'name': name, 'category': None, 'rss_feeds': [], 'blogs': [url],
+                  'feed_urls': {url: 'scrape'}, 'changelogs': []}
+                 for name, url in zip('AB', spellings)]
+
+    results = collect_company_updates(companies, days_back=7, log=io.StringIO())
+    budgeted, _ = collect_with_budget(companies, days_back=7, budget_seconds=10,
+                                      log=io.StringIO())
+
+    # One request per run; every company still gets the posts under its own URL
+    assert state['requests'] == 2
+    for result in results + budgeted:
+        assert [update['title'] for update in result['updates']] == ['Claude launch']
+    assert [result['updates'][0]['source_url'] for result in budgeted] == spellings
@@ -0,0 +1,95 @@
+"""
+Unit tests for consistent-hash sharding and merging of collector results
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tooling import companies as companies_module
+from tooling import people as people_module
+from tooling.shard import (HashRing, collect_company_shard, collect_people_shard,
+                           merge_company_partials, merge_people_partials, parse_shard)
+
+
+def fake_check_rss_feed(feed_url, days_back=7, **kwargs):
+    if 'broken' in feed_url:
+        return None, "Error fetching RSS feed: 500"
+    return [{'title': f"Post from {feed_url}", 'link': f"{feed_url}/post",
+             'published': '2026-01-05T10:00:00', 'summary': ''}], None
+
+
+def fake_try_find_rss_feed(blog_url, deadline=None, paths=None):
+    return None if 'nofeed' in blog_url else blog_url.rstrip('/') + '/feed'
+
+
+@pytest.fixture(autouse=True)
+def no_network(monkeypatch):
+    for module in (companies_module, people_module):
+        monkeypatch.setattr(module, 'check_rss_feed', fake_check_rss_feed)
+        monkeypatch.setattr(module, 'try_find_rss_feed', fake_try_find_rss_feed)
+
+
+COMPANIES = [
+    {'name': f"Company {i}", 'category': 'Developer & AI tooling', 'changelogs': [],
+     'rss_feeds': [f"https://c{i}.example.com/feed"] + (['https://broken.example.com/feed'] if i == 3 else []),
+     'blogs': [f"https://c{i}.example.com/blog", 'https://nofeed.example.com/blog']}
+    for i in range(12)
+]
+
+PEOPLE = [
+    {'name': f"Person {i}", 'rss_feed': f"https://p{i}.example.com/feed" if i % 2 else None,
+     'blog': f"https://p{i}.example.com", 'newsletter': None, 'linkedin': None, 'twitter': None}
+    for i in range(10)
+]
+
+
+def test_parse_shard():
+    assert parse_shard('2/4') == (2, 4)
+    for bad in ('0/4', '5/4', 'x', '1/0'):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+
+def test_ring_is_deterministic_and_stable():
+    urls = [f"https://site{i}.example.com/feed" for i in range(2000)]
+    four, five = HashRing(4), HashRing(5)
+
+    assignments = [four.shard_for(url) for url in urls]
+    assert assignments == [HashRing(4).shard_for(url) for url in urls]
+    assert set(assignments) == {1, 2, 3, 4}
+    # Equivalent spellings land on the same shard
+    assert four.shard_for('HTTPS://Site1.example.com/feed') == four.shard_for(urls[1])
+    # Growing the ring only moves about 1/5 of the sources
+    moved = sum(1 for url, shard in zip(urls, assignments) if five.shard_for(url) != shard)
+    assert moved < len(urls) * 0.35
+
+
+def test_merged_company_shards_match_unsharded_run():
+    expected = companies_module.collect_company_updates(COMPANIES, log=io.StringIO())
+    partials = [collect_company_shard(COMPANIES, i, 3) for i in (1, 2, 3)]
+
+    merged = merge_company_partials(COMPANIES, partials)
+
+    assert merged == expected
+    assert companies_module.format_output(merged, 'markdown') == \
+        companies_module.format_output(expected, 'markdown')
+
+
+def test_merged_people_shards_match_unsharded_run():
+    expected = people_module.check_recent_posts(PEOPLE)
+    partials = [collect_people_shard(PEOPLE, i, 4) for i in (1, 2, 3, 4)]
+
+    assert merge_people_partials(PEOPLE, partials) == expected
+
+
+def test_merge_rejects_incomplete_shard_set():
+    partials = [collect_company_shard(COMPANIES, i, 3) for i in (1, 3)]
+
+    with pytest.raises(ValueError, match='Incomplete'):
+        merge_company_partials(COMPANIES, partials)
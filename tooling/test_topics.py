@@ -0,0 +1,128 @@
+"""
+Unit tests for TF-IDF topic clustering of collected and archived items
+"""
+
+import random
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+pytest.importorskip('numpy')
+pytest.importorskip('scipy')
+
+from tooling.topics import (archive_items, cluster_items, format_clusters, result_items,
+                            similar_pairs, tfidf_matrix)
+
+DAILY_MD = """---
+title: "Test"
+date: 2026-01-02
+---
+
+## The Short Version
+
+Summary text.
+
+---
+
+### Cursor — Split PRs for Parallel Agents
+**Source:** https://cursor.com/changelog/1
+**Credibility:** High
+
+**What happened:** Cursor splits large agent diffs into reviewable pull requests.
+
+---
+
+## Sit With This
+
+### A reflection heading without a source
+Not an item.
+"""
+
+
+def item(title, summary='', published='2026-01-05'):
+    return {'title': title, 'link': f"https://example.com/{len(title)}", 'published': published,
+            'summary': summary}
+
+
+def test_archive_items_reads_sourced_blocks_in_range(tmp_path):
+    (tmp_path / '2026').mkdir()
+    (tmp_path / '2026' / '2026-01-02.md').write_text(DAILY_MD, encoding='utf-8')
+    (tmp_path / '2026' / '2026-02-02.md').write_text(DAILY_MD, encoding='utf-8')
+
+    items = archive_items(tmp_path, since=date(2026, 1, 1), until=date(2026, 1, 31))
+
+    assert len(items) == 1
+    assert items[0]['title'] == 'Cursor — Split PRs for Parallel Agents'
+    assert items[0]['link'] == 'https://cursor.com/changelog/1'
+    assert items[0]['published'] == '2026-01-02'
+    assert 'reviewable pull requests' in items[0]['summary']
+    assert '**' not in items[0]['summary'] and 'Sit With This' not in items[0]['summary']
+
+
+def test_result_items_accepts_company_people_and_budget_results():
+    companies = [{'name': 'Cursor', 'updates': [item('A')]}]
+    people = [{'name': 'Lenny', 'posts': [item('B')]}]
+
+    assert [i['origin'] for i in result_items(companies) + result_items(people)] == \
+        ['Cursor', 'Lenny']
+    assert result_items({'coverage': {}, 'results': companies})[0]['title'] == 'A'
+
+
+def test_tfidf_rows_are_unit_length():
+    matrix, terms = tfidf_matrix(['agents agents ship', 'pricing pages', ''])
+
+    norms = (matrix.multiply(matrix)).sum(axis=1).A.ravel()
+    assert norms == pytest.approx([1, 1, 0])
+    assert 'agents' in terms and 'the' not in terms
+
+
+def test_batched_pairs_match_unbatched():
+    matrix, _ = tfidf_matrix([f"topic{i % 7} shared word{i}" for i in range(50)])
+
+    assert (similar_pairs(matrix, 0.2, batch_size=8) != similar_pairs(matrix, 0.2)).nnz == 0
+
+
+def test_cluster_items_groups_related_items():
+    items = [
+        item('Cursor ships Split PRs', 'split large agent pull requests for review'),
+        item('Cursor Split PRs and parallel agents', 'pull requests split for review', '2026-01-06'),
+        item('Stripe Link spending data', 'consumer AI spending on Link'),
+        item('What Link data says about AI spending', 'Stripe consumer spending'),
+        item('Unrelated podcast about resilience', 'founders and CEO turnover'),
+    ]
+
+    clusters = cluster_items(items, representatives=1)
+
+    assert sorted(sorted(i['title'] for i in cluster['items']) for cluster in clusters) == [
+        ['Cursor Split PRs and parallel agents', 'Cursor ships Split PRs'],
+        ['Stripe Link spending data', 'What Link data says about AI spending'],
+    ]
+    split_prs = next(cluster for cluster in clusters if 'split' in cluster['label'])
+    assert split_prs['items'][0]['published'] == '2026-01-06'  # newest first
+    assert len(split_prs['representatives']) == 1
+
+    output = format_clusters(clusters, 'markdown', total_items=len(items))
+    assert '*2 topics covering 4 of 5 items*' in output
+    assert output.count('- **[') == 2
+
+
+def test_month_of_items_clusters_in_under_a_second():
+    # 3000 items about 150 topics, each with 5 topic terms and 40 background words
+    rng = random.Random(0)
+    background = [f"word{i}" for i in range(5000)]
+    items = []
+    for i in range(3000):
+        topic = [f"topic{i % 150}term{j}" for j in range(5)]
+        items.append(item(' '.join(topic), ' '.join(topic + rng.sample(background, 40))))
+
+    cluster_items(items[:10])  # NumPy/SciPy imports aren't part of the budget
+    started = time.perf_counter()
+    clusters = cluster_items(items)
+    assert time.perf_counter() - started < 1
+    assert len(clusters) == 150
@@ -0,0 +1,220 @@
+"""
+End-to-end tests for WebSub push subscriptions against a local stand-in hub
+"""
+
+import hashlib
+import hmac
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+import sys
+from urllib.parse import parse_qs, urlencode
+
+import pytest
+import requests
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tooling.feeds import check_rss_feed, parse_feed
+from tooling.store import ItemStore
+from tooling.websub import PushSubscriber, make_server, subscription_id, valid_signature
+
+
+def atom_feed(hub_url, self_url, entries):
+    items = ''.join(
+        f"<entry><title>{title}</title><link href=\"{link}\"/><id>{link}</id>"
+        f"<updated>{updated}</updated><summary>{title} summary</summary></entry>"
+        for title, link, updated in entries)
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom"><title>Test blog</title>'
+        f'<link rel="hub" href="{hub_url}"/><link rel="self" href="{self_url}"/>'
+        f'<updated>{entries[0][2]}</updated>{items}</feed>'
+    ).encode('utf-8')
+
+
+def rfc3339(days_ago):
+    return (datetime.utcnow() - timedelta(days=days_ago)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+@pytest.fixture
+def servers(local_server):
+    """A feed server and a stand-in hub that verifies intent then pushes one entry."""
+    state = {'feed_gets': 0, 'verified': threading.Event(), 'pushed': threading.Event()}
+
+    def feed(request):
+        state['feed_gets'] += 1
+        body = atom_feed(state['hub_url'], state['feed_url'],
+                         [('Polled post', 'https://example.com/polled', rfc3339(1))])
+        return 200, {'Content-Type': 'application/atom+xml'}, body
+
+    def deliver(form):
+        callback = form['hub.callback']
+        verify = requests.get(callback + '?' + urlencode({
+            'hub.mode': 'subscribe',
+            'hub.topic': form['hub.topic'],
+            'hub.challenge': 'challenge-123',
+            'hub.lease_seconds': form['hub.lease_seconds'],
+        }), timeout=5)
+        if verify.status_code != 200 or verify.text != 'challenge-123':
+            return
+        state['verified'].set()
+
+        body = atom_feed(state['hub_url'], state['feed_url'],
+                         [('Pushed post', 'https://example.com/pushed', rfc3339(0))])
+        # A plain-HTTP hub gets no secret, so it pushes unsigned content
+        state['form'] = form
+        requests.post(callback, data=body, timeout=5,
+                      headers={'Content-Type': 'application/atom+xml'})
+        state['pushed'].set()
+
+    # The hub replies before it verifies, so it needs a handler of its own
+    class HubHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers['Content-Length'])
+            form = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode()).items()}
+            self.send_response(202)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            threading.Thread(target=deliver, args=(form,), daemon=True).start()
+
+        def log_message(self, *args):
+            pass
+
+    state['feed_url'] = local_server({'/feed': feed}) + '/feed'
+    state['hub_url'] = local_server(HubHandler) + '/hub'
+    return state
+
+
+def test_push_subscription_replaces_polling(servers, local_server, tmp_path):
+    store = ItemStore(tmp_path / 'items.sqlite3')
+    push = PushSubscriber(store, local_server(make_server(store, port=0)))
+    feed_url = servers['feed_url']
+
+    # First run polls, discovers the hub and subscribes
+    posts, error = check_rss_feed(feed_url, push=push)
+    assert error is None
+    assert [p['title'] for p in posts] == ['Polled post']
+    assert servers['verified'].wait(5)
+    assert servers['pushed'].wait(5)
+    assert push.is_active(feed_url)
+    assert 'hub.secret' not in servers['form']
+
+    # Later runs read pushed entries from the store without fetching the feed
+    posts, error = check_rss_feed(feed_url, push=push)
+    assert error is None
+    assert [p['title'] for p in posts] == ['Pushed post', 'Polled post']
+    assert servers['feed_gets'] == 1
+
+
+def test_unknown_topic_verification_is_rejected(local_server, tmp_path):
+    store = ItemStore(tmp_path / 'items.sqlite3')
+    base = local_server(make_server(store, port=0))
+
+    response = requests.get(base + '/websub/unknown?' + urlencode({
+        'hub.mode': 'subscribe', 'hub.topic': 'https://example.com/feed', 'hub.challenge': 'x'}))
+
+    assert response.status_code == 404
+
+
+def test_malformed_lease_is_rejected(local_server, tmp_path):
+    store = ItemStore(tmp_path / 'items.sqlite3')
+    topic = 'https://example.com/feed'
+    store.save_subscription(topic, subscription_id(topic), topic, 'https://hub.example.com/',
+                            None, 'pending')
+    base = local_server(make_server(store, port=0))
+
+    response = requests.get(f"{base}/websub/{subscription_id(topic)}?" + urlencode({
+        'hub.mode': 'subscribe', 'hub.topic': topic, 'hub.challenge': 'x',
+        'hub.lease_seconds': 'ten days'}))
+
+    assert response.status_code == 400
+    assert store.get_subscription_by_id(subscription_id(topic))['state'] == 'pending'
+
+
+FEED = 'https://example.com/feed'
+HUB = 'https://hub.example.com/'
+
+
+def recorded_subscribes(push):
+    calls = []
+    push.subscribe = lambda feed_url, hub, topic: calls.append(feed_url) or True
+    return calls
+
+
+def polled_feed():
+    feed, _ = parse_feed(atom_feed(HUB, FEED, [('Post', 'https://example.com/1', rfc3339(1))]))
+    return feed
+
+
+def test_expired_lease_is_renewed_when_polled():
+    store = ItemStore(':memory:')
+    store.save_subscription(FEED, subscription_id(FEED), FEED, HUB, 'secret', 'active',
+                            time.time() - 60)
+    push = PushSubscriber(store, 'http://127.0.0.1:8080')
+    calls = recorded_subscribes(push)
+
+    assert not push.is_active(FEED)
+    assert push.observe(FEED, polled_feed())
+    assert calls == [FEED]
+
+
+def test_unverified_subscription_is_retried_after_timeout():
+    store = ItemStore(':memory:')
+    store.save_subscription(FEED, subscription_id(FEED), FEED, HUB, 'secret', 'pending')
+
+    waiting = PushSubscriber(store, 'http://127.0.0.1:8080')
+    calls = recorded_subscribes(waiting)
+    assert waiting.observe(FEED, polled_feed())
+    assert calls == []
+
+    timed_out = PushSubscriber(store, 'http://127.0.0.1:8080', verify_timeout=0)
+    calls = recorded_subscribes(timed_out)
+    assert timed_out.observe(FEED, polled_feed())
+    assert calls == [FEED]
+
+
+def test_denied_subscription_backs_off():
+    store = ItemStore(':memory:')
+    store.save_subscription(FEED, subscription_id(FEED), FEED, HUB, 'secret', 'denied')
+
+    push = PushSubscriber(store, 'http://127.0.0.1:8080')
+    calls = recorded_subscribes(push)
+    assert not push.observe(FEED, polled_feed())
+    assert calls == []
+
+    retry = PushSubscriber(store, 'http://127.0.0.1:8080', denied_backoff=0)
+    calls = recorded_subscribes(retry)
+    assert retry.observe(FEED, polled_feed())
+    assert calls == [FEED]
+
+
+def test_secret_is_only_sent_to_https_hubs(monkeypatch):
+    sent = []
+
+    class Accepted:
+        status_code = 202
+
+    monkeypatch.setattr(requests, 'post', lambda url, data, timeout: sent.append(data) or Accepted())
+    store = ItemStore(':memory:')
+    push = PushSubscriber(store, 'http://127.0.0.1:8080')
+
+    assert push.subscribe(FEED, HUB, FEED)
+    assert push.subscribe('http://example.com/feed', 'http://hub.example.com/',
+                          'http://example.com/feed')
+
+    assert [('hub.secret' in data) for data in sent] == [True, False]
+    assert store.get_subscription(FEED)['secret'] == sent[0]['hub.secret']
+    assert store.get_subscription('http://example.com/feed')['secret'] is None
+
+
+def test_valid_signature():
+    body = b'<feed/>'
+    digest = hmac.new(b'secret', body, hashlib.sha1).hexdigest()
+
+    assert valid_signature('secret', body, f'sha1={digest}')
+    assert not valid_signature('other', body, f'sha1={digest}')
+    assert not valid_signature('secret', body, None)
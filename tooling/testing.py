@@ -0,0 +1,75 @@
+"""
+Builders shared by the tooling tests: feed bodies, company entries and routed
+request handlers for the ``local_server`` fixture
+"""
+
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlparse
+
+RECENT = timedelta(hours=1)
+
+
+def rfc822(age):
+    return (datetime.utcnow() - age).strftime('%a, %d %b %Y %H:%M:%S +0000')
+
+
+def rss(items, generator='', next_url=None):
+    """RSS 2.0 bytes for ``(title, link)`` or ``(title, link, age)`` items.
+
+    ``age`` is a timedelta before now (an hour by default). ``next_url`` adds
+    an RFC 5005 ``rel="next"`` link.
+    """
+    next_link = f'<atom:link rel="next" href="{next_url}"/>' if next_url else ''
+    body = ''.join(
+        f"<item><title>{item[0]}</title><link>{item[1]}</link>"
+        f"<pubDate>{rfc822(item[2] if len(item) > 2 else RECENT)}</pubDate></item>"
+        for item in items)
+    return (
+        '<?xml version="1.0"?><rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">'
+        f'<channel><title>Feed</title><generator>{generator}</generator>{next_link}{body}'
+        '</channel></rss>'
+    ).encode('utf-8')
+
+
+def company(name, category='Developer & AI tooling', rss_feeds=(), blogs=(), changelogs=()):
+    """A company entry shaped like ``context.parse_companies_file`` output."""
+    return {'name': name, 'category': category, 'rss_feeds': list(rss_feeds),
+            'blogs': list(blogs), 'changelogs': list(changelogs)}
+
+
+def route_handler(routes):
+    """A request handler class that dispatches on the request path.
+
+    ``routes`` maps a path (query string ignored) to a function taking the
+    handler instance and returning ``(status, headers, body)``. A key ending in
+    ``*`` matches by prefix and ``'*'`` alone matches anything; unmatched
+    paths get a 404. GET, HEAD and POST all go through the same function, and
+    HEAD replies drop the body.
+    """
+    def find(path):
+        if path in routes:
+            return routes[path]
+        prefixes = [key for key in routes if key.endswith('*') and path.startswith(key[:-1])]
+        return routes[max(prefixes, key=len)] if prefixes else None
+
+    class Handler(BaseHTTPRequestHandler):
+        def _dispatch(self):
+            route = find(urlparse(self.path).path)
+            status, headers, body = route(self) if route else (404, {}, b'')
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if self.command != 'HEAD':
+                self.wfile.write(body)
+
+        do_GET = do_HEAD = do_POST = _dispatch
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
@@ -0,0 +1,228 @@
+"""
+Topic clustering of collected items for daily research and monthly summaries.
+
+1. Gathers items from saved ``companies``/``posts`` JSON results and from
+   archived items in updates/daily (``### Title`` blocks with a ``**Source:**``
+   line)
+2. Builds L2-normalised sparse TF-IDF vectors (SciPy CSR, sublinear tf,
+   smoothed idf)
+3. Computes cosine similarity in row batches (one sparse x sparse product per
+   batch, never the full n x n matrix), keeps pairs above ``--threshold`` and
+   takes connected components of that graph as topics
+4. Labels each topic with its centroid's top terms and picks representative
+   items by similarity to the centroid
+
+NumPy and SciPy are only needed here, and are imported on first use.
+"""
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+
+from tooling.deps import require
+from tooling.stages import stage
+from tooling.urls import extract_urls
+
+DEFAULT_THRESHOLD = 0.3
+DEFAULT_MIN_SIZE = 2
+DEFAULT_REPRESENTATIVES = 3
+BATCH_SIZE = 1024
+# Terms in more than this share of items are dropped (once there are enough
+# items for the share to mean something): they link everything to everything
+MAX_DOCUMENT_SHARE = 0.5
+MIN_ITEMS_FOR_MAX_SHARE = 20
+LABEL_TERMS = 4
+
+TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9+#'-]*[a-z0-9+#]")
+DATE_IN_NAME = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+STOPWORDS = frozenset("""
+a about above after again against all also an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further
+had has have having he her here hers him his how i if in into is it its itself just more most
+my no nor not now of off on once only or other our out over own same she should so some such
+than that the their them then there these they this those through to too under until up very
+was we were what when where which while who whom why will with would you your new now via
+it's don't isn't doesn't won't can't one two three make makes made get gets like use uses
+used using way ways what's
+""".split())
+
+# Markdown labels of archived items, which every item repeats
+ARCHIVE_LABELS = re.compile(r'\*\*[^*]+:\*\*')
+
+
+def tokenize(text):
+    """Lowercase word tokens with stopwords and one-letter words removed."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def _parse_date(value):
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value)[:10]).date()
+    except ValueError:
+        return None
+
+
+def archive_items(updates_dir, since=None, until=None):
+    """Items from updates/daily markdown files dated ``since``..``until`` (inclusive)."""
+    items = []
+    for path in sorted(Path(updates_dir).glob('**/*.md')):
+        match = DATE_IN_NAME.search(path.name)
+        day = _parse_date(match.group(1)) if match else None
+        if day is None or (since and day < since) or (until and day > until):
+            continue
+        content = path.read_text(encoding='utf-8')
+        for block in re.split(r'^### ', content, flags=re.M)[1:]:
+            heading, _, body = block.partition('\n')
+            source = next((line for line in body.splitlines() if '**Source:**' in line), None)
+            if source is None:
+                continue
+            # Stop at the next level-2 section ("## Quick Hits" etc.)
+            body = re.split(r'^## ', body, maxsplit=1, flags=re.M)[0]
+            urls = extract_urls(source)
+            items.append({
+                'title': heading.strip(),
+                'link': urls[0] if urls else '',
+                'published': day.isoformat(),
+                'summary': ARCHIVE_LABELS.sub(' ', body.replace(source, '')).strip(),
+                'origin': str(path),
+            })
+    return items
+
+
+def result_items(results):
+    """Items from saved ``companies`` or ``posts`` results (plain or ``--budget`` JSON)."""
+    if isinstance(results, dict):
+        results = results['results']
+    items = []
+    for result in results:
+        for post in result.get('updates', result.get('posts', [])):
+            items.append({
+                'title': post.get('title', ''),
+                'link': post.get('link', ''),
+                'published': post.get('published'),
+                'summary': post.get('summary', ''),
+                'origin': result['name'],
+            })
+    return items
+
+
+def tfidf_matrix(texts):
+    """Sparse (n_items x n_terms) TF-IDF matrix with unit-length rows, and the vocabulary."""
+    np = require('numpy')
+    sparse = require('scipy.sparse')
+
+    vocabulary = {}
+    lengths, cols = [], []
+    for text in texts:
+        tokens = tokenize(text)
+        lengths.append(len(tokens))
+        cols.extend([vocabulary.setdefault(token, len(vocabulary)) for token in tokens])
+    rows = np.repeat(np.arange(len(texts)), lengths)
+
+    counts = sparse.csr_matrix((np.ones(len(cols), dtype=np.float32), (rows, cols)),
+                               shape=(len(texts), len(vocabulary)))
+    counts.sum_duplicates()
+    counts.data = 1 + np.log(counts.data)
+
+    document_frequency = np.bincount(counts.indices, minlength=len(vocabulary))
+    idf = (np.log((1 + len(texts)) / (1 + document_frequency)) + 1).astype(np.float32)
+    if len(texts) >= MIN_ITEMS_FOR_MAX_SHARE:
+        idf[document_frequency > MAX_DOCUMENT_SHARE * len(texts)] = 0
+    matrix = counts @ sparse.diags(idf)
+    matrix.eliminate_zeros()
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    matrix = sparse.diags(1 / norms) @ matrix
+    terms = [None] * len(vocabulary)
+    for token, index in vocabulary.items():
+        terms[index] = token
+    return matrix.tocsr(), terms
+
+
+def similar_pairs(matrix, threshold=DEFAULT_THRESHOLD, batch_size=BATCH_SIZE):
+    """Sparse upper-triangular adjacency of item pairs with cosine similarity >= threshold."""
+    np = require('numpy')
+    sparse = require('scipy.sparse')
+
+    n = matrix.shape[0]
+    # Terms found in a single item can't link it to anything
+    shared = np.bincount(matrix.indices, minlength=matrix.shape[1]) > 1
+    matrix = matrix[:, np.flatnonzero(shared)]
+    rows, cols = [], []
+    transposed = matrix.T.tocsc()
+    for start in range(0, n, batch_size):
+        block = (matrix[start:start + batch_size] @ transposed).tocoo()
+        keep = (block.data >= threshold) & (block.row + start < block.col)
+        rows.append(block.row[keep] + start)
+        cols.append(block.col[keep])
+
+    rows = np.concatenate(rows) if rows else np.array([], dtype=np.int64)
+    cols = np.concatenate(cols) if cols else np.array([], dtype=np.int64)
+    return sparse.csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n))
+
+
+@stage('cluster')
+def cluster_items(items, threshold=DEFAULT_THRESHOLD, min_size=DEFAULT_MIN_SIZE,
+                  representatives=DEFAULT_REPRESENTATIVES):
+    """Group items into topics, largest first.
+
+    Returns dicts with ``label`` (top terms), ``size``, ``representatives``
+    (the items closest to the topic centroid) and ``items`` (all members,
+    newest first). Topics smaller than ``min_size`` are dropped.
+    """
+    if not items:
+        return []
+    np = require('numpy')
+    connected_components = require('scipy.sparse.csgraph').connected_components
+
+    # Titles carry the most signal per word, so they count twice
+    matrix, terms = tfidf_matrix([f"{item['title']} {item['title']} {item.get('summary') or ''}"
+                                  for item in items])
+    count, labels = connected_components(similar_pairs(matrix, threshold), directed=False)
+
+    clusters = []
+    for component in np.flatnonzero(np.bincount(labels, minlength=count) >= min_size):
+        members = np.flatnonzero(labels == component)
+        centroid = np.asarray(matrix[members].mean(axis=0)).ravel()
+        closeness = matrix[members] @ centroid
+        ranked = members[np.argsort(-closeness, kind='stable')]
+        top_terms = [terms[index] for index in np.argsort(-centroid)[:LABEL_TERMS]
+                     if centroid[index] > 0]
+        clusters.append({
+            'label': ', '.join(top_terms),
+            'size': len(members),
+            'representatives': [items[index] for index in ranked[:representatives]],
+            'items': sorted((items[index] for index in members),
+                            key=lambda item: item.get('published') or '', reverse=True),
+        })
+
+    clusters.sort(key=lambda cluster: -cluster['size'])
+    return clusters
+
+
+@stage('format')
+def format_clusters(clusters, output_format='markdown', total_items=None):
+    """Format topic clusters for output."""
+    if output_format == 'json':
+        return json.dumps(clusters, indent=2, ensure_ascii=False)
+
+    output = "# Topic Clusters\n\n"
+    if total_items is not None:
+        clustered = sum(cluster['size'] for cluster in clusters)
+        output += f"*{len(clusters)} topics covering {clustered} of {total_items} items*\n\n"
+    for cluster in clusters:
+        output += f"## {cluster['label']}\n"
+        output += f"*{cluster['size']} items*\n\n"
+        for item in cluster['items']:
+            title = f"[{item['title']}]({item['link']})"
+            if item in cluster['representatives']:
+                title = f"**{title}**"
+            published = f" ({item['published'][:10]})" if item.get('published') else ""
+            output += f"- {title}{published}\n"
+        output += "\n"
+    return output
@@ -0,0 +1,56 @@
+"""
+URL extraction and canonicalization.
+
+Pure Python only - no network and no third-party imports.
+"""
+
+import re
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+URL_PATTERN = re.compile(r'https?://[^\s\)\]<>"\'`]+')
+
+# Query parameters that never change the resource
+TRACKING_PREFIXES = ('utm_',)
+TRACKING_PARAMS = {'ref', 'ref_src', 'fbclid', 'gclid', 'mc_cid', 'mc_eid'}
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+
+def clean_url(url):
+    """Strip trailing punctuation picked up from markdown prose."""
+    return url.rstrip('.,;:!?*_')
+
+
+def _is_tracking_param(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url):
+    """Normalize a URL so equivalent spellings compare equal.
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    parameters, sorts the remaining query, and collapses an empty path to ``/``.
+    URLs that can't be parsed (a non-numeric or out-of-range port, a broken
+    IPv6 literal) are returned unchanged.
+    """
+    try:
+        parsed = urlparse(clean_url(url.strip()))
+        port = parsed.port
+    except ValueError:
+        return url
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or '').lower()
+    if ':' in host:
+        host = f"[{host}]"
+    if port and str(port) != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+
+    query = sorted((k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+                   if not _is_tracking_param(k))
+
+    return urlunparse((scheme, host, parsed.path or '/', '', urlencode(query), ''))
+
+
+def extract_urls(text):
+    """All http(s) URLs in a block of text, cleaned of trailing punctuation."""
+    return [clean_url(url) for url in URL_PATTERN.findall(text)]
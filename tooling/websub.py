@@ -0,0 +1,266 @@
+"""
+WebSub (PubSubHubbub) push subscriptions for feeds that advertise a hub.
+
+Flow:
+1. While polling a feed, ``PushSubscriber.observe`` looks for a ``rel="hub"``
+   link (HTTP Link header or in the feed) and sends a subscribe request.
+2. The hub verifies intent with a GET to our callback; ``serve`` answers it
+   and marks the subscription active for the lease period.
+3. The hub POSTs new content to the callback; entries are stored in the
+   ``ItemStore``.
+4. ``check_rss_feed`` asks ``PushSubscriber.is_active`` before polling and
+   reads active feeds from the store instead of fetching them.
+
+Spec: https://www.w3.org/TR/websub/
+"""
+
+import hashlib
+import hmac
+import secrets
+import sys
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from tooling.deps import require
+from tooling.feeds import feed_posts, parse_feed
+
+DEFAULT_LEASE_SECONDS = 10 * 24 * 3600
+# Re-subscribe when less than this much of the lease is left
+RENEW_BEFORE_SECONDS = 24 * 3600
+# Re-send a subscription the hub hasn't verified after this long
+VERIFY_TIMEOUT_SECONDS = 3600
+# Wait this long before asking a hub that denied a subscription again
+DENIED_BACKOFF_SECONDS = 7 * 24 * 3600
+CALLBACK_PATH = '/websub/'
+
+
+def subscription_id(feed_url):
+    """Stable, URL-safe id for a feed's callback path."""
+    return hashlib.sha1(feed_url.encode('utf-8')).hexdigest()[:16]
+
+
+def discover_hub(feed_url, feed=None, link_headers=None):
+    """Return (hub_url, topic_url) advertised by a feed, or (None, None).
+
+    ``link_headers`` is ``requests.Response.links``; ``feed`` is a feedparser
+    result. HTTP Link headers take precedence, as the spec recommends.
+    """
+    hub = topic = None
+    if link_headers:
+        hub = (link_headers.get('hub') or {}).get('url')
+        topic = (link_headers.get('self') or {}).get('url')
+
+    if feed is not None:
+        for link in feed.feed.get('links', []):
+            if link.get('rel') == 'hub' and not hub:
+                hub = link.get('href')
+            elif link.get('rel') == 'self' and not topic:
+                topic = link.get('href')
+
+    if not hub:
+        return None, None
+    return hub, topic or feed_url
+
+
+class PushSubscriber:
+    """Subscribes polled feeds to their hubs and answers "is this feed pushed?"."""
+
+    def __init__(self, store, callback_base, lease_seconds=DEFAULT_LEASE_SECONDS,
+                 verify_timeout=VERIFY_TIMEOUT_SECONDS, denied_backoff=DENIED_BACKOFF_SECONDS):
+        self.store = store
+        self.callback_base = callback_base.rstrip('/')
+        self.lease_seconds = lease_seconds
+        self.verify_timeout = verify_timeout
+        self.denied_backoff = denied_backoff
+
+    def callback_url(self, sub_id):
+        return f"{self.callback_base}{CALLBACK_PATH}{sub_id}"
+
+    def is_active(self, feed_url):
+        """True if the hub has verified a subscription for this feed and its lease is live."""
+        subscription = self.store.get_subscription(feed_url)
+        if not subscription or subscription['state'] != 'active':
+            return False
+        now = time.time()
+        if (subscription['lease_expires'] or 0) <= now:
+            return False
+        if self._needs_subscribe(subscription, now):
+            self.subscribe(feed_url, subscription['hub'], subscription['topic'])
+        return True
+
+    def _needs_subscribe(self, subscription, now):
+        """Whether a stored subscription should be (re-)sent to its hub.
+
+        Expired leases always are; leases close to expiry and unverified
+        requests are once ``verify_timeout`` has passed since the last request
+        or verification; denials only after ``denied_backoff``.
+        """
+        age = now - (subscription['updated_at'] or 0)
+        if subscription['state'] == 'denied':
+            return age >= self.denied_backoff
+        if subscription['state'] == 'active':
+            remaining = (subscription['lease_expires'] or 0) - now
+            return remaining <= 0 or (remaining < RENEW_BEFORE_SECONDS and
+                                      age >= self.verify_timeout)
+        return age >= self.verify_timeout
+
+    def recent_posts(self, feed_url, days_back=7, max_entries=15, include_undated=False):
+        """Posts for a pushed feed, read from the item store."""
+        since = datetime.now() - timedelta(days=days_back)
+        return self.store.items_since(feed_url, since, limit=max_entries,
+                                      include_undated=include_undated)
+
+    def observe(self, feed_url, feed, link_headers=None):
+        """Subscribe to a freshly polled feed if it advertises a hub.
+
+        The polled entries are stored too, so the store already holds the
+        feed's current items when reads cut over to it.
+        """
+        hub, topic = discover_hub(feed_url, feed, link_headers)
+        if not hub:
+            return False
+        self.store.add_items(feed_url, feed_posts(feed), origin='poll')
+        subscription = self.store.get_subscription(feed_url)
+        if not subscription or subscription['hub'] != hub or \
+                self._needs_subscribe(subscription, time.time()):
+            return self.subscribe(feed_url, hub, topic)
+        return subscription['state'] != 'denied'
+
+    def subscribe(self, feed_url, hub, topic):
+        """Send a subscription request to a hub. Returns True if the hub accepted it."""
+        requests = require('requests')
+        sub_id = subscription_id(feed_url)
+        existing = self.store.get_subscription(feed_url)
+        data = {
+            'hub.mode': 'subscribe',
+            'hub.topic': topic,
+            'hub.callback': self.callback_url(sub_id),
+            'hub.lease_seconds': str(self.lease_seconds),
+        }
+        # The spec only allows hub.secret over HTTPS; plain-HTTP hubs push unsigned
+        secret = None
+        if urlparse(hub).scheme == 'https':
+            secret = (existing or {}).get('secret') or secrets.token_hex(20)
+            data['hub.secret'] = secret
+        try:
+            response = requests.post(hub, data=data, timeout=10)
+        except requests.exceptions.RequestException as e:
+            print(f"WebSub subscribe to {hub} failed: {e}", file=sys.stderr)
+            return False
+        if response.status_code not in (202, 204):
+            print(f"WebSub hub {hub} rejected {topic} (status {response.status_code})",
+                  file=sys.stderr)
+            return False
+
+        # Keep a live subscription active while its renewal is verified
+        if existing and existing['state'] == 'active' and existing['hub'] == hub and \
+                (existing['lease_expires'] or 0) > time.time():
+            state, lease_expires = 'active', existing['lease_expires']
+        else:
+            state, lease_expires = 'pending', None
+        self.store.save_subscription(feed_url, sub_id, topic, hub, secret, state, lease_expires)
+        return True
+
+
+def valid_signature(secret, body, header):
+    """Check an ``X-Hub-Signature: method=hexdigest`` header against the body."""
+    if not header or '=' not in header:
+        return False
+    method, _, digest = header.partition('=')
+    if method not in ('sha1', 'sha256', 'sha384', 'sha512'):
+        return False
+    expected = hmac.new(secret.encode('utf-8'), body, method).hexdigest()
+    return hmac.compare_digest(expected, digest)
+
+
+def lease_seconds(value):
+    """Parse a hub's ``hub.lease_seconds``: the default if absent, None if malformed."""
+    if not value:
+        return DEFAULT_LEASE_SECONDS
+    try:
+        lease = int(value)
+    except ValueError:
+        return None
+    return lease if lease > 0 else None
+
+
+def make_handler(store, summary_chars=500):
+    """Build a request handler class bound to an ItemStore."""
+
+    class WebSubCallbackHandler(BaseHTTPRequestHandler):
+
+        def _subscription(self):
+            path = urlparse(self.path).path
+            if not path.startswith(CALLBACK_PATH):
+                return None
+            return store.get_subscription_by_id(path[len(CALLBACK_PATH):])
+
+        def _reply(self, status, body=b''):
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/plain')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            """Intent verification (and denial notices) from the hub."""
+            subscription = self._subscription()
+            params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+            mode = params.get('hub.mode')
+            if not subscription or params.get('hub.topic') != subscription['topic']:
+                return self._reply(404)
+
+            if mode == 'denied':
+                store.update_subscription(subscription['sub_id'], 'denied')
+                return self._reply(200)
+            if mode == 'subscribe' and subscription['state'] in ('pending', 'active'):
+                lease = lease_seconds(params.get('hub.lease_seconds'))
+                if lease is None:
+                    return self._reply(400, b'Invalid hub.lease_seconds')
+                store.update_subscription(subscription['sub_id'], 'active', time.time() + lease)
+                return self._reply(200, params.get('hub.challenge', '').encode('utf-8'))
+            # Subscriptions are never cancelled from this side, so unsubscribe
+            # verifications are refused
+            return self._reply(404)
+
+        def do_POST(self):
+            """Content distribution: store the pushed entries."""
+            subscription = self._subscription()
+            body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            if not subscription:
+                return self._reply(410)
+            # Per spec, acknowledge but ignore content with a bad signature
+            if subscription['secret'] and not valid_signature(
+                    subscription['secret'], body, self.headers.get('X-Hub-Signature')):
+                return self._reply(202)
+
+            feed, error = parse_feed(body)
+            if not error:
+                store.add_items(subscription['feed_url'], feed_posts(feed, summary_chars),
+                                origin='push')
+            return self._reply(202)
+
+        def log_message(self, format, *args):
+            print(f"websub: {format % args}", file=sys.stderr)
+
+    return WebSubCallbackHandler
+
+
+def make_server(store, host='127.0.0.1', port=8080):
+    """Create (but don't start) the threaded callback receiver."""
+    return ThreadingHTTPServer((host, port), make_handler(store))
+
+
+def serve(store, host='127.0.0.1', port=8080):
+    """Run the callback receiver until interrupted."""
+    server = make_server(store, host, port)
+    print(f"WebSub callback receiver listening on http://{host}:{server.server_port}{CALLBACK_PATH}",
+          file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()